@@ -0,0 +1,35 @@
+# ruff: noqa
+"""
+ASGI config for Django Unittest Project project.
+
+This module contains the ASGI application served by the uvicorn gunicorn worker,
+see compose/production/django/start. It exposes a module-level variable named
+``application``, alongside the WSGI one of ``config/wsgi.py``: sync views work
+under both, the async views of ``django_unittest_project/async_views.py`` only
+free the worker while they wait on the database under ASGI.
+
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# django_unittest_project directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "django_unittest_project"))
+# We defer to a DJANGO_SETTINGS_MODULE already in the environment.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+# This application object is used by any ASGI server configured to use this file.
+application = get_asgi_application()
+
+# Compile the templates before serving, in the gunicorn master when the application
+# is preloaded so the forked workers share them.
+from django_unittest_project.template_backends import warm_up_templates
+
+if settings.WARM_UP_TEMPLATES:
+    warm_up_templates()
@@ -0,0 +1,6 @@
+"""URL configuration of the batch settings, which serve no view.
+
+See config/settings/batch.py.
+"""
+
+urlpatterns: list = []
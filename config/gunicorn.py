@@ -0,0 +1,52 @@
+"""Gunicorn settings of the production image, see compose/production/django/start.
+
+https://docs.gunicorn.org/en/stable/settings.html
+
+``DJANGO_SERVER_INTERFACE`` selects the application, ``wsgi`` (default) or
+``asgi``. Any setting can still be overridden on the command line or through
+``GUNICORN_CMD_ARGS``, e.g. ``GUNICORN_CMD_ARGS="--workers 3"``.
+"""
+
+import os
+
+ASGI = os.environ.get("DJANGO_SERVER_INTERFACE", "wsgi") == "asgi"
+
+
+def _cpu_count() -> int:
+    # The CPUs this container may run on, rather than the ones of the host
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+wsgi_app = "config.asgi:application" if ASGI else "config.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+chdir = os.environ.get("GUNICORN_CHDIR", "/app")
+
+# Import Django, allauth and every app once in the master, and warm up the
+# templates there (see config/wsgi.py). The forked workers share these pages
+# copy-on-write instead of each importing everything again. Nothing may open a
+# database connection at import time, the workers would inherit its socket.
+preload_app = os.environ.get("GUNICORN_PRELOAD_APP", "1") != "0"
+
+# The event loop of a uvicorn worker serves many requests at once, a sync worker
+# one at a time, hence the classic 2 x CPUs + 1 for the latter
+worker_class = "uvicorn_worker.UvicornWorker" if ASGI else "sync"
+workers = int(
+    os.environ.get("WEB_CONCURRENCY", _cpu_count() if ASGI else _cpu_count() * 2 + 1),
+)
+
+# Recycle the workers to bound the growth of their memory, with a jitter so they
+# do not all restart at the same time
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+# Longer than the idle timeout of the load balancer in front, so it is the one
+# closing idle connections. Sync workers close every connection after a response.
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 75))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+# Heartbeat files on a tmpfs, the container's overlay filesystem can block them
+worker_tmp_dir = "/dev/shm"  # noqa: S108
@@ -94,7 +94,12 @@ MIGRATION_MODULES = {"sites": "django_unittest_project.contrib.sites.migrations"
 # AUTHENTICATION
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#authentication-backends
+# Both cache the user of authenticated requests, see `USER_CACHE_TIMEOUT`
 AUTHENTICATION_BACKENDS = [
+    "django_unittest_project.users.backends.CachedModelBackend",
+    "django_unittest_project.users.backends.CachedAuthenticationBackend",
+    # Still load the users of sessions logged in before the cached backends, which
+    # Django would otherwise log out. Logins succeed on the backends above first.
     "django.contrib.auth.backends.ModelBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
 ]
@@ -129,6 +134,9 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "django_unittest_project.middleware.RequestMetricsMiddleware",
+    # Outside of anything else reading or writing the response body
+    "django_unittest_project.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
@@ -167,7 +175,8 @@ MEDIA_URL = "/media/"
 TEMPLATES = [
     {
         # https://docs.djangoproject.com/en/dev/ref/settings/#std:setting-TEMPLATES-BACKEND
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # Times renders for `RequestMetricsMiddleware`
+        "BACKEND": "django_unittest_project.template_backends.MeteredDjangoTemplates",
         # https://docs.djangoproject.com/en/dev/ref/settings/#dirs
         "DIRS": [str(APPS_DIR / "templates")],
         # https://docs.djangoproject.com/en/dev/ref/settings/#app-dirs
@@ -203,6 +212,9 @@ FIXTURE_DIRS = (str(APPS_DIR / "fixtures"),)
 
 # SECURITY
 # ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#session-engine
+# Read from the cache, written through to the database so sessions outlive it
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 # https://docs.djangoproject.com/en/dev/ref/settings/#session-cookie-httponly
 SESSION_COOKIE_HTTPONLY = True
 # https://docs.djangoproject.com/en/dev/ref/settings/#csrf-cookie-httponly
@@ -281,3 +293,37 @@ SOCIALACCOUNT_FORMS = {"signup": "django_unittest_project.users.forms.UserSocial
 
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Rendered route timetables are invalidated by model signals, the timeout only
+# bounds how long entries of superseded versions linger in the cache.
+ROUTE_DETAIL_CACHE_TIMEOUT = env.int("ROUTE_DETAIL_CACHE_TIMEOUT", default=60 * 60 * 24)
+# Same for the occupancy timeline, invalidated when the assignments change
+OCCUPANCY_TIMELINE_CACHE_TIMEOUT = env.int(
+    "OCCUPANCY_TIMELINE_CACHE_TIMEOUT",
+    default=60 * 60 * 24,
+)
+# Rendered vehicle rows are keyed by the vehicle's `updated_at`, the timeout only
+# bounds how long renders of older versions linger in the cache.
+VEHICLE_ROW_CACHE_TIMEOUT = env.int("VEHICLE_ROW_CACHE_TIMEOUT", default=60 * 60 * 24)
+# Per-view limits checked by `RequestMetricsMiddleware`, by URL name. Each budget
+# may bound "queries", "db_ms", "template_ms" and "total_ms".
+REQUEST_BUDGETS = {
+    "vehicle_list": {"queries": 10},
+    "route_detail": {"queries": 8},
+    "vehicle_maintenance": {"queries": 12},
+    "route_efficiency": {"queries": 8},
+    "occupancy_timeline": {"queries": 8},
+    "async_vehicle_list": {"queries": 10},
+    "async_route_detail": {"queries": 8},
+    "async_vehicle_maintenance": {"queries": 12},
+    "async_route_efficiency": {"queries": 8},
+}
+# Raise instead of logging a warning when a budget is exceeded
+REQUEST_BUDGETS_ENFORCE = env.bool("REQUEST_BUDGETS_ENFORCE", default=False)
+# Compile every template when the WSGI/ASGI application is loaded, see
+# `django_unittest_project.template_backends.warm_up_templates`
+WARM_UP_TEMPLATES = env.bool("DJANGO_WARM_UP_TEMPLATES", default=False)
+# Seconds the user of authenticated requests is cached, it is also dropped when
+# saved, see `django_unittest_project.users.backends`
+USER_CACHE_TIMEOUT = env.int("USER_CACHE_TIMEOUT", default=60 * 5)
+# Smallest HTML or JSON response compressed by `CompressionMiddleware`, in bytes
+COMPRESSION_MIN_SIZE = env.int("DJANGO_COMPRESSION_MIN_SIZE", default=1024)
@@ -0,0 +1,45 @@
+"""
+Settings for the management commands run as batch jobs, e.g. from cron::
+
+    DJANGO_SETTINGS_MODULE=config.settings.batch python manage.py <command>
+
+Same database, cache and logging as production, but only the apps the transport
+models need: the admin, allauth, crispy forms and static files are neither
+imported nor checked at startup. No request is served, so there is no
+middleware and no template engine either.
+"""
+
+from .production import *  # noqa: F403
+
+# APPS
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    # Holds `AUTH_USER_MODEL`
+    "django_unittest_project.users",
+    "django_unittest_project",
+]
+
+# URLS
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#root-urlconf
+# The project's URLs import the admin and allauth views
+ROOT_URLCONF = "config.batch_urls"
+
+# AUTHENTICATION
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#authentication-backends
+AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.ModelBackend"]
+
+# MIDDLEWARE
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#middleware
+MIDDLEWARE: list[str] = []
+
+# TEMPLATES
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#templates
+TEMPLATES: list[dict] = []
+WARM_UP_TEMPLATES = False
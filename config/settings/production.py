@@ -13,7 +13,28 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["unittest.local"])
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+# Connections come from a psycopg pool of each worker and go back to it at the end
+# of every request, see `django_unittest_project.db.postgresql_pool`
+DATABASES["default"]["ENGINE"] = "django_unittest_project.db.postgresql_pool"
+DATABASES["default"]["CONN_MAX_AGE"] = 0
+# Checked as they leave the pool, a connection dropped by the server is replaced
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+    # https://www.psycopg.org/psycopg3/docs/api/pool.html#psycopg_pool.ConnectionPool
+    "min_size": env.int("DJANGO_DB_POOL_MIN_SIZE", default=2),
+    "max_size": env.int("DJANGO_DB_POOL_MAX_SIZE", default=10),
+    # Seconds a request waits for a connection before failing
+    "timeout": env.float("DJANGO_DB_POOL_TIMEOUT", default=10),
+    # Seconds before closing connections above `min_size` left idle
+    "max_idle": env.float("DJANGO_DB_POOL_MAX_IDLE", default=600),
+}
+
+# TEMPLATES
+# ------------------------------------------------------------------------------
+# Django's default loaders already include the cached loader, which keeps compiled
+# templates for the life of the worker. Compile all of them before gunicorn forks
+# the workers.
+WARM_UP_TEMPLATES = env.bool("DJANGO_WARM_UP_TEMPLATES", default=True)
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -99,16 +120,31 @@ STORAGES = {
             "file_overwrite": False,
         },
     },
+    # Stored under names hashed from their content, which templates link through
+    # the manifest: a name never gets other content, browsers can keep it forever
     "staticfiles": {
-        "BACKEND": "storages.backends.s3.S3Storage",
+        "BACKEND": "storages.backends.s3.S3ManifestStaticStorage",
         "OPTIONS": {
             "location": "static",
             "default_acl": "public-read",
+            "object_parameters": {
+                "CacheControl": "max-age=31536000, public, immutable",
+            },
         },
     },
 }
+# Text files are uploaded gzipped with a `Content-Encoding`, S3 cannot compress
+# them when serving. Also read by Collectfasta to compare hashes.
+AWS_IS_GZIPPED = True
+GZIP_CONTENT_TYPES = (
+    "text/css",
+    "text/javascript",
+    "application/javascript",
+    "image/svg+xml",
+    "image/vnd.microsoft.icon",
+)
 MEDIA_URL = f"https://{aws_s3_domain}/media/"
-COLLECTFASTA_STRATEGY = "collectfasta.strategies.boto3.Boto3Strategy"
+COLLECTFASTA_STRATEGY = "collectfasta.strategies.boto3.Boto3ManifestMemoryStrategy"
 STATIC_URL = f"https://{aws_s3_domain}/static/"
 
 # EMAIL
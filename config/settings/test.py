@@ -36,3 +36,5 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 MEDIA_URL = "http://media.testserver"
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Fail the tests of any view going over its `REQUEST_BUDGETS`
+REQUEST_BUDGETS_ENFORCE = True
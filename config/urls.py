@@ -6,6 +6,7 @@ from django.urls import include
 from django.urls import path
 from django.views import defaults as default_views
 from django.views.generic import TemplateView
+import django_unittest_project.async_views
 import django_unittest_project.views
 
 urlpatterns = [
@@ -23,7 +24,18 @@ urlpatterns = [
     path("transport/vehicles", django_unittest_project.views.VehicleListView.as_view(), name="vehicle_list"),
     path("transport/route_detail/<int:route_number>", django_unittest_project.views.RouteDetailView.as_view(), name="route_detail"),
     path("transport/vehicle_maintenance/<int:vehicle_id>", django_unittest_project.views.VehicleMaintenanceView.as_view(), name="vehicle_maintenance"),
+    path("transport/vehicle_maintenance/bulk", django_unittest_project.views.VehicleMaintenanceBulkView.as_view(), name="vehicle_maintenance_bulk"),
+    path("transport/maintenance_log/<int:pk>/description", django_unittest_project.views.MaintenanceLogDescriptionView.as_view(), name="maintenance_log_description"),
     path("transport/route_efficiency", django_unittest_project.views.RouteEfficiencyView.as_view(), name="route_efficiency"),
+    path("transport/async/vehicles", django_unittest_project.async_views.AsyncVehicleListView.as_view(), name="async_vehicle_list"),
+    path("transport/async/route_detail/<int:route_number>", django_unittest_project.async_views.AsyncRouteDetailView.as_view(), name="async_route_detail"),
+    path("transport/async/vehicle_maintenance/<int:vehicle_id>", django_unittest_project.async_views.AsyncVehicleMaintenanceView.as_view(), name="async_vehicle_maintenance"),
+    path("transport/async/route_efficiency", django_unittest_project.async_views.AsyncRouteEfficiencyView.as_view(), name="async_route_efficiency"),
+    path("transport/api/vehicles", django_unittest_project.views.VehicleExportView.as_view(), name="vehicle_export"),
+    path("transport/api/routes", django_unittest_project.views.RouteExportView.as_view(), name="route_export"),
+    path("transport/api/route_assignments", django_unittest_project.views.RouteAssignmentExportView.as_view(), name="route_assignment_export"),
+    path("transport/api/schedule_conflicts", django_unittest_project.views.ScheduleConflictsView.as_view(), name="schedule_conflicts"),
+    path("transport/api/occupancy_timeline", django_unittest_project.views.OccupancyTimelineView.as_view(), name="occupancy_timeline"),
     # Media files
     *static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT),
 ]
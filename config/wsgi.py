@@ -19,6 +19,7 @@ import os
 import sys
 from pathlib import Path
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 # This allows easy placement of apps within the interior
@@ -35,6 +36,13 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 # file. This includes Django's development server, if the WSGI_APPLICATION
 # setting points here.
 application = get_wsgi_application()
+
+# Compile the templates before serving, in the gunicorn master when the application
+# is preloaded so the forked workers share them.
+from django_unittest_project.template_backends import warm_up_templates
+
+if settings.WARM_UP_TEMPLATES:
+    warm_up_templates()
 # Apply WSGI middleware here.
 # from helloworld.wsgi import HelloWorldApplication
 # application = HelloWorldApplication(application)
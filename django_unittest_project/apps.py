@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class DjangoUnittestProjectConfig(AppConfig):
+    name = "django_unittest_project"
+
+    def ready(self):
+        import django_unittest_project.signals  # noqa: F401
@@ -0,0 +1,178 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.db import models
+from django.db import transaction
+from django.http import Http404
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response
+from django.utils.cache import quote_etag
+from django.utils.decorators import method_decorator
+from django.views import View
+
+from .caching import ROUTE_DETAIL
+from .caching import VEHICLES
+from .caching import aget_version
+from .caching import arender_fragments
+from .caching import aroute_detail_key
+from .caching import has_pending_messages
+from .caching import page_etag
+from .caching import vehicle_row_key
+from .models import MaintenanceLog
+from .models import Route
+from .models import Vehicle
+from .pagination import KeysetPaginator
+from .pagination import aestimate_count
+from .pagination import get_page_size
+from .reports import RouteEfficiencyReport
+
+
+async def aget_object_or_404(model: type[models.Model], **kwargs) -> models.Model:
+    try:
+        return await model.objects.aget(**kwargs)
+    except model.DoesNotExist as e:
+        msg = f"No {model._meta.object_name} matches the given query."  # noqa: SLF001
+        raise Http404(msg) from e
+
+
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    """`LoginRequiredMixin` for views whose handlers are coroutines.
+
+    Django 4.2 has no `request.auser()`, so the session user is loaded in a worker
+    thread before the handler runs; templates then read it without querying.
+    `ATOMIC_REQUESTS` cannot wrap async views, which opt out of it.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        if not await sync_to_async(lambda: request.user.is_authenticated)():
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncConditionalGetMixin:
+    """`ConditionalGetMixin` for views whose handlers are coroutines.
+
+    `aget_etag` is a coroutine too, which Django 4.2's `condition` cannot await.
+    """
+
+    async def aget_etag(self, request, *args, **kwargs) -> str | None:
+        """Overridden like `ConditionalGetMixin.get_etag`, `None` skips validation."""
+        return None
+
+    async def dispatch(self, request, *args, **kwargs):
+        # The messages may be stored in the session, loaded synchronously
+        if request.method not in ("GET", "HEAD") or await sync_to_async(
+            has_pending_messages,
+        )(request):
+            return await super().dispatch(request, *args, **kwargs)
+        etag = await self.aget_etag(request, *args, **kwargs)
+        if etag is None:
+            return await super().dispatch(request, *args, **kwargs)
+        etag = quote_etag(etag)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = await super().dispatch(request, *args, **kwargs)
+        response.headers.setdefault("ETag", etag)
+        return response
+
+
+class AsyncVehicleListView(AsyncLoginRequiredMixin, AsyncConditionalGetMixin, View):
+    page_size = 50
+    max_page_size = 500
+
+    async def aget_etag(self, request):
+        return page_etag(request, await aget_version(VEHICLES))
+
+    async def get(self, request):
+        paginator = KeysetPaginator(
+            Vehicle.objects.all(),
+            ordering=["id"],
+            page_size=get_page_size(request, self.page_size, self.max_page_size),
+        )
+        page = await paginator.aget_page(request.GET.get("cursor"))
+        vehicle_rows = await arender_fragments(
+            "vehicle_row_fragment.html",
+            "vehicle",
+            page.object_list,
+            [vehicle_row_key(vehicle) for vehicle in page.object_list],
+            settings.VEHICLE_ROW_CACHE_TIMEOUT,
+        )
+        return render(
+            request,
+            "vehicle_list.html",
+            {
+                "vehicles": page.object_list,
+                "vehicle_rows": vehicle_rows,
+                "page": page,
+                "vehicle_count": await aestimate_count(Vehicle.objects.all()),
+            },
+        )
+
+
+class AsyncRouteDetailView(AsyncLoginRequiredMixin, AsyncConditionalGetMixin, View):
+    async def aget_etag(self, request, route_number):
+        return page_etag(request, await aget_version(ROUTE_DETAIL))
+
+    async def get(self, request, route_number):
+        cache_key = await aroute_detail_key(route_number)
+        route_detail = await cache.aget(cache_key)
+        if route_detail is None:
+            route = await aget_object_or_404(Route, route_number=route_number)
+            assignments = [
+                assignment async for assignment in route.routeassignment_set.timetable()
+            ]
+            route_detail = render_to_string(
+                "route_detail_fragment.html",
+                {"route": route, "assignments": assignments},
+            )
+            await cache.aset(
+                cache_key,
+                route_detail,
+                settings.ROUTE_DETAIL_CACHE_TIMEOUT,
+            )
+        return render(request, "route_detail.html", {"route_detail": route_detail})
+
+
+class AsyncVehicleMaintenanceView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    View,
+):
+    page_size = 50
+    max_page_size = 500
+
+    async def aget_etag(self, request, vehicle_id):
+        updated_at = (
+            await Vehicle.objects.filter(vehicle_id=vehicle_id)
+            .values_list("updated_at", flat=True)
+            .afirst()
+        )
+        return None if updated_at is None else page_etag(request, updated_at)
+
+    async def get(self, request, vehicle_id):
+        vehicle = await aget_object_or_404(Vehicle, vehicle_id=vehicle_id)
+        paginator = KeysetPaginator(
+            MaintenanceLog.objects.filter(vehicle=vehicle).defer("description"),
+            ordering=["-maintenance_date", "-id"],
+            page_size=get_page_size(request, self.page_size, self.max_page_size),
+        )
+        page = await paginator.aget_page(request.GET.get("cursor"))
+        return render(
+            request,
+            "vehicle_maintenance.html",
+            {
+                "vehicle": vehicle,
+                "logs": page.object_list,
+                "page": page,
+                "total_cost": vehicle.maintenance_cost_total,
+            },
+        )
+
+
+class AsyncRouteEfficiencyView(AsyncLoginRequiredMixin, View):
+    async def get(self, request):
+        route_data = [row async for row in RouteEfficiencyReport()]
+        return render(request, "route_efficiency.html", {"route_data": route_data})
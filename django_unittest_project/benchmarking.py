@@ -0,0 +1,76 @@
+import json
+import math
+import subprocess
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+def percentile(samples: "Sequence[float]", pct: float) -> float:
+    """Nearest-rank percentile of `samples`, `pct` being between 0 and 100."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def time_calls(func: "Callable[[], object]", repeat: int) -> list[float]:
+    """Call `func` `repeat` times and return each call's duration in milliseconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def git_revision() -> str:
+    try:
+        process = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return process.stdout.strip()
+
+
+def record_results(path: "Path", results: "Iterable[dict[str, Any]]") -> None:
+    """Append `results` to the JSON lines file at `path`, tagged with the commit."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tags = {"commit": git_revision(), "recorded_at": timezone.now()}
+    with path.open("a") as file:
+        for result in results:
+            file.write(json.dumps(tags | result, cls=DjangoJSONEncoder) + "\n")
+
+
+def previous_results(
+    path: "Path",
+    key: "Sequence[str]" = ("case", "size"),
+) -> dict[tuple[Any, ...], dict[str, Any]]:
+    """The latest results recorded at another commit, by the values of `key`.
+
+    Used to compare a run against the last one of a different commit.
+    """
+    if not path.exists():
+        return {}
+    commit = git_revision()
+    previous = {}
+    with path.open() as file:
+        for line in file:
+            result = json.loads(line)
+            if result["commit"] != commit:
+                previous[tuple(result[field] for field in key)] = result
+    return previous
@@ -0,0 +1,163 @@
+import functools
+import hashlib
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils.safestring import SafeString
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.http import HttpRequest
+
+    from .models import Vehicle
+
+ROUTE_DETAIL = "route_detail"
+ROUTE_ASSIGNMENTS = "route_assignments"
+VEHICLES = "vehicles"
+
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+def get_version(namespace: str) -> int:
+    """Return the current version of a cache namespace.
+
+    Cached entries embed this version in their keys, so bumping it invalidates the
+    whole namespace at once. A missing counter is seeded from the clock rather than
+    from 1, so an evicted counter can never resurrect entries of an older version.
+    """
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key, 0)
+    return version
+
+
+async def aget_version(namespace: str) -> int:
+    key = _version_key(namespace)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key, 0)
+    return version
+
+
+def bump_version(namespace: str) -> None:
+    """Invalidate a cache namespace once the current transaction commits.
+
+    Bumping earlier would let a concurrent request cache, and validate its ETag
+    against, the rows as they were before the commit under the new version. Outside
+    a transaction the version is bumped right away.
+    """
+    transaction.on_commit(functools.partial(_incr_version, namespace))
+
+
+def _incr_version(namespace: str) -> None:
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def page_etag(request: "HttpRequest", *parts: Any) -> str:
+    """Return a strong ETag of a page showing `parts`, e.g. namespace versions.
+
+    Pages greet the user and are localized, so the user and the language are part
+    of it along `parts`.
+    """
+    validator = ":".join(map(str, (request.user.pk, get_language(), *parts)))
+    return hashlib.blake2b(validator.encode(), digest_size=16).hexdigest()
+
+
+def has_pending_messages(request: "HttpRequest") -> bool:
+    """Whether the next page renders `django.contrib.messages`, see `base.html`.
+
+    ETags do not cover them: a `304` would leave them queued for a later page.
+    Counting them does not mark them as shown.
+    """
+    return len(get_messages(request)) > 0
+
+
+def route_detail_key(route_number: str) -> str:
+    return f"{ROUTE_DETAIL}:{get_version(ROUTE_DETAIL)}:{route_number}"
+
+
+async def aroute_detail_key(route_number: str) -> str:
+    return f"{ROUTE_DETAIL}:{await aget_version(ROUTE_DETAIL)}:{route_number}"
+
+
+def occupancy_timeline_key() -> str:
+    return f"occupancy_timeline:{get_version(ROUTE_ASSIGNMENTS)}"
+
+
+def vehicle_row_key(vehicle: "Vehicle") -> str:
+    # Rows are localized, so the language is part of the key along the version
+    return (
+        f"vehicle_row:{get_language()}:{vehicle.pk}:"
+        f"{vehicle.updated_at.timestamp():.6f}"
+    )
+
+
+def render_fragments(
+    template_name: str,
+    context_name: str,
+    objs: "Sequence[Any]",
+    keys: "Sequence[str]",
+    timeout: int,
+) -> list[SafeString]:
+    """Render `template_name` once per object, reusing the cached renders.
+
+    The object is passed to the template as `context_name` and its render cached
+    under the matching entry of `keys`, which must change along with anything the
+    template shows. All lookups go through one `get_many` and all misses are stored
+    with one `set_many`.
+    """
+    fragments = cache.get_many(keys)
+    missing = _render_missing(template_name, context_name, objs, keys, fragments)
+    if missing:
+        cache.set_many(missing, timeout)
+    return _in_order(keys, fragments | missing)
+
+
+async def arender_fragments(
+    template_name: str,
+    context_name: str,
+    objs: "Sequence[Any]",
+    keys: "Sequence[str]",
+    timeout: int,
+) -> list[SafeString]:
+    fragments = await cache.aget_many(keys)
+    missing = _render_missing(template_name, context_name, objs, keys, fragments)
+    if missing:
+        await cache.aset_many(missing, timeout)
+    return _in_order(keys, fragments | missing)
+
+
+def _render_missing(
+    template_name: str,
+    context_name: str,
+    objs: "Sequence[Any]",
+    keys: "Sequence[str]",
+    fragments: dict[str, str],
+) -> dict[str, str]:
+    return {
+        key: render_to_string(template_name, {context_name: obj})
+        for obj, key in zip(objs, keys, strict=True)
+        if key not in fragments
+    }
+
+
+def _in_order(keys: "Sequence[str]", fragments: dict[str, str]) -> list[SafeString]:
+    # Only ever our own template renders, which are escaped already
+    return [mark_safe(fragments[key]) for key in keys]  # noqa: S308
@@ -0,0 +1,112 @@
+import os
+import threading
+from typing import Any
+from typing import ClassVar
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+
+from django_unittest_project.metrics import timing
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError as e:
+    msg = "Error loading psycopg_pool module, install psycopg[pool]."
+    raise ImproperlyConfigured(msg) from e
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """The PostgreSQL backend, taking its connections from a psycopg pool.
+
+    `OPTIONS["pool"]` holds the arguments of `psycopg_pool.ConnectionPool`, e.g.
+    `{"min_size": 2, "max_size": 10, "timeout": 10}`. Closing a connection returns
+    it to the pool, so `CONN_MAX_AGE` must be 0: Django then gives the connection
+    back at the end of every request and the next one of this process reuses it.
+    `CONN_HEALTH_CHECKS` checks each connection as it leaves the pool instead.
+
+    There is one pool per alias and process, opened on the first connection so
+    gunicorn workers forked from a preloaded master never share one. The time spent
+    waiting for a connection goes to `RequestMetrics.pool_wait_ms`.
+    """
+
+    _pools: ClassVar[dict[tuple[int, str], ConnectionPool]] = {}
+    _pools_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ConnectionPool | None:
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        if self.alias == NO_DB_ALIAS or not pool_options:
+            return None
+        key = (os.getpid(), self.alias)
+        with self._pools_lock:
+            if key not in self._pools:
+                self._pools[key] = self.__create_pool(pool_options)
+        return self._pools[key]
+
+    def pool_stats(self) -> dict[str, int]:
+        """Counters of the pool, see `ConnectionPool.get_stats`."""
+        return self.pool.get_stats() if self.pool else {}
+
+    def close_pool(self) -> None:
+        pool = self._pools.pop((os.getpid(), self.alias), None)
+        if pool is not None:
+            pool.close()
+
+    def get_connection_params(self) -> dict[str, Any]:
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params: dict[str, Any]) -> Any:
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        # What the base class sets before connecting, the pool connects instead
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = base.IsolationLevel(
+                base.IsolationLevel.READ_COMMITTED
+                if isolation_level is None
+                else isolation_level,
+            )
+        except ValueError as e:
+            msg = (
+                f"Invalid transaction isolation level {isolation_level} specified. "
+                "Use one of the psycopg.IsolationLevel values."
+            )
+            raise ImproperlyConfigured(msg) from e
+        with timing("pool_wait_ms"):
+            connection = pool.getconn()
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self) -> None:
+        pool = self.pool
+        if self.connection is None or pool is None:
+            super()._close()
+            return
+        with self.wrap_database_errors:
+            # The pool rolls back any transaction left open before reusing it
+            pool.putconn(self.connection)
+            self.connection = None
+
+    def __create_pool(self, pool_options: dict[str, Any] | bool) -> ConnectionPool:
+        if self.settings_dict["CONN_MAX_AGE"] != 0:
+            msg = "Connection pooling requires CONN_MAX_AGE = 0."
+            raise ImproperlyConfigured(msg)
+        conn_params = self.get_connection_params()
+        # Django switches autocommit on and off itself once connected
+        conn_params["autocommit"] = True
+        return ConnectionPool(
+            kwargs=conn_params,
+            check=(
+                ConnectionPool.check_connection
+                if self.settings_dict["CONN_HEALTH_CHECKS"]
+                else None
+            ),
+            open=True,
+            **({} if pool_options is True else pool_options),
+        )
@@ -0,0 +1,239 @@
+# ruff: noqa: S311
+import dataclasses as dc
+import datetime as dt
+import random as rd
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db import models
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import ROUTE_ASSIGNMENTS
+from .caching import ROUTE_DETAIL
+from .caching import VEHICLES
+from .caching import bump_version
+from .models import CAPACITY_RULES
+from .models import MaintenanceLog
+from .models import Route
+from .models import RouteAssignment
+from .models import RouteEfficiency
+from .models import Vehicle
+from .transfer import chunked
+from .transfer import copy_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+# Small fixed vocabularies: enough for realistic row widths without depending on
+# Faker outside of the tests.
+WORDS = (
+    "airport", "bridge", "campus", "central", "depot", "docks", "garden", "harbor",
+    "hill", "junction", "lake", "market", "museum", "north", "park", "plaza",
+    "river", "south", "square", "stadium", "station", "tower", "valley", "west",
+)  # fmt: skip
+FIRST_NAMES = (
+    "Alex", "Ana", "Chris", "Dana", "Eli", "Grace", "Ivan", "Jordan", "Kim", "Lee",
+    "Maria", "Noah", "Omar", "Priya", "Sam", "Tomas", "Yara", "Zoe",
+)  # fmt: skip
+LAST_NAMES = (
+    "Brown", "Costa", "Garcia", "Ito", "Jones", "Kowalski", "Martin", "Nguyen",
+    "Okafor", "Patel", "Rossi", "Silva", "Smith", "Weber",
+)  # fmt: skip
+
+
+def random_vehicle_id() -> int:
+    return rd.randint(0, 999999999)
+
+
+def random_vehicle_type() -> str:
+    return rd.choice(["BUS", "TRAM", "SUBWAY"])
+
+
+def random_capacity(vehicle_type: str) -> int:
+    rule = CAPACITY_RULES.get(vehicle_type)
+    return rd.randint(0, 500 if rule is None else rule.max_capacity)
+
+
+def random_last_maintenance() -> dt.date:
+    return timezone.localdate() - dt.timedelta(rd.randint(0, 30))
+
+
+def random_route_number() -> int:
+    return rd.randint(0, 999999999)
+
+
+def random_start_time() -> dt.time:
+    return dt.time(rd.randint(0, 12), rd.randint(0, 59))
+
+
+def random_end_time(start_time: dt.time) -> dt.time:
+    return dt.time(rd.randint(start_time.hour + 1, 23), rd.randint(0, 59))
+
+
+def random_cost() -> Decimal:
+    return Decimal(rd.randint(1, 99999)).scaleb(-2)
+
+
+def random_driver_name() -> str:
+    return f"{rd.choice(FIRST_NAMES)} {rd.choice(LAST_NAMES)}"
+
+
+def random_sentence() -> str:
+    return " ".join(rd.choices(WORDS, k=rd.randint(4, 10))).capitalize() + "."
+
+
+@dc.dataclass(frozen=True)
+class FleetSize:
+    vehicles: int
+    routes: int
+    assignments: int
+    maintenance_logs: int
+
+    @classmethod
+    def scaled(cls, vehicles: int) -> "FleetSize":
+        """A fleet of `vehicles` vehicles, with the other tables in proportion."""
+        return cls(
+            vehicles=vehicles,
+            routes=max(1, vehicles // 10),
+            assignments=vehicles * 3,
+            maintenance_logs=vehicles * 5,
+        )
+
+
+def generate_fleet(size: FleetSize, batch_size: int = 5000) -> None:
+    """Insert a synthetic fleet drawn from the same distributions as the factories.
+
+    Vehicles and routes are inserted with `bulk_create` to get their pks back; the
+    assignments and maintenance logs are streamed with `COPY` on PostgreSQL and
+    `bulk_create` elsewhere, so memory stays bounded by `batch_size`. Bulk inserts
+    bypass the signals, so the route rollups and the maintenance totals of the new
+    rows are recomputed at the end.
+    """
+    with transaction.atomic():
+        vehicle_pks = _bulk_create(
+            Vehicle,
+            (
+                _vehicle(vehicle_id)
+                for vehicle_id in _unique_ids(
+                    Vehicle,
+                    "vehicle_id",
+                    random_vehicle_id,
+                    size.vehicles,
+                )
+            ),
+            batch_size,
+        )
+        route_pks = _bulk_create(
+            Route,
+            (
+                Route(
+                    route_number=route_number,
+                    start_point=rd.choice(WORDS),
+                    end_point=rd.choice(WORDS),
+                )
+                for route_number in _unique_ids(
+                    Route,
+                    "route_number",
+                    random_route_number,
+                    size.routes,
+                )
+            ),
+            batch_size,
+        )
+        if vehicle_pks and route_pks:
+            copy_rows(
+                RouteAssignment,
+                ("vehicle_id", "route_id", "driver_name", "start_time", "end_time"),
+                _assignments(vehicle_pks, route_pks, size.assignments),
+                batch_size,
+            )
+        if vehicle_pks:
+            copy_rows(
+                MaintenanceLog,
+                ("vehicle_id", "maintenance_date", "description", "cost"),
+                (
+                    (
+                        rd.choice(vehicle_pks),
+                        random_last_maintenance(),
+                        random_sentence(),
+                        random_cost(),
+                    )
+                    for _ in range(size.maintenance_logs)
+                ),
+                batch_size,
+            )
+
+        for chunk in chunked(route_pks, 500):
+            RouteEfficiency.objects.refresh(chunk)
+        for chunk in chunked(vehicle_pks, 500):
+            Vehicle.objects.filter(pk__in=chunk).reconcile_maintenance_totals()
+
+    bump_version(ROUTE_DETAIL)
+    bump_version(ROUTE_ASSIGNMENTS)
+    bump_version(VEHICLES)
+
+
+def _vehicle(vehicle_id: str) -> Vehicle:
+    vehicle_type = random_vehicle_type()
+    return Vehicle(
+        vehicle_id=vehicle_id,
+        type=vehicle_type,
+        capacity=random_capacity(vehicle_type),
+        last_maintenance=random_last_maintenance(),
+    )
+
+
+def _unique_ids(
+    model: type[models.Model],
+    field: str,
+    generate: "Callable[[], int]",
+    count: int,
+) -> "Iterator[str]":
+    taken = set(model.objects.values_list(field, flat=True).iterator())
+    while count > 0:
+        value = str(generate())
+        if value not in taken:
+            taken.add(value)
+            count -= 1
+            yield value
+
+
+def _assignments(
+    vehicle_pks: "Sequence[int]",
+    route_pks: "Sequence[int]",
+    count: int,
+) -> "Iterator[tuple[Any, ...]]":
+    # Spread evenly over the vehicles so the `(vehicle, start_time, end_time)`
+    # uniqueness only has to be checked among the slots of one vehicle at a time
+    per_vehicle, extra = divmod(count, len(vehicle_pks))
+    for index, vehicle_pk in enumerate(vehicle_pks):
+        slots: set[tuple[dt.time, dt.time]] = set()
+        while len(slots) < per_vehicle + (index < extra):
+            start_time = random_start_time()
+            end_time = random_end_time(start_time)
+            if (start_time, end_time) in slots:
+                continue
+            slots.add((start_time, end_time))
+            yield (
+                vehicle_pk,
+                rd.choice(route_pks),
+                random_driver_name(),
+                start_time,
+                end_time,
+            )
+
+
+def _bulk_create(
+    model: type[models.Model],
+    objs: "Iterable[models.Model]",
+    batch_size: int,
+) -> list[int]:
+    pks = []
+    for chunk in chunked(objs, batch_size):
+        pks.extend(obj.pk for obj in model.objects.bulk_create(chunk))
+    return pks
@@ -0,0 +1,215 @@
+import dataclasses as dc
+import datetime as dt
+import itertools
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+from django.db import connection
+from django.db import transaction
+
+from .caching import ROUTE_ASSIGNMENTS
+from .caching import ROUTE_DETAIL
+from .caching import VEHICLES
+from .caching import bump_version
+from .maintenance import IngestResult
+from .models import CAPACITY_RULES
+from .models import RouteAssignment
+from .models import RouteEfficiency
+from .models import Vehicle
+
+VEHICLE_FIELDS = ("vehicle_id", "type", "capacity", "last_maintenance")
+VEHICLE_TYPES = tuple(vehicle_type for vehicle_type, _ in Vehicle.TYPES)
+# Written by the upserts, the maintenance totals are left to the logs
+UPSERT_FIELDS = ("type", "capacity", "last_maintenance", "updated_at")
+
+
+@dc.dataclass
+class ImportResult(IngestResult):
+    updated: int = 0
+
+
+def validate_vehicles(
+    vehicle_ids: "Sequence[str]",
+    types: "Sequence[str]",
+    capacities: "Sequence[int]",
+) -> np.ndarray:
+    """Return the error of each vehicle, or `""` when it is valid.
+
+    Checks what `full_clean` would, including the `CAPACITY_RULES` of
+    `Vehicle.clean`, with one comparison over the whole batch per check instead of
+    one `full_clean` per vehicle. A `vehicle_id` repeated in the batch is an error
+    after its first valid occurrence. Only the first failing check is reported.
+    """
+    vehicle_ids = np.asarray(vehicle_ids, dtype=str)
+    types = np.asarray(types, dtype=str)
+    capacities = np.asarray(capacities, dtype=np.int64)
+    errors = np.full(len(vehicle_ids), "", dtype=object)
+
+    def flag(invalid: np.ndarray, message: str, values: np.ndarray | None = None):
+        invalid &= errors == ""
+        errors[invalid] = (
+            message
+            if values is None
+            else [message.format(value) for value in values[invalid]]
+        )
+
+    id_lengths = np.char.str_len(vehicle_ids)
+    max_length = Vehicle._meta.get_field("vehicle_id").max_length  # noqa: SLF001
+    flag(
+        (id_lengths == 0) | (id_lengths > max_length),
+        "Invalid vehicle_id: '{}'",
+        vehicle_ids,
+    )
+    flag(~np.isin(types, VEHICLE_TYPES), "Invalid type: '{}'", types)
+    # Either bound is None when the database does not enforce it
+    min_capacity, max_capacity = connection.ops.integer_field_range(
+        "PositiveIntegerField",
+    )
+    flag(
+        (capacities < (0 if min_capacity is None else min_capacity))
+        | (
+            capacities
+            > (np.iinfo(np.int64).max if max_capacity is None else max_capacity)
+        ),
+        "Invalid capacity: '{}'",
+        capacities,
+    )
+    for vehicle_type, rule in CAPACITY_RULES.items():
+        flag((types == vehicle_type) & (capacities > rule.max_capacity), rule.message)
+
+    valid = np.flatnonzero(errors == "")
+    _, first_occurrences = np.unique(vehicle_ids[valid], return_index=True)
+    duplicate = np.zeros(len(vehicle_ids), dtype=bool)
+    duplicate[valid] = True
+    duplicate[valid[first_occurrences]] = False
+    flag(duplicate, "Duplicate vehicle_id: '{}'", vehicle_ids)
+    return errors
+
+
+def import_vehicles(rows: "Iterable[Any]", batch_size: int = 5000) -> ImportResult:
+    """Validate and upsert any number of vehicles by `vehicle_id`.
+
+    `rows` is consumed in batches of `batch_size`, so it can be a lazy stream. Each
+    batch is parsed row by row, checked column-wise by `validate_vehicles` and
+    written by one `bulk_create(update_conflicts=True)`; invalid rows are reported
+    by their position in `rows` and skipped without aborting the rest. Upserts send
+    no signal, so the rollups of the routes whose vehicles changed capacity are
+    refreshed and the cache versions bumped at the end.
+    """
+    result = ImportResult()
+    numbered_rows = enumerate(rows)
+    # Routes of the vehicles whose capacity changed
+    route_ids: set[int] = set()
+
+    with transaction.atomic():
+        while batch := list(itertools.islice(numbered_rows, batch_size)):
+            indexes, vehicles = _parse_vehicles(batch, result)
+            errors = validate_vehicles(
+                [vehicle.vehicle_id for vehicle in vehicles],
+                [vehicle.type for vehicle in vehicles],
+                [vehicle.capacity for vehicle in vehicles],
+            )
+            for position in np.flatnonzero(errors != ""):
+                result.add_error(indexes[position], errors[position])
+            vehicles = [vehicles[position] for position in np.flatnonzero(errors == "")]
+            route_ids.update(_upsert_vehicles(vehicles, result))
+
+        route_ids_iter = iter(sorted(route_ids))
+        while chunk := list(itertools.islice(route_ids_iter, 500)):
+            RouteEfficiency.objects.refresh(chunk)
+
+    if result.created or result.updated:
+        bump_version(VEHICLES)
+        bump_version(ROUTE_DETAIL)
+    if route_ids:
+        bump_version(ROUTE_ASSIGNMENTS)
+    result.errors.sort(key=itemgetter("index"))
+    return result
+
+
+def _parse_vehicles(
+    batch: "list[tuple[int, Any]]",
+    result: ImportResult,
+) -> tuple[list[int], list[Vehicle]]:
+    indexes = []
+    vehicles = []
+    for index, row in batch:
+        if not isinstance(row, Mapping):
+            result.add_error(index, "Invalid row")
+            continue
+        missing = [field for field in VEHICLE_FIELDS if field not in row]
+        if missing:
+            result.add_error(index, f"Missing required field: '{missing[0]}'")
+            continue
+        try:
+            capacity = int(row["capacity"])
+        except (TypeError, ValueError):
+            capacity = None
+        if capacity is None or not -(2**63) <= capacity < 2**63:
+            result.add_error(index, f"Invalid capacity: '{row['capacity']}'")
+            continue
+        try:
+            last_maintenance = _parse_date(row["last_maintenance"])
+        except (TypeError, ValueError):
+            result.add_error(
+                index,
+                f"Invalid last_maintenance: '{row['last_maintenance']}'",
+            )
+            continue
+
+        indexes.append(index)
+        vehicles.append(
+            Vehicle(
+                vehicle_id=str(row["vehicle_id"]),
+                type=row["type"],
+                capacity=capacity,
+                last_maintenance=last_maintenance,
+            ),
+        )
+    return indexes, vehicles
+
+
+def _parse_date(value: Any) -> dt.date:
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    return dt.date.fromisoformat(value)
+
+
+def _upsert_vehicles(vehicles: list[Vehicle], result: ImportResult) -> set[int]:
+    """Write `vehicles` and return the routes of those whose capacity changed."""
+    if not vehicles:
+        return set()
+    previous_capacities = dict(
+        Vehicle.objects.filter(
+            vehicle_id__in=[vehicle.vehicle_id for vehicle in vehicles],
+        ).values_list("vehicle_id", "capacity"),
+    )
+    Vehicle.objects.bulk_create(
+        vehicles,
+        update_conflicts=True,
+        unique_fields=["vehicle_id"],
+        update_fields=UPSERT_FIELDS,
+    )
+    result.updated += len(previous_capacities)
+    result.created += len(vehicles) - len(previous_capacities)
+
+    resized = [
+        vehicle.vehicle_id
+        for vehicle in vehicles
+        if previous_capacities.get(vehicle.vehicle_id, vehicle.capacity)
+        != vehicle.capacity
+    ]
+    if not resized:
+        return set()
+    return set(
+        RouteAssignment.objects.filter(vehicle__vehicle_id__in=resized).values_list(
+            "route_id",
+            flat=True,
+        ),
+    )
@@ -0,0 +1,236 @@
+import dataclasses as dc
+import itertools
+import json
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import DecimalField
+from django.db.models import F
+from django.db.models import Max
+from django.db.models import OuterRef
+from django.db.models import PositiveIntegerField
+from django.db.models import Subquery
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.functions import Now
+
+from .caching import VEHICLES
+from .caching import bump_version
+from .models import MaintenanceLog
+from .models import Vehicle
+
+REQUIRED_FIELDS = ("vehicle_id", "maintenance_date", "description", "cost")
+# A row that keeps its position in `rows`, so the errors after it keep their index,
+# but is neither ingested nor reported
+SKIPPED_ROW = object()
+# The whitespace JSON allows between tokens
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# What can still follow a number cut short by the end of a chunk
+JSON_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+
+
+class NotJSONArrayError(ValueError):
+    pass
+
+
+@dc.dataclass
+class IngestResult:
+    created: int = 0
+    errors: list[dict[str, Any]] = dc.field(default_factory=list)
+
+    def add_error(self, index: int, error: str) -> None:
+        self.errors.append({"index": index, "error": error})
+
+
+def ingest_maintenance_logs(
+    rows: "Iterable[Any]",
+    batch_size: int = 1000,
+) -> IngestResult:
+    """Validate and insert maintenance logs for any number of vehicles.
+
+    `rows` is consumed in batches of `batch_size`, so it can be a lazy stream. Each
+    batch resolves its vehicles with one query and is inserted with `bulk_create`;
+    invalid rows are reported by their position in `rows` and skipped without
+    aborting the rest. Finally every touched vehicle gets its `last_maintenance` set
+    to the latest of its logs and its maintenance totals incremented, by one
+    set-based `UPDATE` per 500 vehicles.
+    """
+    result = IngestResult()
+    # vehicle pk -> [cost, log count] added by this ingest
+    totals: dict[int, list[Any]] = defaultdict(lambda: [Decimal(0), 0])
+    numbered_rows = enumerate(rows)
+
+    with transaction.atomic():
+        while batch := list(itertools.islice(numbered_rows, batch_size)):
+            logs = _build_logs(batch, result)
+            MaintenanceLog.objects.bulk_create(logs)
+            result.created += len(logs)
+            for log in logs:
+                totals[log.vehicle_id][0] += log.cost
+                totals[log.vehicle_id][1] += 1
+
+        _update_vehicles(totals)
+
+    if totals:
+        # `update()` sends no signal, the vehicle list shows `last_maintenance`
+        bump_version(VEHICLES)
+    return result
+
+
+def iter_json_array(chunks: "Iterable[str]") -> "Iterator[Any]":
+    """Decode a JSON array split across `chunks` and yield its items one at a time.
+
+    Only the unread end of the current chunk and the item being decoded are held in
+    memory, so the array can be larger than the request body Django buffers. Raises
+    `json.JSONDecodeError` on invalid JSON, after yielding the items before the
+    error, and `NotJSONArrayError` when the document is valid but not an array.
+    """
+    reader = _JSONReader(chunks)
+    if reader.next_char() != "[":
+        # Raises `JSONDecodeError` unless the whole document is another JSON value
+        json.loads(reader.read_all())
+        raise NotJSONArrayError
+
+    reader.position += 1
+    char = reader.next_char()
+    while char != "]":
+        yield reader.decode()
+        char = reader.next_char()
+        if char == ",":
+            reader.position += 1
+            char = reader.next_char()
+            if char == "]":
+                reader.fail("Expecting value")
+        elif char != "]":
+            reader.fail("Expecting ',' delimiter")
+
+    reader.position += 1
+    if reader.next_char():
+        reader.fail("Extra data")
+
+
+class _JSONReader:
+    """A cursor over JSON text arriving in chunks."""
+
+    def __init__(self, chunks: "Iterable[str]") -> None:
+        self.chunks = iter(chunks)
+        self.buffer = ""
+        self.position = 0
+        self.decoder = json.JSONDecoder()
+
+    def read(self) -> bool:
+        """Append the next chunk, dropping what was already consumed."""
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            return False
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def read_all(self) -> str:
+        while self.read():
+            pass
+        return self.buffer[self.position :]
+
+    def next_char(self) -> str:
+        """Skip whitespace and return the next character, `""` at the end."""
+        while True:
+            self.position = JSON_WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or not self.read():
+                return self.buffer[self.position : self.position + 1]
+
+    def decode(self) -> Any:
+        """Decode the value at the cursor, reading as many chunks as it spans."""
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.read():
+                    continue
+                raise
+            # A number ending the chunk may go on in the next one
+            if not JSON_NUMBER_TAIL.fullmatch(self.buffer, end) or not self.read():
+                self.position = end
+                return value
+
+    def fail(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self.buffer, self.position)
+
+
+def _build_logs(
+    batch: "list[tuple[int, Any]]",
+    result: IngestResult,
+) -> list[MaintenanceLog]:
+    vehicle_pks = dict(
+        Vehicle.objects.filter(
+            vehicle_id__in={
+                str(row["vehicle_id"])
+                for _, row in batch
+                if isinstance(row, Mapping) and "vehicle_id" in row
+            },
+        ).values_list("vehicle_id", "pk"),
+    )
+    logs = []
+    for index, row in batch:
+        if row is SKIPPED_ROW:
+            continue
+        if not isinstance(row, Mapping):
+            result.add_error(index, "Invalid row")
+            continue
+        missing = [field for field in REQUIRED_FIELDS if field not in row]
+        if missing:
+            result.add_error(index, f"Missing required field: '{missing[0]}'")
+            continue
+        vehicle_pk = vehicle_pks.get(str(row["vehicle_id"]))
+        if vehicle_pk is None:
+            result.add_error(index, f"Unknown vehicle: '{row['vehicle_id']}'")
+            continue
+
+        log = MaintenanceLog(
+            vehicle_id=vehicle_pk,
+            maintenance_date=row["maintenance_date"],
+            description=row["description"],
+            cost=row["cost"],
+        )
+        try:
+            # The vehicle was already resolved above, skip its per-row lookup
+            log.full_clean(exclude=["vehicle"], validate_unique=False)
+        except ValidationError as e:
+            result.add_error(index, str(e))
+            continue
+        logs.append(log)
+    return logs
+
+
+def _update_vehicles(totals: "Mapping[int, list[Any]]") -> None:
+    latest_maintenance = (
+        MaintenanceLog.objects.filter(vehicle=OuterRef("pk"))
+        .values("vehicle")
+        .annotate(latest=Max("maintenance_date"))
+        .values("latest")
+    )
+    vehicle_pks = iter(sorted(totals))
+    # Bounded to keep the statement below the bind parameter limit of every backend
+    while chunk := list(itertools.islice(vehicle_pks, 500)):
+        Vehicle.objects.filter(pk__in=chunk).update(
+            last_maintenance=Subquery(latest_maintenance),
+            updated_at=Now(),
+            maintenance_cost_total=F("maintenance_cost_total")
+            + Case(
+                *(When(pk=pk, then=Value(totals[pk][0])) for pk in chunk),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+            maintenance_log_count=F("maintenance_log_count")
+            + Case(
+                *(When(pk=pk, then=Value(totals[pk][1])) for pk in chunk),
+                output_field=PositiveIntegerField(),
+            ),
+        )
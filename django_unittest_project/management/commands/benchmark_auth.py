@@ -0,0 +1,105 @@
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+from django_unittest_project.benchmarking import time_calls
+from django_unittest_project.caching import ROUTE_ASSIGNMENTS
+from django_unittest_project.caching import ROUTE_DETAIL
+from django_unittest_project.caching import bump_version
+from django_unittest_project.fleet import FleetSize
+from django_unittest_project.fleet import generate_fleet
+
+VARIANTS = {
+    "db": {
+        "SESSION_ENGINE": "django.contrib.sessions.backends.db",
+        "AUTHENTICATION_BACKENDS": ["django.contrib.auth.backends.ModelBackend"],
+    },
+    "cached": {
+        "SESSION_ENGINE": settings.SESSION_ENGINE,
+        "AUTHENTICATION_BACKENDS": settings.AUTHENTICATION_BACKENDS,
+    },
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the per-request cost of loading the session and the user on the "
+        "vehicle list, from the database against the cached session engine and "
+        "authentication backends. The fleet is rolled back once measured."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=1000,
+            help="Number of vehicles of the fleet, see `FleetSize.scaled`.",
+        )
+        parser.add_argument("--repeat", type=int, default=200)
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "auth.jsonl",
+            help="JSON lines file the results are appended to, tagged by commit.",
+        )
+
+    def handle(self, *args, **options):
+        previous = previous_results(options["output"])
+        with transaction.atomic():
+            generate_fleet(FleetSize.scaled(options["size"]))
+            results = [
+                self.__benchmark(case, variant, options)
+                for case, variant in VARIANTS.items()
+            ]
+            transaction.set_rollback(True)
+        bump_version(ROUTE_DETAIL)
+        bump_version(ROUTE_ASSIGNMENTS)
+
+        for result in results:
+            line = (
+                f"{result['case']:<8} p50 {result['p50_ms']:7.2f} ms  "
+                f"p99 {result['p99_ms']:7.2f} ms  {result['queries']:>3} queries"
+            )
+            before = previous.get((result["case"], result["size"]))
+            if before is not None:
+                change = result["p50_ms"] / before["p50_ms"] - 1
+                line += f"  p50 {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        record_results(options["output"], results)
+
+    def __benchmark(self, case, variant, options):
+        url = reverse("vehicle_list")
+        with override_settings(ALLOWED_HOSTS=["testserver"], **variant):
+            user = get_user_model().objects.create_user(
+                email=f"benchmark-{uuid.uuid4().hex}@example.com",
+            )
+            client = Client()
+            client.force_login(user)
+            # Warms the caches: the queries captured next are the ones every
+            # request of a logged in user costs
+            client.get(url, secure=True)
+            with CaptureQueriesContext(connection) as queries:
+                client.get(url, secure=True)
+            durations = time_calls(
+                lambda: client.get(url, secure=True),
+                repeat=options["repeat"],
+            )
+        return {
+            "case": case,
+            "size": options["size"],
+            "p50_ms": percentile(durations, 50),
+            "p99_ms": percentile(durations, 99),
+            "queries": len(queries),
+        }
@@ -0,0 +1,110 @@
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+from django_unittest_project.benchmarking import time_calls
+from django_unittest_project.caching import ROUTE_ASSIGNMENTS
+from django_unittest_project.caching import ROUTE_DETAIL
+from django_unittest_project.caching import VEHICLES
+from django_unittest_project.caching import bump_version
+from django_unittest_project.fleet import FleetSize
+from django_unittest_project.fleet import generate_fleet
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the bytes sent and the latency of the largest vehicle list page and "
+        "of the streamed vehicle export, uncompressed, gzipped and with Brotli. The "
+        "fleet is rolled back once measured."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=200_000,
+            help="Number of vehicles of the fleet, see `FleetSize.scaled`.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "compression.jsonl",
+            help="JSON lines file the results are appended to, tagged by commit.",
+        )
+
+    def handle(self, *args, **options):
+        previous = previous_results(options["output"])
+        with transaction.atomic():
+            generate_fleet(FleetSize.scaled(options["size"]))
+            results = list(self.__benchmark(options))
+            transaction.set_rollback(True)
+        bump_version(ROUTE_DETAIL)
+        bump_version(ROUTE_ASSIGNMENTS)
+        bump_version(VEHICLES)
+
+        for result in results:
+            line = (
+                f"{result['case']:<24} {result['bytes']:>12,} bytes "
+                f"({result['ratio']:6.1%})  p50 {result['p50_ms']:9.2f} ms"
+            )
+            before = previous.get((result["case"], result["size"]))
+            if before is not None:
+                change = result["bytes"] / before["bytes"] - 1
+                line += f"  bytes {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        record_results(options["output"], results)
+
+    def __benchmark(self, options):
+        user = get_user_model().objects.create_user(
+            email=f"benchmark-{uuid.uuid4().hex}@example.com",
+        )
+        client = Client()
+        client.force_login(user)
+        urls = {
+            "vehicle_list": f"{reverse('vehicle_list')}?page_size=500",
+            "vehicle_export": reverse("vehicle_export"),
+        }
+
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for page, url in urls.items():
+                identity_bytes = None
+                for encoding in ENCODINGS:
+
+                    def fetch(url=url, encoding=encoding):
+                        response = client.get(
+                            url,
+                            headers={"Accept-Encoding": encoding},
+                            secure=True,
+                        )
+                        # Streamed responses are only produced once consumed
+                        return (
+                            b"".join(response.streaming_content)
+                            if response.streaming
+                            else response.content
+                        )
+
+                    # Also warms the row cache of the vehicle list
+                    body = fetch()
+                    identity_bytes = identity_bytes or len(body)
+                    durations = time_calls(fetch, options["repeat"])
+                    yield {
+                        "case": f"{page}:{encoding}",
+                        "size": options["size"],
+                        "bytes": len(body),
+                        "ratio": len(body) / identity_bytes,
+                        "p50_ms": percentile(durations, 50),
+                        "p99_ms": percentile(durations, 99),
+                    }
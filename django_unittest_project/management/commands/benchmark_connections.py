@@ -0,0 +1,134 @@
+import copy
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connections
+from django.db.utils import load_backend
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+
+POOL_ENGINE = "django_unittest_project.db.postgresql_pool"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the latency of getting a PostgreSQL connection and running a "
+        "query on it, connecting anew for every request against taking a "
+        "connection from the pool, with requests coming from concurrent threads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=100,
+            help="Requests made by each thread.",
+        )
+        parser.add_argument("--min-size", type=int, default=4)
+        parser.add_argument("--max-size", type=int, default=8)
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "connections.jsonl",
+        )
+
+    def handle(self, *args, **options):
+        settings_dict = connections[options["database"]].settings_dict
+        if connections[options["database"]].vendor != "postgresql":
+            msg = "Connection pooling is only available on PostgreSQL."
+            raise CommandError(msg)
+
+        pool_options = {
+            "min_size": options["min_size"],
+            "max_size": options["max_size"],
+            "timeout": 30,
+        }
+        variants = {
+            "connect": ("django.db.backends.postgresql", None),
+            "pool": (POOL_ENGINE, pool_options),
+        }
+        previous = previous_results(options["output"])
+        results = []
+        for case, (engine, pool) in variants.items():
+            variant_settings = copy.deepcopy(settings_dict)
+            variant_settings["ENGINE"] = engine
+            variant_settings["CONN_MAX_AGE"] = 0
+            variant_settings["OPTIONS"].pop("pool", None)
+            if pool is not None:
+                variant_settings["OPTIONS"]["pool"] = pool
+            results.append(self.__benchmark(case, variant_settings, options))
+
+        for result in results:
+            line = (
+                f"{result['case']:<8} {result['size']:>3} threads  "
+                f"connect p50 {result['connect_p50_ms']:7.2f} ms  "
+                f"p99 {result['connect_p99_ms']:7.2f} ms  "
+                f"request p50 {result['request_p50_ms']:7.2f} ms  "
+                f"{result['requests_per_second']:8.0f} req/s"
+            )
+            before = previous.get((result["case"], result["size"]))
+            if before is not None:
+                change = result["connect_p50_ms"] / before["connect_p50_ms"] - 1
+                line += f"  connect p50 {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        pool_stats = results[-1].get("pool_stats", {})
+        self.stdout.write(
+            f"pool: {pool_stats.get('connections_num', 0)} connections opened, "
+            f"{pool_stats.get('requests_queued', 0)} requests queued for "
+            f"{pool_stats.get('requests_wait_ms', 0)} ms in total",
+        )
+        record_results(options["output"], results)
+
+    def __benchmark(self, case, settings_dict, options):
+        wrapper_class = load_backend(settings_dict["ENGINE"]).DatabaseWrapper
+        # The pool is shared by every wrapper of the same alias in this process
+        alias = f"benchmark_{case}"
+
+        def client():
+            wrapper = wrapper_class(copy.deepcopy(settings_dict), alias)
+            samples = []
+            for _ in range(options["requests"]):
+                start = time.perf_counter()
+                wrapper.ensure_connection()
+                connected = time.perf_counter()
+                with wrapper.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                wrapper.close()
+                end = time.perf_counter()
+                samples.append(((connected - start) * 1000, (end - start) * 1000))
+            return wrapper, samples
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            outcomes = list(
+                executor.map(lambda _: client(), range(options["concurrency"])),
+            )
+        elapsed = time.perf_counter() - start
+
+        samples = list(itertools.chain.from_iterable(s for _, s in outcomes))
+        connect = [connect_ms for connect_ms, _ in samples]
+        request = [request_ms for _, request_ms in samples]
+        result = {
+            "case": case,
+            "size": options["concurrency"],
+            "connect_p50_ms": percentile(connect, 50),
+            "connect_p99_ms": percentile(connect, 99),
+            "request_p50_ms": percentile(request, 50),
+            "request_p99_ms": percentile(request, 99),
+            "requests_per_second": len(samples) / elapsed,
+        }
+        wrapper = outcomes[0][0]
+        if hasattr(wrapper, "pool_stats"):
+            result["pool_stats"] = wrapper.pool_stats()
+            wrapper.close_pool()
+        return result
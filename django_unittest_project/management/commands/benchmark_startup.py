@@ -0,0 +1,223 @@
+import collections
+import contextlib
+import os
+import re
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+
+# import time:  self [us] | cumulative | imported package
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+PROC = Path("/proc")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the startup of the config.wsgi application: its import time, "
+        "and the memory of gunicorn workers with and without preloading it. "
+        "Also profiles `django.setup()` under each of `--settings-modules`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--port", type=int, default=8766)
+        parser.add_argument(
+            "--settings-modules",
+            nargs="+",
+            default=[os.environ["DJANGO_SETTINGS_MODULE"], "config.settings.batch"],
+            help="Settings whose `django.setup()` is profiled, the batch settings "
+            "need the production environment.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of top-level packages listed by import time.",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "startup.jsonl",
+        )
+
+    def handle(self, *args, **options):
+        if not PROC.is_dir():
+            msg = "Worker memory is read from /proc, run this on Linux."
+            raise CommandError(msg)
+
+        previous = previous_results(options["output"], key=("case",))
+        profiles = [self.__import_time("import", "import config.wsgi", os.environ)]
+        profiles.extend(
+            self.__import_time(
+                f"setup:{module}",
+                "import django; django.setup()",
+                os.environ | {"DJANGO_SETTINGS_MODULE": module},
+            )
+            for module in options["settings_modules"]
+        )
+        results = [
+            *(result for result, _ in profiles),
+            *(self.__workers(preload, options) for preload in (False, True)),
+        ]
+
+        for result, packages in profiles:
+            line = (
+                f"{result['case']:<40} {result['import_ms']:6.0f} ms of imports, "
+                f"{result['wall_ms']:6.0f} ms until the process exits"
+            )
+            before = previous.get((result["case"],))
+            if before is not None:
+                change = result["wall_ms"] / before["wall_ms"] - 1
+                line += f"  {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+            for package, self_us in packages.most_common(options["top"]):
+                self.stdout.write(f"  {package:<30} {self_us / 1000:8.1f} ms")
+        for result in results[len(profiles) :]:
+            line = (
+                f"{result['case']:<12} ready in {result['ready_ms']:6.0f} ms  "
+                f"per worker: RSS {result['worker_rss_mb']:6.1f} MB  "
+                f"PSS {result['worker_pss_mb']:6.1f} MB  "
+                f"total PSS {result['total_pss_mb']:6.1f} MB"
+            )
+            before = previous.get((result["case"],))
+            if before is not None:
+                change = result["total_pss_mb"] / before["total_pss_mb"] - 1
+                line += f"  total PSS {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        record_results(options["output"], results)
+
+    def __import_time(self, case, statement, env):
+        start = time.perf_counter()
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", statement],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if process.returncode:
+            msg = f"{statement} failed:\n{process.stderr[-2000:]}"
+            raise CommandError(msg)
+
+        # Self time summed by top-level package, the cumulative times overlap
+        packages = collections.Counter()
+        for match in IMPORTTIME_LINE.finditer(process.stderr):
+            packages[match[4].split(".")[0]] += int(match[1])
+        return (
+            {
+                "case": case,
+                "size": len(packages),
+                "import_ms": packages.total() / 1000,
+                "wall_ms": wall_ms,
+            },
+            packages,
+        )
+
+    def __workers(self, preload, options):
+        case = "preload" if preload else "no-preload"
+        start = time.perf_counter()
+        process = subprocess.Popen(  # noqa: S603
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "--config",
+                str(settings.BASE_DIR / "config" / "gunicorn.py"),
+                "--bind",
+                f"127.0.0.1:{options['port']}",
+                "--chdir",
+                str(settings.BASE_DIR),
+                "--workers",
+                str(options["workers"]),
+            ],
+            env=os.environ
+            | {
+                "DJANGO_SERVER_INTERFACE": "wsgi",
+                "GUNICORN_PRELOAD_APP": "1" if preload else "0",
+            },
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self.__wait_until_served(process, options["port"])
+            ready_ms = (time.perf_counter() - start) * 1000
+            workers = self.__wait_for_workers(process.pid, options["workers"])
+            rss = [_memory_kb(pid, "status", "VmRSS") for pid in workers]
+            # Proportional set size: shared pages are split among the processes
+            # sharing them, so the sum is the memory actually used
+            pss = [_memory_kb(pid, "smaps_rollup", "Pss") for pid in workers]
+            master_pss = _memory_kb(process.pid, "smaps_rollup", "Pss")
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+        return {
+            "case": case,
+            "size": len(workers),
+            "ready_ms": ready_ms,
+            "worker_rss_mb": sum(rss) / len(rss) / 1024,
+            "worker_pss_mb": sum(pss) / len(pss) / 1024,
+            "total_pss_mb": (sum(pss) + master_pss) / 1024,
+        }
+
+    def __wait_until_served(self, process, port):
+        deadline = time.monotonic() + 60
+        while True:
+            if process.poll() is not None or time.monotonic() > deadline:
+                msg = "gunicorn did not start."
+                raise CommandError(msg)
+            try:
+                with urllib.request.urlopen(
+                    f"http://127.0.0.1:{port}/",
+                    timeout=5,
+                ):
+                    return
+            except urllib.error.HTTPError:
+                # Any response means a worker loaded the application
+                return
+            except OSError:
+                time.sleep(0.1)
+
+    def __wait_for_workers(self, master_pid, count):
+        # Without preloading, the workers keep importing after the first one
+        # answered: wait for all of them and for their memory to settle
+        deadline = time.monotonic() + 60
+        previous = None
+        while time.monotonic() < deadline:
+            workers = _children(master_pid)
+            total = sum(_memory_kb(pid, "status", "VmRSS") for pid in workers)
+            if len(workers) == count and total == previous:
+                return workers
+            previous = total if len(workers) == count else None
+            time.sleep(0.5)
+        msg = f"{count} gunicorn workers did not settle."
+        raise CommandError(msg)
+
+
+def _children(pid: int) -> list[int]:
+    children = []
+    for stat in PROC.glob("[0-9]*/stat"):
+        with contextlib.suppress(OSError):
+            # The command name is parenthesized and may contain spaces
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+            if int(fields[1]) == pid:
+                children.append(int(stat.parent.name))
+    return sorted(children)
+
+
+def _memory_kb(pid: int, file: str, field: str) -> int:
+    with contextlib.suppress(OSError):
+        for line in (PROC / str(pid) / file).read_text().splitlines():
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    return 0
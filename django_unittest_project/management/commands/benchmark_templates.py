@@ -0,0 +1,142 @@
+import copy
+import datetime as dt
+import time
+from pathlib import Path
+
+from allauth.account.forms import LoginForm
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+from django_unittest_project.benchmarking import time_calls
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteAssignment
+from django_unittest_project.models import Vehicle
+from django_unittest_project.pagination import KeysetPage
+from django_unittest_project.template_backends import warm_up_templates
+
+SOURCE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+LOADERS = {
+    "uncached": SOURCE_LOADERS,
+    "cached": [("django.template.loaders.cached.Loader", SOURCE_LOADERS)],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the render time of the transport and allauth templates with and "
+        "without the cached template loader of the production settings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=200)
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "templates.jsonl",
+            help="JSON lines file the results are appended to, tagged by commit.",
+        )
+
+    def handle(self, *args, **options):
+        previous = previous_results(options["output"], key=("case", "loader"))
+        results = []
+        for loader, loaders in LOADERS.items():
+            templates = copy.deepcopy(settings.TEMPLATES)
+            templates[0]["APP_DIRS"] = False
+            templates[0]["OPTIONS"]["loaders"] = loaders
+            # Changing `TEMPLATES` resets the engines, each variant starts cold
+            with override_settings(TEMPLATES=templates, DEBUG=False):
+                start = time.perf_counter()
+                compiled = warm_up_templates() if loader == "cached" else 0
+                warm_up_ms = (time.perf_counter() - start) * 1000
+                if compiled:
+                    self.stdout.write(
+                        f"Warmed up {compiled} templates in {warm_up_ms:.0f} ms",
+                    )
+                results.extend(self.__benchmark(loader, options["repeat"]))
+
+        for result in results:
+            line = (
+                f"{result['case']:<28} {result['loader']:<9} "
+                f"first {result['first_ms']:8.2f} ms  "
+                f"p50 {result['p50_ms']:8.3f} ms  p99 {result['p99_ms']:8.3f} ms"
+            )
+            before = previous.get((result["case"], result["loader"]))
+            if before is not None:
+                change = result["p50_ms"] / before["p50_ms"] - 1
+                line += f"  p50 {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        record_results(options["output"], results)
+
+    def __benchmark(self, loader, repeat):
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        request.session = {}
+        for template_name, context in self.__cases(request).items():
+            first_ms, *durations = time_calls(
+                lambda template_name=template_name, context=context: render_to_string(
+                    template_name,
+                    context,
+                    request,
+                ),
+                repeat + 1,
+            )
+            yield {
+                "case": template_name,
+                "loader": loader,
+                "first_ms": first_ms,
+                "p50_ms": percentile(durations, 50),
+                "p99_ms": percentile(durations, 99),
+            }
+
+    def __cases(self, request):
+        # Unsaved rows: only the templates are measured, not the database
+        vehicles = [
+            Vehicle(
+                pk=pk,
+                vehicle_id=str(pk),
+                type="BUS",
+                capacity=50,
+                last_maintenance=dt.date(2024, 1, 1),
+                updated_at=timezone.now(),
+            )
+            for pk in range(1, 51)
+        ]
+        route = Route(pk=1, route_number="1", start_point="depot", end_point="park")
+        assignments = [
+            RouteAssignment(
+                vehicle=vehicle,
+                route=route,
+                driver_name="Alex Smith",
+                start_time=dt.time(8),
+                end_time=dt.time(9),
+            )
+            for vehicle in vehicles
+        ]
+        return {
+            "vehicle_row_fragment.html": {"vehicle": vehicles[0]},
+            "vehicle_list.html": {
+                "vehicles": vehicles,
+                "vehicle_rows": [
+                    render_to_string("vehicle_row_fragment.html", {"vehicle": vehicle})
+                    for vehicle in vehicles
+                ],
+                "page": KeysetPage(object_list=vehicles, page_size=len(vehicles)),
+                "vehicle_count": len(vehicles),
+            },
+            "route_detail_fragment.html": {
+                "route": route,
+                "assignments": assignments,
+            },
+            "account/login.html": {"form": LoginForm(request=request)},
+        }
@@ -0,0 +1,204 @@
+import contextlib
+import itertools
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.auth import HASH_SESSION_KEY
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+from django_unittest_project.models import Route
+from django_unittest_project.models import Vehicle
+
+SERVERS = {
+    "wsgi": ["config.wsgi"],
+    "asgi": ["config.asgi", "--worker-class", "uvicorn_worker.UvicornWorker"],
+}
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # A redirect to the login page must count as a failure, not be followed
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the concurrent throughput of the transport views, sync over WSGI "
+        "and async over ASGI, each served by gunicorn on a local port. Runs "
+        "against the current database, see the generate_fleet command."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=10,
+            help="Seconds of load on each view.",
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host header of the requests, must be in ALLOWED_HOSTS.",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "throughput.jsonl",
+        )
+
+    def handle(self, *args, **options):
+        route = Route.objects.filter(routeassignment__isnull=False).first()
+        vehicle = Vehicle.objects.filter(maintenance_log_count__gt=0).first()
+        if route is None or vehicle is None:
+            msg = "Seed the database first, see the generate_fleet command."
+            raise CommandError(msg)
+        views = {
+            "vehicle_list": [],
+            "route_detail": [route.route_number],
+            "vehicle_maintenance": [vehicle.vehicle_id],
+            "route_efficiency": [],
+        }
+
+        previous = previous_results(options["output"])
+        results = []
+        # The servers run in other processes, the user and its session have to be
+        # committed for them to see it
+        user = get_user_model().objects.create_user(
+            email=f"benchmark-{uuid.uuid4().hex}@example.com",
+        )
+        session = self.__login(user)
+        try:
+            for interface, server_args in SERVERS.items():
+                with self.__server(server_args, options):
+                    for view, view_args in views.items():
+                        url_name = view if interface == "wsgi" else f"async_{view}"
+                        result = self.__load(
+                            reverse(url_name, args=view_args),
+                            session.session_key,
+                            options,
+                        )
+                        results.append({"case": f"{interface}:{view}", **result})
+        finally:
+            session.delete()
+            user.delete()
+
+        for result in results:
+            line = (
+                f"{result['case']:<26} {result['requests_per_second']:8.1f} req/s  "
+                f"p50 {result['p50_ms']:8.1f} ms  p99 {result['p99_ms']:8.1f} ms  "
+                f"{result['errors']} errors"
+            )
+            before = previous.get((result["case"], result["size"]))
+            if before is not None:
+                change = result["requests_per_second"] / before["requests_per_second"]
+                line += f"  {change - 1:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        record_results(options["output"], results)
+
+    def __login(self, user):
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)  # noqa: SLF001
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        return session
+
+    @contextlib.contextmanager
+    def __server(self, server_args, options):
+        process = subprocess.Popen(  # noqa: S603
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                *server_args,
+                "--bind",
+                f"127.0.0.1:{options['port']}",
+                "--workers",
+                str(options["workers"]),
+                "--chdir",
+                str(settings.BASE_DIR),
+            ],
+            env=os.environ | {"CONN_MAX_AGE": "0"},
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    msg = f"gunicorn {server_args[0]} did not start."
+                    raise CommandError(msg)
+                with (
+                    contextlib.suppress(OSError),
+                    socket.create_connection(
+                        ("127.0.0.1", options["port"]),
+                        timeout=1,
+                    ),
+                ):
+                    break
+                time.sleep(0.2)
+            yield
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    def __load(self, path, session_key, options):
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{options['port']}{path}",
+            headers={
+                "Host": options["host"],
+                "Cookie": f"{settings.SESSION_COOKIE_NAME}={session_key}",
+                # Lets `SECURE_SSL_REDIRECT` through, as a TLS proxy would
+                "X-Forwarded-Proto": "https",
+            },
+        )
+        opener = urllib.request.build_opener(_NoRedirect)
+        deadline = time.perf_counter() + options["duration"]
+
+        def client():
+            durations, errors = [], 0
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    with opener.open(request, timeout=60) as response:
+                        response.read()
+                except (OSError, urllib.error.HTTPError):
+                    errors += 1
+                    continue
+                durations.append((time.perf_counter() - start) * 1000)
+            return durations, errors
+
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            outcomes = list(
+                executor.map(lambda _: client(), range(options["concurrency"])),
+            )
+        durations = list(itertools.chain.from_iterable(d for d, _ in outcomes))
+        # Percentiles stay defined when every request failed
+        samples = durations or [math.nan]
+        return {
+            "size": options["concurrency"],
+            "requests_per_second": len(durations) / options["duration"],
+            "p50_ms": percentile(samples, 50),
+            "p99_ms": percentile(samples, 99),
+            "errors": sum(errors for _, errors in outcomes),
+        }
@@ -0,0 +1,112 @@
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import reset_queries
+from django.db import transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import previous_results
+from django_unittest_project.benchmarking import record_results
+from django_unittest_project.benchmarking import time_calls
+from django_unittest_project.caching import ROUTE_ASSIGNMENTS
+from django_unittest_project.caching import ROUTE_DETAIL
+from django_unittest_project.caching import bump_version
+from django_unittest_project.fleet import FleetSize
+from django_unittest_project.fleet import generate_fleet
+from django_unittest_project.models import Route
+from django_unittest_project.models import Vehicle
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency and query count of the transport views on generated "
+        "fleets of several sizes. Each fleet is rolled back once measured."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 100000],
+            help="Number of vehicles of each fleet, see `FleetSize.scaled`.",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / ".benchmarks" / "views.jsonl",
+            help="JSON lines file the results are appended to, tagged by commit.",
+        )
+
+    def handle(self, *args, **options):
+        previous = previous_results(options["output"])
+        results = []
+        for size in options["sizes"]:
+            with transaction.atomic():
+                generate_fleet(FleetSize.scaled(size))
+                results.extend(self.__benchmark(size, options["repeat"]))
+                transaction.set_rollback(True)
+            # Drop what was cached from the rolled back fleet
+            bump_version(ROUTE_DETAIL)
+            bump_version(ROUTE_ASSIGNMENTS)
+
+        for result in results:
+            line = (
+                f"{result['case']:<20} {result['size']:>9} vehicles  "
+                f"p50 {result['p50_ms']:9.2f} ms  p99 {result['p99_ms']:9.2f} ms  "
+                f"{result['queries']:>4} queries"
+            )
+            before = previous.get((result["case"], result["size"]))
+            if before is not None:
+                change = result["p50_ms"] / before["p50_ms"] - 1
+                line += f"  p50 {change:+.0%} vs {before['commit']}"
+            self.stdout.write(line)
+        record_results(options["output"], results)
+
+    def __benchmark(self, size, repeat):
+        user = get_user_model().objects.create_user(
+            email=f"benchmark-{uuid.uuid4().hex}@example.com",
+            is_staff=True,
+        )
+        client = Client()
+        client.force_login(user)
+        route = Route.objects.filter(routeassignment__isnull=False).first()
+        vehicle = Vehicle.objects.filter(maintenance_log_count__gt=0).first()
+        urls = {
+            "vehicle_list": reverse("vehicle_list"),
+            "route_detail": reverse("route_detail", args=[route.route_number]),
+            "vehicle_maintenance": reverse(
+                "vehicle_maintenance",
+                args=[vehicle.vehicle_id],
+            ),
+            "route_efficiency": reverse("route_efficiency"),
+        }
+
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for case, url in urls.items():
+                # The first request also warms the caches, its queries are the
+                # ones a cold cache costs. `request_started` resets the query log,
+                # so it has to start empty for the capture to line up.
+                reset_queries()
+                with CaptureQueriesContext(connection) as queries:
+                    client.get(url, secure=True)
+                durations = time_calls(
+                    lambda url=url: client.get(url, secure=True),
+                    repeat,
+                )
+                yield {
+                    "case": case,
+                    "size": size,
+                    "p50_ms": percentile(durations, 50),
+                    "p99_ms": percentile(durations, 99),
+                    "queries": len(queries),
+                }
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+
+from django_unittest_project.benchmarking import percentile
+from django_unittest_project.benchmarking import time_calls
+from django_unittest_project.models import MaintenanceLog
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteEfficiency
+from django_unittest_project.models import Vehicle
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the plan and latency of the main transport queries. Run it before "
+        "and after a migration to compare the effect of an index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="How many times each query is run to measure its latency.",
+        )
+
+    def handle(self, *args, **options):
+        route = Route.objects.filter(routeassignment__isnull=False).first()
+        vehicle = Vehicle.objects.filter(maintenance_log_count__gt=0).first()
+        if route is None or vehicle is None:
+            msg = "Seed routes, assignments and maintenance logs first."
+            raise CommandError(msg)
+
+        queries = {
+            "Route timetable": route.routeassignment_set.timetable(),
+            "Route rollup refresh": Route.objects.filter(
+                pk=route.pk,
+            ).with_efficiency(),
+            "Maintenance history page": MaintenanceLog.objects.filter(
+                vehicle=vehicle,
+            )
+            .defer("description")
+            .order_by("-maintenance_date", "-id")[:50],
+            "Route efficiency report": RouteEfficiency.objects.select_related(
+                "route",
+            ).order_by("route"),
+        }
+        explain_options = (
+            {"analyze": True, "buffers": True}
+            if connection.vendor == "postgresql"
+            else {}
+        )
+
+        for name, queryset in queries.items():
+            durations = time_calls(lambda q=queryset: list(q.all()), options["repeat"])
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write(
+                f"p50 {percentile(durations, 50):.2f} ms, "
+                f"p99 {percentile(durations, 99):.2f} ms\n",
+            )
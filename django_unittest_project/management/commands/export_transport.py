@@ -0,0 +1,48 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from django_unittest_project.transfer import FORMATS
+from django_unittest_project.transfer import TABLES
+from django_unittest_project.transfer import export_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the vehicles, routes, route assignments and maintenance logs to one "
+        "CSV or Parquet file per table in a directory, with constant memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", type=Path)
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument("--tables", nargs="+", choices=TABLES, default=list(TABLES))
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            results = export_tables(
+                options["directory"],
+                options["format"],
+                options["tables"],
+                batch_size=options["batch_size"],
+            )
+        except OSError as e:
+            raise CommandError(str(e)) from e
+        elapsed = time.perf_counter() - start
+
+        for result in results:
+            self.stdout.write(
+                f"{result.table}: {result.rows} rows in {result.seconds:.2f} s "
+                f"({result.rows_per_second:.0f} rows/s)",
+            )
+        rows = sum(result.rows for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {rows} rows to {options['directory']} in {elapsed:.1f} s "
+                f"({rows / elapsed:.0f} rows/s).",
+            ),
+        )
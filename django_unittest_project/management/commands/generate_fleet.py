@@ -0,0 +1,53 @@
+import dataclasses as dc
+import random as rd
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_unittest_project.fleet import FleetSize
+from django_unittest_project.fleet import generate_fleet
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-generate a synthetic fleet of vehicles, routes, assignments and "
+        "maintenance logs. Unset counts default to proportions of --vehicles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vehicles", type=int, default=1000)
+        parser.add_argument("--routes", type=int)
+        parser.add_argument("--assignments", type=int)
+        parser.add_argument("--maintenance-logs", type=int)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Seed of the random generator, to generate the same fleet again.",
+        )
+
+    def handle(self, *args, **options):
+        if options["seed"] is not None:
+            rd.seed(options["seed"])
+
+        size = dc.replace(
+            FleetSize.scaled(options["vehicles"]),
+            **{
+                field: options[field]
+                for field in ("routes", "assignments", "maintenance_logs")
+                if options[field] is not None
+            },
+        )
+
+        start = time.perf_counter()
+        generate_fleet(size, batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - start
+
+        rows = size.vehicles + size.routes + size.assignments + size.maintenance_logs
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {size.vehicles} vehicles, {size.routes} routes, "
+                f"{size.assignments} assignments and {size.maintenance_logs} "
+                f"maintenance logs in {elapsed:.1f} s ({rows / elapsed:.0f} rows/s).",
+            ),
+        )
@@ -0,0 +1,50 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import DatabaseError
+
+from django_unittest_project.transfer import FORMATS
+from django_unittest_project.transfer import TABLES
+from django_unittest_project.transfer import import_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the files written by export_transport, keeping their pks, in one "
+        "transaction. The route rollups and maintenance totals are rebuilt after."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", type=Path)
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument("--tables", nargs="+", choices=TABLES, default=list(TABLES))
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            results = import_tables(
+                options["directory"],
+                options["format"],
+                options["tables"],
+                batch_size=options["batch_size"],
+            )
+        except (OSError, ValueError, DatabaseError) as e:
+            msg = f"Nothing imported: {e}"
+            raise CommandError(msg) from e
+        elapsed = time.perf_counter() - start
+
+        for result in results:
+            self.stdout.write(
+                f"{result.table}: {result.rows} rows in {result.seconds:.2f} s "
+                f"({result.rows_per_second:.0f} rows/s)",
+            )
+        rows = sum(result.rows for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {rows} rows in {elapsed:.1f} s ({rows / elapsed:.0f} "
+                "rows/s), including the rebuild of the rollups and totals.",
+            ),
+        )
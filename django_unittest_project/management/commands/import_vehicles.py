@@ -0,0 +1,43 @@
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from django_unittest_project.imports import VEHICLE_FIELDS
+from django_unittest_project.imports import import_vehicles
+
+
+class Command(BaseCommand):
+    help = (
+        "Import vehicles from a CSV file whose header names the columns "
+        f"{', '.join(VEHICLE_FIELDS)}. Vehicles are matched by vehicle_id: new ones "
+        "are created, existing ones updated. Invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        try:
+            with options["path"].open(newline="") as csv_file:
+                result = import_vehicles(
+                    csv.DictReader(csv_file),
+                    batch_size=options["batch_size"],
+                )
+        except OSError as e:
+            raise CommandError(str(e)) from e
+
+        for error in result.errors:
+            # Numbered from 1, after the header
+            self.stderr.write(f"Row {error['index'] + 1}: {error['error']}")
+        if result.errors and not (result.created or result.updated):
+            msg = f"No vehicle imported, {len(result.errors)} invalid row(s)."
+            raise CommandError(msg)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {result.created} and updated {result.updated} "
+                f"vehicle(s), skipped {len(result.errors)} invalid row(s).",
+            ),
+        )
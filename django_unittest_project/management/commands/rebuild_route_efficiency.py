@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+
+from django_unittest_project.models import RouteEfficiency
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-route efficiency rollup from the route assignments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report routes whose rollup drifted, exiting with an error.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = RouteEfficiency.objects.drifted()
+
+        if options["check"]:
+            if drifted:
+                msg = f"{len(drifted)} route rollup(s) drifted: {drifted}"
+                raise CommandError(msg)
+            self.stdout.write(self.style.SUCCESS("Route rollups are consistent."))
+            return
+
+        with transaction.atomic():
+            RouteEfficiency.objects.refresh()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt route rollups, {len(drifted)} had drifted.",
+            ),
+        )
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+
+from django_unittest_project.models import Vehicle
+
+
+class Command(BaseCommand):
+    help = "Reconcile the vehicles' maintenance totals against their logs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report vehicles whose totals drifted, exiting with an error.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = list(
+            Vehicle.objects.maintenance_drifted().values_list("vehicle_id", flat=True),
+        )
+
+        if options["check"]:
+            if drifted:
+                msg = f"{len(drifted)} vehicle total(s) drifted: {drifted}"
+                raise CommandError(msg)
+            self.stdout.write(self.style.SUCCESS("Maintenance totals are consistent."))
+            return
+
+        with transaction.atomic():
+            Vehicle.objects.filter(
+                vehicle_id__in=drifted,
+            ).reconcile_maintenance_totals()
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled {len(drifted)} vehicle total(s)."),
+        )
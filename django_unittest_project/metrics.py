@@ -0,0 +1,94 @@
+import contextlib
+import dataclasses as dc
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+BUDGET_FIELDS = ("queries", "db_ms", "pool_wait_ms", "template_ms", "total_ms")
+
+
+class RequestBudgetExceededError(AssertionError):
+    pass
+
+
+@dc.dataclass
+class RequestMetrics:
+    queries: int = 0
+    db_ms: float = 0
+    # Waiting for a connection of the pool, see `db.postgresql_pool`
+    pool_wait_ms: float = 0
+    template_ms: float = 0
+    total_ms: float = 0
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.db_ms:.1f};desc="{self.queries} queries", '
+            f"pool;dur={self.pool_wait_ms:.1f}, "
+            f"tpl;dur={self.template_ms:.1f}, "
+            f"total;dur={self.total_ms:.1f}"
+        )
+
+    def over_budget(self, budget: dict[str, float]) -> dict[str, float]:
+        """The measurements exceeding `budget`, a mapping of `BUDGET_FIELDS`."""
+        return {
+            field: getattr(self, field)
+            for field, limit in budget.items()
+            if getattr(self, field) > limit
+        }
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def collect(request_metrics: RequestMetrics) -> "Iterator[RequestMetrics]":
+    """Make `request_metrics` the target of `timing` within the block."""
+    token = _current.set(request_metrics)
+    try:
+        yield request_metrics
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def timing(field: str) -> "Iterator[None]":
+    """Add the duration of the block to `field` of the metrics being collected."""
+    request_metrics = _current.get()
+    if request_metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        setattr(request_metrics, field, getattr(request_metrics, field) + elapsed)
+
+
+def execute_wrapper(
+    execute: "Callable[..., Any]",
+    sql: str,
+    params: Any,
+    many: bool,  # noqa: FBT001
+    context: dict[str, Any],
+) -> Any:
+    """A `connection.execute_wrapper` counting and timing the collected queries.
+
+    It is installed on every connection as it is created, see `signals.py`, rather
+    than around each request. Connections are per thread, and queries made through
+    the async ORM run in worker threads the request does not know about; the
+    metrics still reach them, as the context is copied to those threads.
+    """
+    request_metrics = _current.get()
+    if request_metrics is not None:
+        request_metrics.queries += 1
+    with timing("db_ms"):
+        return execute(sql, params, many, context)
@@ -0,0 +1,188 @@
+import dataclasses as dc
+import logging
+import re
+import time
+
+import brotli
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+from .metrics import RequestBudgetExceededError
+from .metrics import RequestMetrics
+from .metrics import collect
+
+logger = logging.getLogger(__name__)
+
+ACCEPTS_BROTLI = re.compile(r"\bbr\b")
+
+
+class RequestMetricsMiddleware:
+    """Measure the SQL queries, DB time, template render time and total time.
+
+    The figures are sent in a `Server-Timing` header and logged, as a `key=value`
+    message and as `extra` fields for structured handlers. Requests to a view named
+    in `REQUEST_BUDGETS` are checked against its budget: going over it is logged as
+    a warning, or raises `RequestBudgetExceededError` when `REQUEST_BUDGETS_ENFORCE`
+    is set, as it is in the tests. Sync and async requests are both measured; the
+    queries are counted by `metrics.execute_wrapper`. Queries run while a streaming
+    response is consumed happen after the middleware returned and are not counted.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall(request)
+        request_metrics = RequestMetrics()
+        start = time.perf_counter()
+        with collect(request_metrics):
+            response = self.get_response(request)
+        return self.__finish(request, response, request_metrics, start)
+
+    async def __acall(self, request):
+        request_metrics = RequestMetrics()
+        start = time.perf_counter()
+        with collect(request_metrics):
+            response = await self.get_response(request)
+        return self.__finish(request, response, request_metrics, start)
+
+    def __finish(self, request, response, request_metrics, start):
+        request_metrics.total_ms = (time.perf_counter() - start) * 1000
+        response["Server-Timing"] = request_metrics.server_timing()
+        view_name = getattr(request.resolver_match, "view_name", None)
+        self.__log(request, response, view_name, request_metrics)
+        self.__check_budget(view_name, request_metrics)
+        return response
+
+    def __log(self, request, response, view_name, request_metrics):
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "view": view_name,
+            "status": response.status_code,
+            **{
+                name: round(value, 1)
+                for name, value in dc.asdict(request_metrics).items()
+            },
+        }
+        logger.info(
+            "request_metrics %s",
+            " ".join(f"{name}={value}" for name, value in fields.items()),
+            extra=fields,
+        )
+
+    def __check_budget(self, view_name, request_metrics):
+        budget = settings.REQUEST_BUDGETS.get(view_name)
+        if not budget:
+            return
+        exceeded = request_metrics.over_budget(budget)
+        if not exceeded:
+            return
+        msg = f"View '{view_name}' exceeded its budget {budget}: {exceeded}"
+        if settings.REQUEST_BUDGETS_ENFORCE:
+            raise RequestBudgetExceededError(msg)
+        logger.warning(msg)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress HTML with gzip, and JSON with Brotli for the clients accepting it.
+
+    Only `content_types` are compressed, from `COMPRESSION_MIN_SIZE` bytes on: a
+    smaller response fits in a few packets anyway. Streaming responses are always
+    compressed, their size is unknown. Gzip is left to `GZipMiddleware`, along its
+    BREACH mitigation of random-length padding. Brotli cannot be padded through its
+    bindings, so it is kept to `brotli_content_types`: the exports, which carry
+    no CSRF token. A strong `ETag` is made weak, which `If-None-Match` still
+    matches, see `views.ConditionalGetMixin`.
+    """
+
+    content_types = frozenset(("text/html", "application/json", "application/x-ndjson"))
+    brotli_content_types = frozenset(("application/json", "application/x-ndjson"))
+    # 11 is meant for files compressed once, not for every response
+    brotli_quality = 5
+    # Streams are flushed every so many bytes rather than after each chunk: flushing
+    # every row of an NDJSON export would more than double its compressed size
+    brotli_flush_size = 64 * 1024
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding") or not self.__compressible(response):
+            return response
+        if self.__content_type(response) not in self.brotli_content_types or (
+            not ACCEPTS_BROTLI.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.streaming:
+            compress = (
+                self.__acompress_sequence
+                if response.is_async
+                else self.__compress_sequence
+            )
+            response.streaming_content = compress(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = brotli.compress(
+                response.content,
+                mode=brotli.MODE_TEXT,
+                quality=self.brotli_quality,
+            )
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
+
+    def __content_type(self, response) -> str:
+        return response.get("Content-Type", "").partition(";")[0].strip()
+
+    def __compressible(self, response) -> bool:
+        return self.__content_type(response) in self.content_types and (
+            response.streaming or len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        )
+
+    def __compress_sequence(self, sequence):
+        compressor = _StreamCompressor(self.brotli_quality, self.brotli_flush_size)
+        for chunk in sequence:
+            if compressed := compressor.process(chunk):
+                yield compressed
+        yield compressor.finish()
+
+    async def __acompress_sequence(self, sequence):
+        compressor = _StreamCompressor(self.brotli_quality, self.brotli_flush_size)
+        async for chunk in sequence:
+            if compressed := compressor.process(chunk):
+                yield compressed
+        yield compressor.finish()
+
+
+class _StreamCompressor:
+    def __init__(self, quality: int, flush_size: int) -> None:
+        self.__compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+        self.__flush_size = flush_size
+        self.__unflushed = 0
+
+    def process(self, chunk: bytes) -> bytes:
+        compressed = self.__compressor.process(chunk)
+        self.__unflushed += len(chunk)
+        if self.__unflushed >= self.__flush_size:
+            compressed += self.__compressor.flush()
+            self.__unflushed = 0
+        return compressed
+
+    def finish(self) -> bytes:
+        return self.__compressor.finish()
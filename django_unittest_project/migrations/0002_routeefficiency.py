@@ -0,0 +1,43 @@
+# Generated by Django 4.2.14 on 2026-10-17 20:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_route_efficiency(apps, schema_editor):
+    Route = apps.get_model("django_unittest_project", "Route")
+    RouteEfficiency = apps.get_model("django_unittest_project", "RouteEfficiency")
+    routes = Route.objects.annotate(
+        total_capacity=models.Sum("routeassignment__vehicle__capacity"),
+        assignment_count=models.Count("routeassignment"),
+    )
+    RouteEfficiency.objects.bulk_create(
+        (
+            RouteEfficiency(
+                route_id=route.pk,
+                total_capacity=route.total_capacity or 0,
+                assignment_count=route.assignment_count,
+            )
+            for route in routes.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_unittest_project', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RouteEfficiency',
+            fields=[
+                ('route', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='efficiency', serialize=False, to='django_unittest_project.route')),
+                ('total_capacity', models.PositiveBigIntegerField(default=0)),
+                ('assignment_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_route_efficiency, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.14 on 2026-10-17 20:05
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_maintenance_totals(apps, schema_editor):
+    MaintenanceLog = apps.get_model("django_unittest_project", "MaintenanceLog")
+    Vehicle = apps.get_model("django_unittest_project", "Vehicle")
+    logs = MaintenanceLog.objects.filter(vehicle=models.OuterRef("pk")).values(
+        "vehicle",
+    )
+    Vehicle.objects.update(
+        maintenance_cost_total=Coalesce(
+            models.Subquery(logs.annotate(total=models.Sum("cost")).values("total")),
+            Decimal(0),
+            output_field=models.DecimalField(max_digits=14, decimal_places=2),
+        ),
+        maintenance_log_count=Coalesce(
+            models.Subquery(logs.annotate(count=models.Count("pk")).values("count")),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_unittest_project', '0002_routeefficiency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicle',
+            name='maintenance_cost_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='vehicle',
+            name='maintenance_log_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_maintenance_totals, migrations.RunPython.noop),
+    ]
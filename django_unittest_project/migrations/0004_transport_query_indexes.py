@@ -0,0 +1,38 @@
+# Generated by Django 4.2.14 on 2026-10-17 20:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_unittest_project', '0003_vehicle_maintenance_totals'),
+    ]
+
+    # The composite indexes are created before dropping the single column foreign
+    # key indexes they make redundant, so lookups stay indexed in between.
+    operations = [
+        migrations.AddIndex(
+            model_name='maintenancelog',
+            index=models.Index(fields=['vehicle', '-maintenance_date', '-id'], name='maintenancelog_vehicle_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='routeassignment',
+            index=models.Index(fields=['route', 'start_time'], include=('vehicle',), name='routeassignment_route_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vehicle',
+            index=models.Index(fields=['id'], include=('capacity',), name='vehicle_capacity_idx'),
+        ),
+        migrations.AlterField(
+            model_name='maintenancelog',
+            name='vehicle',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='django_unittest_project.vehicle'),
+        ),
+        migrations.AlterField(
+            model_name='routeassignment',
+            name='route',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='django_unittest_project.route'),
+        ),
+    ]
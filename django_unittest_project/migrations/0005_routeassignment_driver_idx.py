@@ -0,0 +1,17 @@
+# Generated by Django 4.2.14 on 2026-10-17 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_unittest_project', '0004_transport_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='routeassignment',
+            index=models.Index(fields=['driver_name', 'start_time'], name='routeassignment_driver_idx'),
+        ),
+    ]
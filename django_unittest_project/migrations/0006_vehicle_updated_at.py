@@ -0,0 +1,18 @@
+# Generated by Django 4.2.14 on 2026-10-17 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_unittest_project', '0005_routeassignment_driver_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicle',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
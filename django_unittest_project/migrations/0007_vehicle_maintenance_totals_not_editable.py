@@ -0,0 +1,24 @@
+# Generated by Django 4.2.14 on 2026-10-17 21:17
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_unittest_project', '0006_vehicle_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vehicle',
+            name='maintenance_cost_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0'), editable=False, max_digits=14),
+        ),
+        migrations.AlterField(
+            model_name='vehicle',
+            name='maintenance_log_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,11 +1,75 @@
+import dataclasses as dc
+from decimal import Decimal
 from typing import TYPE_CHECKING
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Now
 from django.core.exceptions import ValidationError
 
 if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import Iterable
+
     from django.db.models.manager import RelatedManager
 
 
+@dc.dataclass(frozen=True)
+class CapacityRule:
+    max_capacity: int
+    plural: str
+
+    @property
+    def message(self) -> str:
+        return f"{self.plural} cannot have a capacity greater than {self.max_capacity}."
+
+
+# Capacity limit of each vehicle type, types without one are absent. Checked one
+# vehicle at a time by `Vehicle.clean` and over whole columns by
+# `imports.validate_vehicles`.
+CAPACITY_RULES = {
+    "BUS": CapacityRule(max_capacity=100, plural="Buses"),
+    "TRAM": CapacityRule(max_capacity=250, plural="Trams"),
+}
+# Only ever incremented in the database, see `Vehicle.save`
+MAINTENANCE_TOTAL_FIELDS = frozenset(
+    ("maintenance_cost_total", "maintenance_log_count"),
+)
+
+
+class VehicleQuerySet(models.QuerySet):
+    def maintenance_drifted(self) -> "VehicleQuerySet":
+        """Vehicles whose maintenance totals disagree with their logs."""
+        return self.annotate(
+            actual_cost_total=Coalesce(
+                models.Sum("maintenancelog__cost"),
+                Decimal(0),
+                output_field=models.DecimalField(max_digits=14, decimal_places=2),
+            ),
+            actual_log_count=models.Count("maintenancelog"),
+        ).exclude(
+            maintenance_cost_total=models.F("actual_cost_total"),
+            maintenance_log_count=models.F("actual_log_count"),
+        )
+
+    def reconcile_maintenance_totals(self) -> int:
+        """Recompute the maintenance totals from the logs with a single `UPDATE`."""
+        logs = MaintenanceLog.objects.filter(vehicle=models.OuterRef("pk")).values(
+            "vehicle",
+        )
+        return self.update(
+            maintenance_cost_total=Coalesce(
+                models.Subquery(logs.annotate(total=models.Sum("cost")).values("total")),
+                Decimal(0),
+                output_field=models.DecimalField(max_digits=14, decimal_places=2),
+            ),
+            maintenance_log_count=Coalesce(
+                models.Subquery(logs.annotate(count=models.Count("pk")).values("count")),
+                0,
+            ),
+            updated_at=Now(),
+        )
+
+
 class Vehicle(models.Model):
     TYPES = [
         ("BUS", "Bus"),
@@ -16,16 +80,68 @@ class Vehicle(models.Model):
     type = models.CharField(max_length=6, choices=TYPES)
     capacity = models.PositiveIntegerField()
     last_maintenance = models.DateField()
+    # Running totals of the vehicle's `MaintenanceLog`s, see `signals.py`
+    maintenance_cost_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal(0),
+        editable=False,
+    )
+    maintenance_log_count = models.PositiveIntegerField(default=0, editable=False)
+    # Last change of the vehicle or of its maintenance logs. Querysets' `update()`
+    # does not set it, it has to be passed along.
+    updated_at = models.DateTimeField(auto_now=True)
 
-    def clean(self):
-        if self.type == "BUS" and self.capacity > 100:
-            raise ValidationError("Buses cannot have a capacity greater than 100.")
-        elif self.type == "TRAM" and self.capacity > 250:
-            raise ValidationError("Trams cannot have a capacity greater than 250.")
+    objects = VehicleQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Lets the capacity aggregations joining from `RouteAssignment` read
+            # `capacity` with an index-only scan
+            models.Index(
+                fields=["id"],
+                include=["capacity"],
+                name="vehicle_capacity_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_type_display()} - {self.vehicle_id}"
 
+    def save(self, *args, **kwargs):
+        """Save the vehicle, leaving out its maintenance totals unless asked.
+
+        The totals an instance holds are as old as the instance, writing them back
+        would undo the logs added since it was loaded. They are only written when
+        inserting or when listed in `update_fields`.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in MAINTENANCE_TOTAL_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def clean(self):
+        rule = CAPACITY_RULES.get(self.type)
+        if rule is not None and self.capacity > rule.max_capacity:
+            raise ValidationError(rule.message)
+
+
+class RouteQuerySet(models.QuerySet):
+    def with_efficiency(self) -> "RouteQuerySet":
+        """Annotate each route with the capacity figures of its assignments.
+
+        Every figure is computed by the same grouped query, so the cost does not
+        depend on how many routes are selected.
+        """
+        return self.annotate(
+            total_capacity=models.Sum("routeassignment__vehicle__capacity"),
+            average_capacity=models.Avg("routeassignment__vehicle__capacity"),
+            assignment_count=models.Count("routeassignment"),
+        )
+
 
 class Route(models.Model):
     routeassignment_set: "RelatedManager[RouteAssignment]"
@@ -35,33 +151,175 @@ class Route(models.Model):
     end_point = models.CharField(max_length=100)
     vehicles = models.ManyToManyField(Vehicle, through="RouteAssignment")
 
+    objects = RouteQuerySet.as_manager()
+
     def __str__(self):
         return f"Route {self.route_number}: {self.start_point} to {self.end_point}"
 
 
+class RouteAssignmentQuerySet(models.QuerySet):
+    def timetable(self) -> "RouteAssignmentQuerySet":
+        """Load the assignments with their vehicles in one joined query.
+
+        Only the columns shown in a route timetable are fetched, including the ones
+        `Vehicle.__str__` needs. `route` is kept so the reverse related manager can
+        attach the known route without reloading it.
+        """
+        return (
+            self.select_related("vehicle")
+            .only(
+                "route",
+                "driver_name",
+                "start_time",
+                "end_time",
+                "vehicle__vehicle_id",
+                "vehicle__type",
+            )
+            .order_by("start_time")
+        )
+
+    def overlapping(
+        self,
+        start_time: "dt.time",
+        end_time: "dt.time",
+    ) -> "RouteAssignmentQuerySet":
+        """Assignments sharing at least a minute with `[start_time, end_time)`."""
+        return self.filter(start_time__lt=end_time, end_time__gt=start_time)
+
+
 class RouteAssignment(models.Model):
     vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE)
-    route = models.ForeignKey(Route, on_delete=models.CASCADE)
+    # Indexed by `routeassignment_route_idx`
+    route = models.ForeignKey(Route, on_delete=models.CASCADE, db_index=False)
     driver_name = models.CharField(max_length=100)
     start_time = models.TimeField()
     end_time = models.TimeField()
 
+    objects = RouteAssignmentQuerySet.as_manager()
+
     class Meta:
         unique_together = ["vehicle", "start_time", "end_time"]
+        indexes = [
+            # Serves route timetables in order and, through the included vehicle,
+            # the per-route capacity aggregation without visiting the table
+            models.Index(
+                fields=["route", "start_time"],
+                include=["vehicle"],
+                name="routeassignment_route_idx",
+            ),
+            # Serves the driver overlap checks, the vehicle ones use the
+            # `unique_together` index
+            models.Index(
+                fields=["driver_name", "start_time"],
+                name="routeassignment_driver_idx",
+            ),
+        ]
 
     def clean(self):
         if self.start_time >= self.end_time:
             raise ValidationError("End time must be after start time.")
 
+        overlapping = RouteAssignment.objects.overlapping(
+            self.start_time, self.end_time,
+        ).exclude(pk=self.pk)
+        if self.vehicle_id is not None and overlapping.filter(
+            vehicle_id=self.vehicle_id,
+        ).exists():
+            msg = "The vehicle is already assigned at that time."
+            raise ValidationError(msg)
+        if overlapping.filter(driver_name=self.driver_name).exists():
+            msg = "The driver is already assigned at that time."
+            raise ValidationError(msg)
+
     def __str__(self):
         return f"{self.vehicle} on {self.route} ({self.start_time}-{self.end_time})"
 
 
+class RouteEfficiencyQuerySet(models.QuerySet):
+    def refresh(self, route_ids: "Iterable[int] | None" = None) -> None:
+        """Recompute the rollups of the given routes, or of every route if omitted.
+
+        Only the assignments of the selected routes are aggregated, so keeping the
+        rollups of a batch of changes current costs one indexed grouped query.
+        """
+        routes = Route.objects.all()
+        if route_ids is not None:
+            routes = routes.filter(pk__in=set(route_ids))
+        rollups = [
+            RouteEfficiency(
+                route_id=route.pk,
+                total_capacity=route.total_capacity or 0,
+                assignment_count=route.assignment_count,
+            )
+            for route in routes.with_efficiency().iterator(chunk_size=2000)
+        ]
+        self.bulk_create(
+            rollups,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["route"],
+            update_fields=["total_capacity", "assignment_count"],
+        )
+
+    def drifted(self) -> "list[int]":
+        """Return the pks of the routes whose rollup disagrees with the assignments."""
+        stored = {
+            route_id: (total_capacity, assignment_count)
+            for route_id, total_capacity, assignment_count in self.values_list(
+                "route_id", "total_capacity", "assignment_count",
+            ).iterator(chunk_size=2000)
+        }
+        routes = Route.objects.with_efficiency().values_list(
+            "pk", "total_capacity", "assignment_count",
+        )
+        return [
+            route_id
+            for route_id, total_capacity, assignment_count in routes.iterator(
+                chunk_size=2000,
+            )
+            if stored.get(route_id) != (total_capacity or 0, assignment_count)
+        ]
+
+
+class RouteEfficiency(models.Model):
+    """Per-route capacity rollup kept current by the signals in `signals.py`."""
+
+    route = models.OneToOneField(
+        Route,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="efficiency",
+    )
+    total_capacity = models.PositiveBigIntegerField(default=0)
+    assignment_count = models.PositiveIntegerField(default=0)
+
+    objects = RouteEfficiencyQuerySet.as_manager()
+
+    @property
+    def average_capacity(self) -> float | None:
+        if not self.assignment_count:
+            return None
+        return self.total_capacity / self.assignment_count
+
+    def __str__(self):
+        return f"Efficiency of {self.route}"
+
+
 class MaintenanceLog(models.Model):
-    vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE)
+    # Indexed by `maintenancelog_vehicle_idx`
+    vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE, db_index=False)
     maintenance_date = models.DateField()
     description = models.TextField()
     cost = models.DecimalField(max_digits=10, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            # Matches the keyset pagination of a vehicle's maintenance history
+            models.Index(
+                fields=["vehicle", "-maintenance_date", "-id"],
+                name="maintenancelog_vehicle_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"Maintenance for {self.vehicle} on {self.maintenance_date}"
@@ -0,0 +1,145 @@
+import base64
+import binascii
+import dataclasses as dc
+import json
+from typing import TYPE_CHECKING
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import BadRequest
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.db.models import QuerySet
+    from django.http import HttpRequest
+
+# Below this many rows the planner statistics are too coarse to be worth it and an
+# exact `COUNT(*)` is cheap anyway.
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+
+class InvalidCursorError(BadRequest):
+    pass
+
+
+@dc.dataclass
+class KeysetPage:
+    object_list: list[Any]
+    page_size: int
+    next_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+    """Seek pagination over a queryset ordered by a unique combination of fields.
+
+    Each page is fetched with a `WHERE (key) > (last key)` predicate instead of an
+    `OFFSET`, so deep pages cost the same as the first one and rows inserted while
+    paginating never shift the page boundaries. `ordering` follows the `order_by`
+    syntax and must end with a unique field, e.g. `("-maintenance_date", "-id")`.
+    """
+
+    def __init__(
+        self,
+        queryset: "QuerySet",
+        ordering: "Sequence[str]",
+        page_size: int,
+    ) -> None:
+        self.queryset = queryset.order_by(*ordering)
+        self.ordering = tuple(ordering)
+        self.page_size = page_size
+
+    def get_page(self, cursor: str | None = None) -> KeysetPage:
+        return self.__make_page(list(self.__page_queryset(cursor)))
+
+    async def aget_page(self, cursor: str | None = None) -> KeysetPage:
+        return self.__make_page([obj async for obj in self.__page_queryset(cursor)])
+
+    def __page_queryset(self, cursor: str | None) -> "QuerySet":
+        queryset = self.queryset
+        if cursor:
+            try:
+                queryset = queryset.filter(self.__seek(self.decode_cursor(cursor)))
+            except (TypeError, ValueError, ValidationError) as e:
+                msg = "Invalid cursor."
+                raise InvalidCursorError(msg) from e
+        return queryset[: self.page_size + 1]
+
+    def __make_page(self, object_list: list[Any]) -> KeysetPage:
+        page = KeysetPage(
+            object_list=object_list[: self.page_size],
+            page_size=self.page_size,
+        )
+        if len(object_list) > self.page_size:
+            page.next_cursor = self.encode_cursor(page.object_list[-1])
+        return page
+
+    def encode_cursor(self, obj: Any) -> str:
+        values = [getattr(obj, field.lstrip("-")) for field in self.ordering]
+        payload = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> list[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            msg = "Invalid cursor."
+            raise InvalidCursorError(msg) from e
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            msg = "Invalid cursor."
+            raise InvalidCursorError(msg)
+        return values
+
+    def __seek(self, values: "Sequence[Any]") -> Q:
+        # (a, b) after (x, y) <=> a after x OR (a = x AND b after y)
+        predicate = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal_prefix = {
+                prefix.lstrip("-"): value
+                for prefix, value in zip(self.ordering[:index], values, strict=False)
+            }
+            predicate |= Q(**equal_prefix, **{f"{name}__{lookup}": values[index]})
+        return predicate
+
+
+def get_page_size(request: "HttpRequest", default: int, maximum: int) -> int:
+    try:
+        page_size = int(request.GET.get("page_size", default))
+    except ValueError as e:
+        msg = "page_size must be an integer."
+        raise BadRequest(msg) from e
+    return max(1, min(page_size, maximum))
+
+
+def estimate_count(queryset: "QuerySet") -> int:
+    """Count the rows of an unfiltered queryset, estimating it on large tables.
+
+    On PostgreSQL the row count kept by `ANALYZE` in `pg_class.reltuples` is used
+    once it passes `ESTIMATED_COUNT_THRESHOLD`, which avoids a sequential scan of
+    the whole table. Filtered querysets and other databases fall back to `count()`.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql" and not queryset.query.has_filters():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],  # noqa: SLF001
+            )
+            row = cursor.fetchone()
+        if row is not None and row[0] >= ESTIMATED_COUNT_THRESHOLD:
+            return row[0]
+    return queryset.count()
+
+
+async def aestimate_count(queryset: "QuerySet") -> int:
+    return await sync_to_async(estimate_count)(queryset)
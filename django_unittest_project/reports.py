@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+from typing import Any
+
+from .models import RouteEfficiency
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Iterator
+
+
+class RouteEfficiencyReport:
+    """Streams one efficiency row per route out of the `RouteEfficiency` rollup.
+
+    Rows are produced lazily through a server-side cursor, so rendering the report
+    keeps a bounded number of routes in memory. Each iteration re-runs the query.
+    The report can be iterated with `async for` as well.
+    """
+
+    chunk_size = 2000
+
+    def __iter__(self) -> "Iterator[dict[str, Any]]":
+        for rollup in self.__rollups().iterator(chunk_size=self.chunk_size):
+            yield self.__row(rollup)
+
+    async def __aiter__(self) -> "AsyncIterator[dict[str, Any]]":
+        async for rollup in self.__rollups().aiterator(chunk_size=self.chunk_size):
+            yield self.__row(rollup)
+
+    def __rollups(self):
+        return RouteEfficiency.objects.select_related("route").order_by("route")
+
+    def __row(self, rollup: RouteEfficiency) -> dict[str, Any]:
+        return {
+            "route": rollup.route,
+            "total_capacity": rollup.total_capacity,
+            "average_capacity": rollup.average_capacity,
+            "assignment_count": rollup.assignment_count,
+        }
@@ -0,0 +1,115 @@
+import dataclasses as dc
+import datetime as dt
+import heapq
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+from django.db.models import Sum
+from django.db.models.functions import ExtractHour
+from django.db.models.functions import ExtractMinute
+
+from .models import RouteAssignment
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+MINUTES_PER_DAY = 24 * 60
+
+# Assignments are conflicting when they share one of these fields and overlap
+CONFLICT_KEYS = {"vehicle": "vehicle_id", "driver": "driver_name"}
+
+
+@dc.dataclass(frozen=True)
+class Conflict:
+    kind: str
+    key: Any
+    first_id: int
+    second_id: int
+    overlap_start: dt.time
+    overlap_end: dt.time
+
+
+def find_conflicts(
+    kind: str,
+    rows: "Iterable[tuple[Any, int, dt.time, dt.time]]",
+) -> "Iterator[Conflict]":
+    """Sweep `(key, pk, start_time, end_time)` rows sorted by key then start time.
+
+    The assignments still running when each one starts are kept in a heap ordered
+    by end time, so every pair of overlapping assignments of a key is found in
+    O(n log n + conflicts) instead of comparing all pairs. Shifts are half-open: one
+    may start at the minute the previous one ends.
+    """
+    active: list[tuple[dt.time, int]] = []
+    current_key = None
+    for key, pk, start_time, end_time in rows:
+        if key != current_key:
+            active = []
+            current_key = key
+        while active and active[0][0] <= start_time:
+            heapq.heappop(active)
+        for other_end_time, other_pk in active:
+            yield Conflict(
+                kind=kind,
+                key=key,
+                first_id=other_pk,
+                second_id=pk,
+                overlap_start=start_time,
+                overlap_end=min(end_time, other_end_time),
+            )
+        heapq.heappush(active, (end_time, pk))
+
+
+def schedule_conflicts(chunk_size: int = 2000) -> "Iterator[Conflict]":
+    """Every vehicle conflict of the fleet, then every driver conflict.
+
+    The rows are streamed in the order of the `(vehicle, start_time, end_time)`
+    and `(driver_name, start_time)` indexes, so no sort happens in memory.
+    """
+    for kind, field in CONFLICT_KEYS.items():
+        rows = (
+            RouteAssignment.objects.order_by(field, "start_time")
+            .values_list(field, "pk", "start_time", "end_time")
+            .iterator(chunk_size=chunk_size)
+        )
+        yield from find_conflicts(kind, rows)
+
+
+def _minute_of_day(field: str):
+    return ExtractHour(field) * 60 + ExtractMinute(field)
+
+
+def _capacity_by_minute(field: str) -> np.ndarray:
+    """Capacity of the assignments whose `field` falls on each minute of the day.
+
+    Grouped by the database, so at most one row per minute is loaded whatever the
+    number of assignments.
+    """
+    rows = (
+        RouteAssignment.objects.annotate(minute=_minute_of_day(field))
+        .order_by()
+        .values("minute")
+        .annotate(capacity=Sum("vehicle__capacity"))
+        .values_list("minute", "capacity")
+    )
+    minutes, capacities = np.array(list(rows), dtype=np.int64).reshape(-1, 2).T
+    return np.bincount(minutes, weights=capacities, minlength=MINUTES_PER_DAY + 1)
+
+
+def occupancy_timeline() -> np.ndarray:
+    """Total capacity of the vehicles on the road at each minute of the day.
+
+    An assignment puts its vehicle's capacity on the road during the minutes of
+    `[start_time, end_time)`. The timeline is the running sum of the capacity added
+    at each start minute and removed at each end minute, both summed per minute in
+    SQL, so the work in Python is one pass over the minutes of the day.
+    """
+    changes = _capacity_by_minute("start_time") - _capacity_by_minute("end_time")
+    return np.cumsum(changes[:MINUTES_PER_DAY]).astype(np.int64)
+
+
+def bucket_peaks(timeline: np.ndarray, bucket_minutes: int) -> np.ndarray:
+    """The peak of each `bucket_minutes` bucket, which must divide the day."""
+    return timeline.reshape(-1, bucket_minutes).max(axis=1)
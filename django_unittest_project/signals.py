@@ -0,0 +1,198 @@
+# ruff: noqa: SLF001
+from decimal import Decimal
+
+from django.db.backends.signals import connection_created
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import PositiveBigIntegerField
+from django.db.models import Subquery
+from django.db.models.functions import Now
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from .caching import ROUTE_ASSIGNMENTS
+from .caching import ROUTE_DETAIL
+from .caching import VEHICLES
+from .caching import bump_version
+from .metrics import execute_wrapper
+from .models import MaintenanceLog
+from .models import Route
+from .models import RouteAssignment
+from .models import RouteEfficiency
+from .models import Vehicle
+
+
+@receiver(post_save, sender=Route)
+def create_route_efficiency(sender, instance: "Route", **kwargs):
+    if kwargs["created"]:
+        RouteEfficiency.objects.refresh([instance.pk])
+
+
+def _add_to_route_efficiency(route_id: int, vehicle_id: int, count: int) -> int:
+    """Add `count` assignments of the vehicle to the rollup of the route.
+
+    A negative `count` removes them. The totals are incremented in place rather than
+    recomputed, so concurrent writers to the same route do not overwrite each other's
+    changes. Returns 0 if the route has no rollup.
+    """
+    capacity = Subquery(
+        Vehicle.objects.filter(pk=vehicle_id).values("capacity"),
+        output_field=PositiveBigIntegerField(),
+    )
+    return RouteEfficiency.objects.filter(route_id=route_id).update(
+        total_capacity=F("total_capacity") + count * capacity,
+        assignment_count=F("assignment_count") + count,
+    )
+
+
+@receiver(pre_save, sender=RouteAssignment)
+def remember_previous_route_vehicle(sender, instance: "RouteAssignment", **kwargs):
+    instance._previous_route_vehicle = (  # type: ignore[attr-defined]
+        None
+        if instance._state.adding
+        else RouteAssignment.objects.filter(pk=instance.pk)
+        .values_list("route_id", "vehicle_id")
+        .first()
+    )
+
+
+@receiver(post_save, sender=RouteAssignment)
+def add_assignment_to_route_efficiency(
+    sender,
+    instance: "RouteAssignment",
+    **kwargs,
+):
+    previous = getattr(instance, "_previous_route_vehicle", None)
+    if previous == (instance.route_id, instance.vehicle_id):
+        # Only the times changed, which the rollup does not depend on
+        return
+    if previous is not None:
+        _add_to_route_efficiency(*previous, -1)
+    if not _add_to_route_efficiency(instance.route_id, instance.vehicle_id, 1):
+        # Routes created by `bulk_create` get no rollup until the next refresh
+        RouteEfficiency.objects.refresh([instance.route_id])
+
+
+@receiver(post_delete, sender=RouteAssignment)
+def remove_assignment_from_route_efficiency(
+    sender,
+    instance: "RouteAssignment",
+    **kwargs,
+):
+    # Deleting the route cascades here after its rollup is gone, nothing is updated
+    _add_to_route_efficiency(instance.route_id, instance.vehicle_id, -1)
+
+
+@receiver(pre_save, sender=Vehicle)
+def remember_previous_capacity(sender, instance: "Vehicle", **kwargs):
+    update_fields = kwargs.get("update_fields")
+    instance._previous_capacity = (  # type: ignore[attr-defined]
+        None
+        if instance._state.adding
+        or (update_fields is not None and "capacity" not in update_fields)
+        else Vehicle.objects.filter(pk=instance.pk)
+        .values_list("capacity", flat=True)
+        .first()
+    )
+
+
+def _capacity_changed(instance: "Vehicle") -> bool:
+    previous_capacity = getattr(instance, "_previous_capacity", None)
+    return previous_capacity is not None and previous_capacity != instance.capacity
+
+
+@receiver(post_save, sender=Vehicle)
+def update_vehicle_route_efficiency(sender, instance: "Vehicle", **kwargs):
+    if not _capacity_changed(instance):
+        return
+    delta = instance.capacity - instance._previous_capacity  # type: ignore[attr-defined]
+    # One `UPDATE` over the routes of the vehicle, each grown by the capacity change
+    # times the number of times the vehicle is assigned to it
+    assignments = (
+        RouteAssignment.objects.filter(vehicle=instance, route=OuterRef("route"))
+        .values("route")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    RouteEfficiency.objects.filter(
+        route__in=RouteAssignment.objects.filter(vehicle=instance).values("route"),
+    ).update(
+        total_capacity=F("total_capacity")
+        + delta * Subquery(assignments, output_field=PositiveBigIntegerField()),
+    )
+
+
+def _add_to_maintenance_totals(vehicle_id: int, cost: Decimal, count: int) -> None:
+    # `updated_at` validates the vehicle's maintenance page, see `views.py`
+    Vehicle.objects.filter(pk=vehicle_id).update(
+        maintenance_cost_total=F("maintenance_cost_total") + cost,
+        maintenance_log_count=F("maintenance_log_count") + count,
+        updated_at=Now(),
+    )
+
+
+@receiver(pre_save, sender=MaintenanceLog)
+def remember_previous_maintenance_log(sender, instance: "MaintenanceLog", **kwargs):
+    instance._previous_vehicle_cost = (  # type: ignore[attr-defined]
+        None
+        if instance._state.adding
+        else MaintenanceLog.objects.filter(pk=instance.pk)
+        .values_list("vehicle_id", "cost")
+        .first()
+    )
+
+
+@receiver(post_save, sender=MaintenanceLog)
+def add_maintenance_log_to_totals(sender, instance: "MaintenanceLog", **kwargs):
+    previous = getattr(instance, "_previous_vehicle_cost", None)
+    if previous is not None:
+        previous_vehicle_id, previous_cost = previous
+        _add_to_maintenance_totals(previous_vehicle_id, -previous_cost, -1)
+    _add_to_maintenance_totals(instance.vehicle_id, Decimal(str(instance.cost)), 1)
+
+
+@receiver(post_delete, sender=MaintenanceLog)
+def remove_maintenance_log_from_totals(
+    sender,
+    instance: "MaintenanceLog",
+    **kwargs,
+):
+    _add_to_maintenance_totals(instance.vehicle_id, -Decimal(str(instance.cost)), -1)
+
+
+@receiver(post_save, sender=Route)
+@receiver(post_delete, sender=Route)
+@receiver(post_save, sender=RouteAssignment)
+@receiver(post_delete, sender=RouteAssignment)
+@receiver(post_save, sender=Vehicle)
+@receiver(post_delete, sender=Vehicle)
+def invalidate_route_detail(sender, **kwargs):
+    bump_version(ROUTE_DETAIL)
+
+
+@receiver(post_save, sender=RouteAssignment)
+@receiver(post_delete, sender=RouteAssignment)
+def invalidate_route_assignments(sender, **kwargs):
+    bump_version(ROUTE_ASSIGNMENTS)
+
+
+@receiver(post_save, sender=Vehicle)
+@receiver(post_delete, sender=Vehicle)
+def invalidate_vehicles(sender, **kwargs):
+    bump_version(VEHICLES)
+
+
+@receiver(post_save, sender=Vehicle)
+def invalidate_vehicle_capacity(sender, instance: "Vehicle", **kwargs):
+    if _capacity_changed(instance):
+        bump_version(ROUTE_ASSIGNMENTS)
+
+
+@receiver(connection_created)
+def meter_queries(sender, connection, **kwargs):
+    # Connections are reopened on the same wrapper, install the wrapper once
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(execute_wrapper)
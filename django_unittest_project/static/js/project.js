@@ -1 +1,18 @@
 /* Project specific Javascript goes here. */
+
+// Replace the "Show details" links of the maintenance history with the full
+// description, which is left out of the page to keep it small.
+document.addEventListener('click', async (event) => {
+  const link = event.target.closest('a[data-maintenance-description]');
+  if (!link) {
+    return;
+  }
+  event.preventDefault();
+  const response = await fetch(link.href, {
+    headers: { Accept: 'application/json' },
+  });
+  if (response.ok) {
+    const { description } = await response.json();
+    link.replaceWith(document.createTextNode(description));
+  }
+});
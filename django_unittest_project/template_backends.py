@@ -0,0 +1,82 @@
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.template import TemplateSyntaxError
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.template.backends.django import Template
+
+from .metrics import timing
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.template import Engine
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = (".html", ".txt")
+
+
+class MeteredTemplate(Template):
+    def render(self, context=None, request=None):
+        with timing("template_ms"):
+            return super().render(context, request)
+
+
+class MeteredDjangoTemplates(DjangoTemplates):
+    """`DjangoTemplates` adding render times to the current `RequestMetrics`.
+
+    Templates included from a template are rendered by the engine directly, so
+    only top-level renders are timed and nested ones are not counted twice.
+    """
+
+    def from_string(self, template_code):
+        template = super().from_string(template_code)
+        return MeteredTemplate(template.template, self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return MeteredTemplate(template.template, self)
+
+
+def warm_up_templates() -> int:
+    """Compile every template of the Django template engines ahead of the requests.
+
+    With the cached loader Django uses by default, the compiled templates are kept
+    for the life of the process, so renders never read or stat a template file
+    afterwards. Run from the WSGI/ASGI modules, i.e. in the gunicorn master before
+    the workers are forked when the application is preloaded. Templates that do not
+    compile are skipped. Returns the number of templates compiled.
+    """
+    compiled = 0
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for template_name in _template_names(backend.engine):
+            try:
+                backend.engine.get_template(template_name)
+            except TemplateSyntaxError as e:
+                # e.g. templates of third-party features that are not installed
+                logger.info("Skipped template %s: %s", template_name, e)
+                continue
+            compiled += 1
+    return compiled
+
+
+def _template_names(engine: "Engine") -> "Iterator[str]":
+    seen = set()
+    for loader in engine.template_loaders:
+        # The cached loader delegates to the loaders it wraps
+        for inner_loader in getattr(loader, "loaders", [loader]):
+            for directory in map(Path, inner_loader.get_dirs()):
+                for path in sorted(directory.rglob("*")):
+                    template_name = path.relative_to(directory).as_posix()
+                    if (
+                        path.suffix in TEMPLATE_SUFFIXES
+                        and path.is_file()
+                        and template_name not in seen
+                    ):
+                        seen.add(template_name)
+                        yield template_name
@@ -0,0 +1,352 @@
+import csv
+import dataclasses as dc
+import itertools
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.core.exceptions import ValidationError
+from django.core.management.color import no_style
+from django.db import connection
+from django.db import models
+from django.db import transaction
+
+from .caching import ROUTE_ASSIGNMENTS
+from .caching import ROUTE_DETAIL
+from .caching import VEHICLES
+from .caching import bump_version
+from .models import MaintenanceLog
+from .models import Route
+from .models import RouteAssignment
+from .models import RouteEfficiency
+from .models import Vehicle
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+FORMATS = ("csv", "parquet")
+# Bytes read from a CSV file per write to `COPY ... FROM STDIN`
+COPY_BLOCK_SIZE = 1 << 20
+
+
+@dc.dataclass(frozen=True)
+class Table:
+    """A transport table, stored in `<name>.<format>` with one column per field."""
+
+    name: str
+    model: type[models.Model]
+
+    @property
+    def fields(self) -> list[models.Field]:
+        return list(self.model._meta.concrete_fields)  # noqa: SLF001
+
+    def path(self, directory: Path, file_format: str) -> Path:
+        return directory / f"{self.name}.{file_format}"
+
+
+# In dependency order, so the foreign keys of a table point to rows already loaded.
+# `RouteEfficiency` is derived and rebuilt after an import instead.
+TABLES = {
+    table.name: table
+    for table in (
+        Table("vehicles", Vehicle),
+        Table("routes", Route),
+        Table("route_assignments", RouteAssignment),
+        Table("maintenance_logs", MaintenanceLog),
+    )
+}
+
+
+@dc.dataclass
+class TransferResult:
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def export_tables(
+    directory: Path,
+    file_format: str,
+    tables: "Iterable[str]" = TABLES,
+    batch_size: int = 5000,
+) -> list[TransferResult]:
+    """Write each table to `directory`, streaming `batch_size` rows at a time.
+
+    On PostgreSQL the tables are read from one repeatable-read snapshot, so the
+    files agree with one another, and CSV files are written by `COPY ... TO
+    STDOUT`.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    snapshot = connection.vendor == "postgresql" and not connection.in_atomic_block
+    with transaction.atomic():
+        if snapshot:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY",
+                )
+        return [
+            _timed(
+                name,
+                _EXPORTERS[file_format],
+                TABLES[name],
+                TABLES[name].path(directory, file_format),
+                batch_size,
+            )
+            for name in tables
+        ]
+
+
+def import_tables(
+    directory: Path,
+    file_format: str,
+    tables: "Iterable[str]" = TABLES,
+    batch_size: int = 5000,
+) -> list[TransferResult]:
+    """Load each table from `directory`, streaming `batch_size` rows at a time.
+
+    Rows keep the pks of their files, so the foreign keys of a dump still match.
+    Everything is loaded in one transaction: on PostgreSQL with `COPY ... FROM
+    STDIN`, elsewhere with `bulk_create`. Neither sends signals, so the route
+    rollups and the maintenance totals are rebuilt at the end.
+    """
+    names = [name for name in TABLES if name in set(tables)]
+    with transaction.atomic():
+        results = [
+            _timed(
+                name,
+                _IMPORTERS[file_format],
+                TABLES[name],
+                TABLES[name].path(directory, file_format),
+                batch_size,
+            )
+            for name in names
+        ]
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(),
+                [TABLES[name].model for name in names],
+            ):
+                cursor.execute(sql)
+        if {"vehicles", "maintenance_logs"} & set(names):
+            Vehicle.objects.reconcile_maintenance_totals()
+        if {"vehicles", "routes", "route_assignments"} & set(names):
+            RouteEfficiency.objects.refresh()
+
+    bump_version(ROUTE_DETAIL)
+    bump_version(ROUTE_ASSIGNMENTS)
+    bump_version(VEHICLES)
+    return results
+
+
+def copy_rows(
+    model: type[models.Model],
+    fields: "Sequence[str]",
+    rows: "Iterable[Sequence[Any]]",
+    batch_size: int,
+) -> int:
+    """Insert `rows` of `fields` values and return how many there were.
+
+    Streamed with `COPY` on PostgreSQL and inserted with one `bulk_create` per
+    `batch_size` rows elsewhere.
+    """
+    count = 0
+    if connection.vendor != "postgresql":
+        for chunk in chunked(rows, batch_size):
+            model.objects.bulk_create(
+                model(**dict(zip(fields, row, strict=True))) for row in chunk
+            )
+            count += len(chunk)
+        return count
+
+    opts = model._meta  # noqa: SLF001
+    columns = {field.attname: field.column for field in opts.concrete_fields}
+    statement = "COPY {} ({}) FROM STDIN".format(
+        connection.ops.quote_name(opts.db_table),
+        ", ".join(connection.ops.quote_name(columns[field]) for field in fields),
+    )
+    with connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+def chunked(iterable: "Iterable[Any]", size: int) -> "Iterator[list[Any]]":
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _timed(name: str, transfer, *args) -> TransferResult:
+    start = time.perf_counter()
+    rows = transfer(*args)
+    return TransferResult(name, rows, time.perf_counter() - start)
+
+
+def _header_fields(table: Table, header: "Sequence[str]", path: Path) -> list:
+    """The fields named by the columns of a file, in the file's order."""
+    by_column = {field.column: field for field in table.fields}
+    unknown = [column for column in header if column not in by_column]
+    if unknown:
+        msg = f"{path.name}: unknown column(s) {', '.join(unknown)}."
+        raise ValueError(msg)
+    return [by_column[column] for column in header]
+
+
+def _copy_statement(table: Table, fields: "Sequence[models.Field]", way: str) -> str:
+    return "COPY {} ({}) {} WITH (FORMAT csv{})".format(
+        connection.ops.quote_name(table.model._meta.db_table),  # noqa: SLF001
+        ", ".join(connection.ops.quote_name(field.column) for field in fields),
+        way,
+        ", HEADER true" if way == "TO STDOUT" else "",
+    )
+
+
+def _export_csv(table: Table, path: Path, batch_size: int) -> int:
+    if connection.vendor == "postgresql":
+        with path.open("wb") as file, connection.cursor() as cursor:
+            with cursor.copy(_copy_statement(table, table.fields, "TO STDOUT")) as copy:
+                for data in copy:
+                    file.write(data)
+            return cursor.rowcount
+
+    count = 0
+    with path.open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(field.column for field in table.fields)
+        rows = table.model.objects.values_list(
+            *(field.attname for field in table.fields),
+        ).iterator(chunk_size=batch_size)
+        for chunk in chunked(rows, batch_size):
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+def _import_csv(table: Table, path: Path, batch_size: int) -> int:
+    if connection.vendor == "postgresql":
+        with path.open("rb") as file:
+            # A header cannot span lines, the rows are left to `COPY` unparsed
+            header = next(csv.reader([file.readline().decode()]), [])
+            fields = _header_fields(table, header, path)
+            with connection.cursor() as cursor:
+                with cursor.copy(_copy_statement(table, fields, "FROM STDIN")) as copy:
+                    while data := file.read(COPY_BLOCK_SIZE):
+                        copy.write(data)
+                return cursor.rowcount
+
+    with path.open(newline="") as file:
+        reader = csv.reader(file)
+        fields = _header_fields(table, next(reader, []), path)
+        return copy_rows(
+            table.model,
+            [field.attname for field in fields],
+            _parse_csv_rows(fields, reader, path),
+            batch_size,
+        )
+
+
+def _parse_csv_rows(
+    fields: "Sequence[models.Field]",
+    reader: "Iterable[list[str]]",
+    path: Path,
+) -> "Iterator[list[Any]]":
+    for line, row in enumerate(reader, start=2):
+        try:
+            yield [
+                field.to_python(value) for field, value in zip(fields, row, strict=True)
+            ]
+        except (ValidationError, ValueError) as e:
+            reason = "; ".join(e.messages) if isinstance(e, ValidationError) else e
+            msg = f"{path.name}, line {line}: {reason}"
+            raise ValueError(msg) from e
+
+
+def _export_parquet(table: Table, path: Path, batch_size: int) -> int:
+    schema = pa.schema(
+        [(field.column, _arrow_type(field)) for field in table.fields],
+    )
+    rows = table.model.objects.values_list(
+        *(field.attname for field in table.fields),
+    ).iterator(chunk_size=batch_size)
+
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunked(rows, batch_size):
+            # One row group per chunk
+            writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array(values, type=arrow_type)
+                        for values, arrow_type in zip(
+                            zip(*chunk, strict=True),
+                            schema.types,
+                            strict=True,
+                        )
+                    ],
+                    schema=schema,
+                ),
+            )
+            count += len(chunk)
+    return count
+
+
+def _import_parquet(table: Table, path: Path, batch_size: int) -> int:
+    parquet_file = pq.ParquetFile(path)
+    fields = _header_fields(table, parquet_file.schema_arrow.names, path)
+    rows = (
+        row
+        for batch in parquet_file.iter_batches(batch_size=batch_size)
+        for row in zip(
+            *(column.to_pylist() for column in batch.columns),
+            strict=True,
+        )
+    )
+    return copy_rows(
+        table.model,
+        [field.attname for field in fields],
+        rows,
+        batch_size,
+    )
+
+
+def _arrow_type(field: models.Field) -> pa.DataType:
+    # Foreign keys are stored as the pk they point to
+    internal_type = (
+        field.target_field if field.is_relation else field
+    ).get_internal_type()
+    if internal_type in {
+        "AutoField",
+        "BigAutoField",
+        "BigIntegerField",
+        "IntegerField",
+        "PositiveBigIntegerField",
+        "PositiveIntegerField",
+    }:
+        return pa.int64()
+    if internal_type in {"CharField", "TextField"}:
+        return pa.string()
+    if internal_type == "DecimalField":
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if internal_type == "DateField":
+        return pa.date32()
+    if internal_type == "TimeField":
+        return pa.time64("us")
+    if internal_type == "DateTimeField":
+        return pa.timestamp("us", tz="UTC")
+    msg = f"No Parquet type for {internal_type} {field}."
+    raise NotImplementedError(msg)
+
+
+_EXPORTERS = {"csv": _export_csv, "parquet": _export_parquet}
+_IMPORTERS = {"csv": _import_csv, "parquet": _import_parquet}
@@ -0,0 +1,32 @@
+from allauth.account.auth_backends import AuthenticationBackend
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from .caching import user_cache_key
+
+
+class CachedUserMixin:
+    """Caches the user `get_user` loads for every authenticated request.
+
+    The user is kept for `USER_CACHE_TIMEOUT` seconds and dropped whenever it is
+    saved or deleted, see `users/signals.py`. Changes made with `update()` bypass
+    the signals and are only seen once the entry expires.
+    """
+
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+        return user
+
+
+class CachedModelBackend(CachedUserMixin, ModelBackend):
+    pass
+
+
+class CachedAuthenticationBackend(CachedUserMixin, AuthenticationBackend):
+    pass
@@ -0,0 +1,2 @@
+def user_cache_key(user_id) -> str:
+    return f"auth_user:{user_id}"
@@ -0,0 +1,82 @@
+import secrets
+
+import pytest
+from django.contrib import auth
+from django.test import Client
+from django.test import RequestFactory
+
+from django_unittest_project.users.backends import CachedAuthenticationBackend
+from django_unittest_project.users.backends import CachedModelBackend
+from django_unittest_project.users.models import User
+
+
+class TestCachedModelBackend:
+    def test_get_user_cached(self, user: User, django_assert_num_queries):
+        backend = CachedModelBackend()
+        backend.get_user(user.pk)
+
+        with django_assert_num_queries(0):
+            cached_user = backend.get_user(user.pk)
+
+        assert cached_user == user
+
+    def test_invalidated_on_save(self, user: User):
+        backend = CachedModelBackend()
+        backend.get_user(user.pk)
+        user.name = "Renamed"
+        user.save()
+
+        assert backend.get_user(user.pk).name == "Renamed"
+
+    def test_invalidated_on_delete(self, user: User):
+        backend = CachedModelBackend()
+        backend.get_user(user.pk)
+        user_id = user.pk
+        user.delete()
+
+        assert backend.get_user(user_id) is None
+
+    def test_inactive_user(self, user: User):
+        user.is_active = False
+        user.save()
+
+        assert CachedModelBackend().get_user(user.pk) is None
+
+
+def test_allauth_backend_shares_cache(user: User, django_assert_num_queries):
+    CachedModelBackend().get_user(user.pk)
+
+    with django_assert_num_queries(0):
+        assert CachedAuthenticationBackend().get_user(user.pk) == user
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "django.contrib.auth.backends.ModelBackend",
+        "allauth.account.auth_backends.AuthenticationBackend",
+    ],
+)
+def test_session_of_previous_backend(
+    user: User,
+    client: Client,
+    rf: RequestFactory,
+    backend: str,
+):
+    client.force_login(user, backend=backend)
+    request = rf.get("/")
+    request.session = client.session
+
+    assert auth.get_user(request) == user
+
+
+def test_login_uses_cached_backend(user: User):
+    password = secrets.token_urlsafe()
+    user.set_password(password)
+    user.save()
+
+    authenticated = auth.authenticate(email=user.email, password=password)
+
+    assert authenticated.backend == (
+        "django_unittest_project.users.backends.CachedModelBackend"
+    )
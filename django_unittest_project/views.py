@@ -1,14 +1,47 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import render, get_object_or_404
+from django.template.loader import render_to_string
 from django.views import View
-from django.db.models import Sum, Avg
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import condition, require_http_methods
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
-from .models import Vehicle, Route, MaintenanceLog
+from .caching import (
+    ROUTE_DETAIL,
+    VEHICLES,
+    get_version,
+    has_pending_messages,
+    occupancy_timeline_key,
+    page_etag,
+    render_fragments,
+    route_detail_key,
+    vehicle_row_key,
+)
+from .maintenance import SKIPPED_ROW
+from .maintenance import NotJSONArrayError
+from .maintenance import ingest_maintenance_logs
+from .maintenance import iter_json_array
+from .models import Vehicle, Route, RouteAssignment, MaintenanceLog
+from .pagination import KeysetPaginator, estimate_count, get_page_size
+from .reports import RouteEfficiencyReport
+from .scheduling import (
+    MINUTES_PER_DAY,
+    bucket_peaks,
+    occupancy_timeline,
+    schedule_conflicts,
+)
+import codecs
+import dataclasses as dc
+import functools
 import json
-from django.core.exceptions import ValidationError
+from django.core.exceptions import BadRequest, ValidationError
+
+# Bytes read from a bulk upload at a time
+BULK_READ_SIZE = 1 << 16
 
 
 class StaffRequiredMixin(UserPassesTestMixin):
@@ -16,32 +49,187 @@ class StaffRequiredMixin(UserPassesTestMixin):
         return self.request.user.is_staff
 
 
-class VehicleListView(LoginRequiredMixin, View):
+class ConditionalGetMixin:
+    """Answers `GET`s with `304 Not Modified` while `get_etag` is unchanged.
+
+    Subclasses override `get_etag`, which runs before the handler and is all a `304`
+    costs: it must change with anything the page shows, from cheap lookups such as
+    namespace versions or an `updated_at`. Pages with pending messages are never
+    validated, see `has_pending_messages`.
+    """
+
+    def get_etag(self, request, *args, **kwargs) -> str | None:
+        """The ETag of the page, or `None` when there is nothing to validate."""
+        return None
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD") or has_pending_messages(request):
+            return super().dispatch(request, *args, **kwargs)
+        return condition(etag_func=self.get_etag)(super().dispatch)(
+            request, *args, **kwargs
+        )
+
+
+class NDJSONExportView(LoginRequiredMixin, View):
+    """Streams the rows of `get_rows`, every row of `model` by default, as NDJSON.
+
+    Rows are read through a server-side cursor in chunks of `chunk_size`, so the
+    memory used does not grow with the size of the table.
+    """
+
+    model: type[models.Model]
+    fields: tuple[str, ...] = ()
+    chunk_size = 2000
+
     def get(self, request):
-        vehicles = Vehicle.objects.all()
-        return render(request, "vehicle_list.html", {"vehicles": vehicles})
+        return StreamingHttpResponse(
+            (json.dumps(row, cls=DjangoJSONEncoder) + "\n" for row in self.get_rows()),
+            content_type="application/x-ndjson",
+        )
 
+    def get_rows(self):
+        return (
+            self.model.objects.order_by("pk")
+            .values(*self.fields)
+            .iterator(chunk_size=self.chunk_size)
+        )
 
-class RouteDetailView(LoginRequiredMixin, View):
-    def get(self, request, route_number):
-        route = get_object_or_404(Route, route_number=route_number)
-        assignments = route.routeassignment_set.all().order_by("start_time")
+
+class VehicleExportView(NDJSONExportView):
+    model = Vehicle
+    fields = ("id", "vehicle_id", "type", "capacity", "last_maintenance")
+
+
+class RouteExportView(NDJSONExportView):
+    model = Route
+    fields = ("id", "route_number", "start_point", "end_point")
+
+
+class RouteAssignmentExportView(NDJSONExportView):
+    model = RouteAssignment
+    fields = ("id", "vehicle_id", "route_id", "driver_name", "start_time", "end_time")
+
+
+class ScheduleConflictsView(NDJSONExportView):
+    """Streams every pair of overlapping assignments of a vehicle or a driver."""
+
+    def get_rows(self):
+        return (
+            dc.asdict(conflict)
+            for conflict in schedule_conflicts(chunk_size=self.chunk_size)
+        )
+
+
+class OccupancyTimelineView(LoginRequiredMixin, View):
+    """Peak capacity on the road per `bucket` minutes of the day, 1 by default."""
+
+    def get(self, request):
+        try:
+            bucket_minutes = int(request.GET.get("bucket", 1))
+        except ValueError as e:
+            msg = "bucket must be an integer."
+            raise BadRequest(msg) from e
+        if bucket_minutes < 1 or MINUTES_PER_DAY % bucket_minutes:
+            msg = f"bucket must divide the {MINUTES_PER_DAY} minutes of a day."
+            raise BadRequest(msg)
+
+        # The per-minute timeline is cached, every bucket size is derived from it
+        cache_key = occupancy_timeline_key()
+        timeline = cache.get(cache_key)
+        if timeline is None:
+            timeline = occupancy_timeline()
+            cache.set(cache_key, timeline, settings.OCCUPANCY_TIMELINE_CACHE_TIMEOUT)
+        return JsonResponse(
+            {
+                "bucket_minutes": bucket_minutes,
+                "capacity": bucket_peaks(timeline, bucket_minutes).tolist(),
+            },
+        )
+
+
+class VehicleListView(LoginRequiredMixin, ConditionalGetMixin, View):
+    page_size = 50
+    max_page_size = 500
+
+    def get_etag(self, request):
+        return page_etag(request, get_version(VEHICLES))
+
+    def get(self, request):
+        paginator = KeysetPaginator(
+            Vehicle.objects.all(),
+            ordering=["id"],
+            page_size=get_page_size(request, self.page_size, self.max_page_size),
+        )
+        page = paginator.get_page(request.GET.get("cursor"))
+        vehicle_rows = render_fragments(
+            "vehicle_row_fragment.html",
+            "vehicle",
+            page.object_list,
+            [vehicle_row_key(vehicle) for vehicle in page.object_list],
+            settings.VEHICLE_ROW_CACHE_TIMEOUT,
+        )
         return render(
-            request, "route_detail.html", {"route": route, "assignments": assignments}
+            request,
+            "vehicle_list.html",
+            {
+                "vehicles": page.object_list,
+                "vehicle_rows": vehicle_rows,
+                "page": page,
+                "vehicle_count": estimate_count(Vehicle.objects.all()),
+            },
         )
 
 
-class VehicleMaintenanceView(LoginRequiredMixin, View):
+class RouteDetailView(LoginRequiredMixin, ConditionalGetMixin, View):
+    def get_etag(self, request, route_number):
+        return page_etag(request, get_version(ROUTE_DETAIL))
+
+    def get(self, request, route_number):
+        cache_key = route_detail_key(route_number)
+        route_detail = cache.get(cache_key)
+        if route_detail is None:
+            route = get_object_or_404(Route, route_number=route_number)
+            assignments = route.routeassignment_set.timetable()
+            route_detail = render_to_string(
+                "route_detail_fragment.html",
+                {"route": route, "assignments": assignments},
+            )
+            cache.set(cache_key, route_detail, settings.ROUTE_DETAIL_CACHE_TIMEOUT)
+        return render(request, "route_detail.html", {"route_detail": route_detail})
+
+
+class VehicleMaintenanceView(LoginRequiredMixin, ConditionalGetMixin, View):
+    page_size = 50
+    max_page_size = 500
+
+    def get_etag(self, request, vehicle_id):
+        # Every change of the vehicle's logs sets its `updated_at`, see `signals.py`
+        updated_at = (
+            Vehicle.objects.filter(vehicle_id=vehicle_id)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        return None if updated_at is None else page_etag(request, updated_at)
+
     def get(self, request, vehicle_id):
         vehicle = get_object_or_404(Vehicle, vehicle_id=vehicle_id)
-        maintenance_logs = MaintenanceLog.objects.filter(vehicle=vehicle).order_by(
-            "-maintenance_date"
+        # Descriptions can be long, they are fetched on demand through
+        # `MaintenanceLogDescriptionView`.
+        paginator = KeysetPaginator(
+            MaintenanceLog.objects.filter(vehicle=vehicle).defer("description"),
+            ordering=["-maintenance_date", "-id"],
+            page_size=get_page_size(request, self.page_size, self.max_page_size),
         )
-        total_cost = maintenance_logs.aggregate(Sum("cost"))["cost__sum"]
+        page = paginator.get_page(request.GET.get("cursor"))
         return render(
             request,
             "vehicle_maintenance.html",
-            {"vehicle": vehicle, "logs": maintenance_logs, "total_cost": total_cost},
+            {
+                "vehicle": vehicle,
+                "logs": page.object_list,
+                "page": page,
+                "total_cost": vehicle.maintenance_cost_total,
+            },
         )
 
     @method_decorator(csrf_exempt)
@@ -66,41 +254,88 @@ class VehicleMaintenanceView(LoginRequiredMixin, View):
             maintenance_log.full_clean()
             maintenance_log.save()
 
-            # Update the vehicle's last_maintenance date
+            # Update the vehicle's last_maintenance date. Only that column and its
+            # `updated_at` are written, the running totals were already updated by
+            # the log's signal.
             vehicle.last_maintenance = maintenance_log.maintenance_date
-            vehicle.save()
+            vehicle.save(update_fields=["last_maintenance", "updated_at"])
 
             return JsonResponse(
-                {"message": "Maintenance log added successfully."}, status=201
+                {"message": "Maintenance log added successfully."},
+                status=201,
             )
         except json.JSONDecodeError:
             return JsonResponse({"error": "Invalid JSON"}, status=400)
         except KeyError as e:
             return JsonResponse(
-                {"error": f"Missing required field: {str(e)}"}, status=400
+                {"error": f"Missing required field: {e!s}"},
+                status=400,
             )
         except ValidationError as e:
             return JsonResponse({"error": str(e)}, status=400)
 
 
+class MaintenanceLogDescriptionView(LoginRequiredMixin, View):
+    def get(self, request, pk):
+        maintenance_log = get_object_or_404(
+            MaintenanceLog.objects.only("description"),
+            pk=pk,
+        )
+        return JsonResponse({"description": maintenance_log.description})
+
+
+class VehicleMaintenanceBulkView(LoginRequiredMixin, View):
+    """Ingests maintenance logs of many vehicles from a JSON array or NDJSON body.
+
+    Both are read from the request stream and ingested as they are decoded, never
+    through `request.body`, so uploads are not bound by
+    `DATA_UPLOAD_MAX_MEMORY_SIZE`. Invalid JSON in an array rolls back the rows
+    before it, a bad NDJSON line is reported as an error of its row.
+    """
+
+    @method_decorator(csrf_exempt)
+    @method_decorator(require_http_methods(["POST"]))
+    def post(self, request):
+        if not request.user.is_staff:
+            return JsonResponse(
+                {"error": "You do not have permission to perform this action."},
+                status=403,
+            )
+
+        if request.content_type == "application/x-ndjson":
+            rows = self.__parse_ndjson(request)
+        else:
+            rows = iter_json_array(self.__read_text(request))
+
+        try:
+            result = ingest_maintenance_logs(rows)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return JsonResponse({"error": "Invalid JSON"}, status=400)
+        except NotJSONArrayError:
+            return JsonResponse({"error": "Expected a JSON array"}, status=400)
+        return JsonResponse(
+            {"created": result.created, "errors": result.errors},
+            status=400 if result.errors and not result.created else 201,
+        )
+
+    def __read_text(self, request):
+        chunks = iter(functools.partial(request.read, BULK_READ_SIZE), b"")
+        return codecs.iterdecode(chunks, "utf-8")
+
+    def __parse_ndjson(self, request):
+        for line in request:
+            if not line.strip():
+                # Still counted, so an error `index` is the line number from 0
+                yield SKIPPED_ROW
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Surfaces as an "Invalid row" error at this position
+                yield None
+
+
 class RouteEfficiencyView(LoginRequiredMixin, View):
     def get(self, request):
-        routes = Route.objects.all()
-        route_data = []
-        for route in routes:
-            assignments = route.routeassignment_set.all()
-            total_capacity = assignments.aggregate(Sum("vehicle__capacity"))[
-                "vehicle__capacity__sum"
-            ]
-            avg_capacity = assignments.aggregate(Avg("vehicle__capacity"))[
-                "vehicle__capacity__avg"
-            ]
-            route_data.append(
-                {
-                    "route": route,
-                    "total_capacity": total_capacity,
-                    "average_capacity": avg_capacity,
-                    "assignment_count": assignments.count(),
-                }
-            )
+        route_data = RouteEfficiencyReport()
         return render(request, "route_efficiency.html", {"route_data": route_data})
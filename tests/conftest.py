@@ -0,0 +1,9 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    # Cache versions are bumped on commit, which `TestCase` never does, so cached
+    # entries would otherwise leak into the next test
+    cache.clear()
@@ -1,46 +1,32 @@
 import datetime as dt
-import random as rd
 from typing import TYPE_CHECKING
 
 import factory
 from django.conf import settings
 from factory.django import DjangoModelFactory
 
+from django_unittest_project import fleet
+
 if TYPE_CHECKING:
     from django_unittest_project.users.models import User
 
 
 def generate_capacity(self: "VehicleFactory") -> int:
-    if self.type == "BUS":
-        return rd.randint(0, 100)
-
-    elif self.type == "TRAM":
-        return rd.randint(0, 250)
-
-    return rd.randint(0, 500)
-
-
-def generate_last_maintenance() -> dt.date:
-    return dt.date.today() - dt.timedelta(rd.randint(0, 30))
-
-
-def generate_route_assignment_start_time() -> dt.time:
-    return dt.time(rd.randint(0, 12), rd.randint(0, 59))
+    return fleet.random_capacity(self.type)
 
 
 def generate_route_assignment_end_time(self: "RouteAssignmentFactory") -> dt.time:
-    start_time: dt.time = self.start_time
-    return dt.time(rd.randint(start_time.hour + 1, 23), rd.randint(0, 59))
+    return fleet.random_end_time(self.start_time)
 
 
 class VehicleFactory(DjangoModelFactory):
     class Meta:
         model = "django_unittest_project.Vehicle"
 
-    vehicle_id = factory.LazyFunction(lambda: rd.randint(0, 999999999))
-    type = factory.LazyFunction(lambda: rd.choice(["BUS", "TRAM", "SUBWAY"]))
+    vehicle_id = factory.LazyFunction(fleet.random_vehicle_id)
+    type = factory.LazyFunction(fleet.random_vehicle_type)
     capacity = factory.LazyAttribute(generate_capacity)
-    last_maintenance = factory.LazyFunction(generate_last_maintenance)
+    last_maintenance = factory.LazyFunction(fleet.random_last_maintenance)
 
 
 class UserFactory(DjangoModelFactory):
@@ -72,7 +58,7 @@ class MaintenanceLogFactory(DjangoModelFactory):
     )
     maintenance_date = dt.date.today()
     description = factory.Faker("sentence")
-    cost = factory.Faker("pydecimal", left_digits=3, right_digits=2, positive=True)
+    cost = factory.LazyFunction(fleet.random_cost)
 
 
 class RouteFactory(DjangoModelFactory):
@@ -80,7 +66,7 @@ class RouteFactory(DjangoModelFactory):
     class Meta:
         model = "django_unittest_project.Route"
 
-    route_number = factory.LazyFunction(lambda: rd.randint(0, 999999999))
+    route_number = factory.LazyFunction(fleet.random_route_number)
     start_point = factory.Faker("word")
     end_point = factory.Faker("word")
 
@@ -97,5 +83,5 @@ class RouteAssignmentFactory(DjangoModelFactory):
         "tests.test_django_unittest_project.factories.RouteFactory",
     )
     driver_name = factory.Faker("name")
-    start_time = factory.LazyFunction(generate_route_assignment_start_time)
+    start_time = factory.LazyFunction(fleet.random_start_time)
     end_time = factory.LazyAttribute(generate_route_assignment_end_time)
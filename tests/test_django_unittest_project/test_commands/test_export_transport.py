@@ -0,0 +1,82 @@
+import csv
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from django import test
+from django.core.management import call_command
+
+from tests.test_django_unittest_project.factories import MaintenanceLogFactory
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+
+
+class ExportTransportTests(test.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_csv(self) -> None:
+        """
+        - Given: an assignment and a maintenance log
+        - When: the command is called
+        - Then: each table should be written to its CSV file with a header of its
+            columns, and the throughput reported
+        """
+        assignment = RouteAssignmentFactory.create()
+        MaintenanceLogFactory.create(vehicle=assignment.vehicle)
+        stdout = StringIO()
+
+        call_command("export_transport", self.directory, stdout=stdout)
+
+        with (self.directory / "route_assignments.csv").open(newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert rows == [
+            {
+                "id": str(assignment.pk),
+                "vehicle_id": str(assignment.vehicle.pk),
+                "route_id": str(assignment.route.pk),
+                "driver_name": assignment.driver_name,
+                "start_time": str(assignment.start_time),
+                "end_time": str(assignment.end_time),
+            },
+        ]
+        for name in ("vehicles", "routes", "maintenance_logs"):
+            with (self.directory / f"{name}.csv").open(newline="") as file:
+                assert len(list(csv.DictReader(file))) == 1
+        assert "route_assignments: 1 rows in" in stdout.getvalue()
+        assert "Exported 4 rows" in stdout.getvalue()
+
+    def test_parquet(self) -> None:
+        """
+        - Given: a maintenance log
+        - When: the command is called for the Parquet format and some tables
+        - Then: only those tables should be written, with typed columns
+        """
+        log = MaintenanceLogFactory.create()
+
+        call_command(
+            "export_transport",
+            self.directory,
+            "--format=parquet",
+            "--tables",
+            "vehicles",
+            "maintenance_logs",
+            stdout=StringIO(),
+        )
+
+        assert sorted(path.name for path in self.directory.iterdir()) == [
+            "maintenance_logs.parquet",
+            "vehicles.parquet",
+        ]
+        actual = pq.read_table(self.directory / "maintenance_logs.parquet")
+        assert actual.to_pylist() == [
+            {
+                "id": log.pk,
+                "vehicle_id": log.vehicle.pk,
+                "maintenance_date": log.maintenance_date,
+                "description": log.description,
+                "cost": log.cost,
+            },
+        ]
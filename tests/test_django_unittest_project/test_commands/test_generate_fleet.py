@@ -0,0 +1,57 @@
+from io import StringIO
+
+from django import test
+from django.core.management import call_command
+
+from django_unittest_project.models import MaintenanceLog
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteAssignment
+from django_unittest_project.models import RouteEfficiency
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import VehicleFactory
+
+
+class GenerateFleetTests(test.TestCase):
+    def test_generate(self) -> None:
+        """
+        - Given: an existing `Vehicle`
+        - When: the command is called with explicit counts
+        - Then: the rows should be inserted with valid values and consistent rollups
+        """
+        VehicleFactory.create()
+
+        call_command(
+            "generate_fleet",
+            "--vehicles=20",
+            "--routes=3",
+            "--assignments=50",
+            "--maintenance-logs=40",
+            "--batch-size=7",
+            stdout=StringIO(),
+        )
+
+        assert Vehicle.objects.count() == 21
+        assert Route.objects.count() == 3
+        assert RouteAssignment.objects.count() == 50
+        assert MaintenanceLog.objects.count() == 40
+        for vehicle in Vehicle.objects.all():
+            vehicle.clean()
+        # Overlapping shifts are possible, as with the factories
+        for assignment in RouteAssignment.objects.all():
+            assert assignment.start_time < assignment.end_time
+        assert RouteEfficiency.objects.drifted() == []
+        assert RouteEfficiency.objects.count() == 3
+        assert not Vehicle.objects.maintenance_drifted().exists()
+
+    def test_scaled(self) -> None:
+        """
+        - Given: only a number of vehicles
+        - When: the command is called
+        - Then: the other tables should be generated in proportion
+        """
+        call_command("generate_fleet", "--vehicles=10", stdout=StringIO())
+
+        assert Vehicle.objects.count() == 10
+        assert Route.objects.count() == 1
+        assert RouteAssignment.objects.count() == 30
+        assert MaintenanceLog.objects.count() == 50
@@ -0,0 +1,142 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django import test
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from django_unittest_project.models import MaintenanceLog
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteAssignment
+from django_unittest_project.models import RouteEfficiency
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import VehicleFactory
+
+
+class ImportTransportTests(test.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_csv(self) -> None:
+        """
+        - Given: the CSV export of a fleet, which is then deleted
+        - When: the command is called
+        - Then: every row should be restored with its pk, the rollups and totals
+            rebuilt and the throughput reported
+        """
+        self.__round_trip("csv")
+
+    def test_parquet(self) -> None:
+        """
+        - Given: the Parquet export of a fleet, which is then deleted
+        - When: the command is called for the Parquet format
+        - Then: every row should be restored with its pk, the rollups and totals
+            rebuilt and the throughput reported
+        """
+        self.__round_trip("parquet")
+
+    def test_unknown_column(self) -> None:
+        """
+        - Given: a vehicles CSV file with a column `Vehicle` does not have
+        - When: the command is called
+        - Then: a `CommandError` naming the column should be raised
+        """
+        (self.directory / "vehicles.csv").write_text(
+            "id,vehicle_id,type,colour\n1,V1,BUS,red\n",
+        )
+
+        with self.assertRaisesMessage(CommandError, "unknown column(s) colour"):
+            call_command(
+                "import_transport",
+                self.directory,
+                "--tables=vehicles",
+                stdout=StringIO(),
+            )
+
+        assert not Vehicle.objects.exists()
+
+    def test_invalid_value(self) -> None:
+        """
+        - Given: an export whose maintenance logs CSV file has an invalid date
+        - When: the command is called
+        - Then: a `CommandError` naming the line should be raised and nothing
+            imported, not even the valid tables
+        """
+        call_command("generate_fleet", "--vehicles=2", stdout=StringIO())
+        call_command("export_transport", self.directory, stdout=StringIO())
+        self.__delete_fleet()
+        path = self.directory / "maintenance_logs.csv"
+        header, first, *rest = path.read_text().splitlines()
+        first_fields = first.split(",")
+        first_fields[2] = "yesterday"
+        path.write_text("\n".join([header, ",".join(first_fields), *rest]))
+
+        with self.assertRaisesMessage(CommandError, "maintenance_logs.csv, line 2"):
+            call_command("import_transport", self.directory, stdout=StringIO())
+
+        assert not Vehicle.objects.exists()
+        assert not MaintenanceLog.objects.exists()
+
+    def test_missing_file(self) -> None:
+        """
+        - Given: an empty directory
+        - When: the command is called
+        - Then: a `CommandError` should be raised
+        """
+        with self.assertRaises(CommandError):
+            call_command("import_transport", self.directory, stdout=StringIO())
+
+    def __round_trip(self, file_format: str) -> None:
+        call_command("generate_fleet", "--vehicles=10", stdout=StringIO())
+        expected = self.__snapshot()
+        call_command(
+            "export_transport",
+            self.directory,
+            f"--format={file_format}",
+            "--batch-size=7",
+            stdout=StringIO(),
+        )
+        self.__delete_fleet()
+        stdout = StringIO()
+
+        call_command(
+            "import_transport",
+            self.directory,
+            f"--format={file_format}",
+            "--batch-size=7",
+            stdout=stdout,
+        )
+
+        assert self.__snapshot() == expected
+        assert RouteEfficiency.objects.count() == Route.objects.count()
+        assert RouteEfficiency.objects.drifted() == []
+        assert not Vehicle.objects.maintenance_drifted().exists()
+        assert "maintenance_logs: 50 rows in" in stdout.getvalue()
+        assert "Imported 91 rows" in stdout.getvalue()
+        # New rows do not reuse the imported pks
+        assert VehicleFactory.create().pk > max(pk for pk, *_ in expected[0])
+
+    def __snapshot(self) -> list[list[tuple]]:
+        return [
+            sorted(
+                Vehicle.objects.values_list(
+                    "pk",
+                    "vehicle_id",
+                    "type",
+                    "capacity",
+                    "last_maintenance",
+                    "maintenance_cost_total",
+                    "maintenance_log_count",
+                ),
+            ),
+            sorted(Route.objects.values_list()),
+            sorted(RouteAssignment.objects.values_list()),
+            sorted(MaintenanceLog.objects.values_list()),
+        ]
+
+    def __delete_fleet(self) -> None:
+        Vehicle.objects.all().delete()
+        Route.objects.all().delete()
@@ -0,0 +1,136 @@
+import datetime as dt
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django import test
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from django_unittest_project.caching import VEHICLES
+from django_unittest_project.caching import get_version
+from django_unittest_project.models import RouteEfficiency
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+
+HEADER = "vehicle_id,type,capacity,last_maintenance\n"
+
+
+class ImportVehiclesTests(test.TestCase):
+    def test_create(self) -> None:
+        """
+        - Given: a CSV file of new vehicles
+        - When: the command is called
+        - Then: every `Vehicle` should be created with the values of its row
+        """
+        stdout = StringIO()
+
+        call_command(
+            "import_vehicles",
+            self.__csv("V1,BUS,80,2024-01-02\nV2,SUBWAY,400,2024-03-04\n"),
+            stdout=stdout,
+        )
+
+        actual = set(
+            Vehicle.objects.values_list(
+                "vehicle_id",
+                "type",
+                "capacity",
+                "last_maintenance",
+            ),
+        )
+        assert actual == {
+            ("V1", "BUS", 80, dt.date(2024, 1, 2)),
+            ("V2", "SUBWAY", 400, dt.date(2024, 3, 4)),
+        }
+        assert "Created 2 and updated 0 vehicle(s)" in stdout.getvalue()
+
+    def test_update(self) -> None:
+        """
+        - Given: a CSV file with a row of an existing `Vehicle` changing its capacity
+        - When: the command is called
+        - Then: the `Vehicle` should be updated in place along its `updated_at`, the
+            rollups of its routes refreshed and the vehicle list invalidated
+        """
+        vehicle = VehicleFactory.create(type="TRAM", capacity=100)
+        assignment = RouteAssignmentFactory.create(vehicle=vehicle)
+        previous_version = get_version(VEHICLES)
+        stdout = StringIO()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "import_vehicles",
+                self.__csv(f"{vehicle.vehicle_id},TRAM,200,2024-01-02\n"),
+                stdout=stdout,
+            )
+
+        updated = Vehicle.objects.get()
+        assert updated.pk == vehicle.pk
+        assert updated.capacity == 200
+        assert updated.last_maintenance == dt.date(2024, 1, 2)
+        assert updated.updated_at > vehicle.updated_at
+        rollup = RouteEfficiency.objects.get(route=assignment.route)
+        assert rollup.total_capacity == 200
+        assert get_version(VEHICLES) != previous_version
+        assert "Created 0 and updated 1 vehicle(s)" in stdout.getvalue()
+
+    def test_invalid_rows(self) -> None:
+        """
+        - Given: a CSV file mixing valid rows with rows breaking the field
+            constraints or the capacity rules of `Vehicle.clean`
+        - When: the command is called
+        - Then: the valid rows should be imported and every invalid one reported by
+            its row number
+        """
+        stderr = StringIO()
+
+        call_command(
+            "import_vehicles",
+            self.__csv(
+                "V1,BUS,101,2024-01-02\n"
+                "V2,TRAM,251,2024-01-02\n"
+                "V3,TRAM,250,2024-01-02\n"
+                "V4,PLANE,10,2024-01-02\n"
+                "V5,BUS,ten,2024-01-02\n"
+                "V6,BUS,10,yesterday\n"
+                "V3,BUS,10,2024-01-02\n"
+                "V12345678901,BUS,10,2024-01-02\n",
+            ),
+            stdout=StringIO(),
+            stderr=stderr,
+        )
+
+        assert list(Vehicle.objects.values_list("vehicle_id", flat=True)) == ["V3"]
+        assert stderr.getvalue().splitlines() == [
+            "Row 1: Buses cannot have a capacity greater than 100.",
+            "Row 2: Trams cannot have a capacity greater than 250.",
+            "Row 4: Invalid type: 'PLANE'",
+            "Row 5: Invalid capacity: 'ten'",
+            "Row 6: Invalid last_maintenance: 'yesterday'",
+            "Row 7: Duplicate vehicle_id: 'V3'",
+            "Row 8: Invalid vehicle_id: 'V12345678901'",
+        ]
+
+    def test_nothing_imported(self) -> None:
+        """
+        - Given: a CSV file whose rows are all invalid
+        - When: the command is called
+        - Then: a `CommandError` should be raised
+        """
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_vehicles",
+                self.__csv("V1,BUS,101,2024-01-02\n"),
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+        assert not Vehicle.objects.exists()
+
+    def __csv(self, rows: str) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "vehicles.csv"
+        path.write_text(HEADER + rows)
+        return str(path)
@@ -0,0 +1,42 @@
+from io import StringIO
+
+from django import test
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteEfficiency
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import RouteFactory
+
+
+class RebuildRouteEfficiencyTests(test.TestCase):
+    def setUp(self) -> None:
+        self.__route: Route = RouteFactory.create()
+        RouteAssignmentFactory.create_batch(2, route=self.__route)
+        RouteEfficiency.objects.filter(route=self.__route).update(
+            total_capacity=0,
+            assignment_count=0,
+        )
+
+    def test_rebuild(self) -> None:
+        """
+        - Given: a drifted `RouteEfficiency`
+        - When: the command is called
+        - Then: the rollup should be recomputed from the assignments
+        """
+        call_command("rebuild_route_efficiency", stdout=StringIO())
+
+        assert RouteEfficiency.objects.drifted() == []
+        assert RouteEfficiency.objects.get(route=self.__route).assignment_count == 2
+
+    def test_check(self) -> None:
+        """
+        - Given: a drifted `RouteEfficiency`
+        - When: the command is called with `--check`
+        - Then: a `CommandError` should be raised and the rollup left untouched
+        """
+        with self.assertRaises(CommandError):
+            call_command("rebuild_route_efficiency", "--check", stdout=StringIO())
+
+        assert RouteEfficiency.objects.get(route=self.__route).assignment_count == 0
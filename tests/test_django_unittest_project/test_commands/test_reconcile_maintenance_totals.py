@@ -0,0 +1,46 @@
+from decimal import Decimal
+from io import StringIO
+
+from django import test
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import MaintenanceLogFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+
+
+class ReconcileMaintenanceTotalsTests(test.TestCase):
+    def setUp(self) -> None:
+        self.__vehicle: Vehicle = VehicleFactory.create()
+        MaintenanceLogFactory.create(vehicle=self.__vehicle, cost=Decimal("10.00"))
+        MaintenanceLogFactory.create(vehicle=self.__vehicle, cost=Decimal("5.00"))
+        Vehicle.objects.filter(pk=self.__vehicle.pk).update(
+            maintenance_cost_total=0,
+            maintenance_log_count=0,
+        )
+
+    def test_reconcile(self) -> None:
+        """
+        - Given: a `Vehicle` whose maintenance totals drifted
+        - When: the command is called
+        - Then: the totals should be recomputed from the logs
+        """
+        call_command("reconcile_maintenance_totals", stdout=StringIO())
+
+        self.__vehicle.refresh_from_db()
+        assert not Vehicle.objects.maintenance_drifted().exists()
+        assert self.__vehicle.maintenance_cost_total == Decimal("15.00")
+        assert self.__vehicle.maintenance_log_count == 2
+
+    def test_check(self) -> None:
+        """
+        - Given: a `Vehicle` whose maintenance totals drifted
+        - When: the command is called with `--check`
+        - Then: a `CommandError` should be raised and the totals left untouched
+        """
+        with self.assertRaises(CommandError):
+            call_command("reconcile_maintenance_totals", "--check", stdout=StringIO())
+
+        self.__vehicle.refresh_from_db()
+        assert self.__vehicle.maintenance_log_count == 0
@@ -0,0 +1,168 @@
+import unittest
+from typing import Any
+from unittest import mock
+
+from django import test
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError
+from django.db import connection
+
+from django_unittest_project.db.postgresql_pool.base import DatabaseWrapper
+from django_unittest_project.metrics import RequestMetrics
+from django_unittest_project.metrics import collect
+
+
+def _make_wrapper(alias: str, **settings: Any) -> DatabaseWrapper:
+    settings_dict = {
+        "ENGINE": "django_unittest_project.db.postgresql_pool",
+        "NAME": "transport",
+        "USER": "",
+        "PASSWORD": "",
+        # Nothing listens there: connecting fails right away
+        "HOST": "127.0.0.1",
+        "PORT": "1",
+        "OPTIONS": {"pool": {"min_size": 0, "max_size": 1, "timeout": 0.2}},
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "TIME_ZONE": None,
+        "AUTOCOMMIT": True,
+        "ATOMIC_REQUESTS": False,
+        "TEST": {},
+    }
+    return DatabaseWrapper(settings_dict | settings, alias)
+
+
+def _make_live_wrapper(alias: str) -> DatabaseWrapper:
+    """A pooled wrapper of the test database, which must be a PostgreSQL one."""
+    settings_dict = connection.settings_dict
+    return DatabaseWrapper(
+        settings_dict
+        | {
+            "ENGINE": "django_unittest_project.db.postgresql_pool",
+            "OPTIONS": settings_dict["OPTIONS"]
+            | {"pool": {"min_size": 0, "max_size": 1, "timeout": 5}},
+            "CONN_MAX_AGE": 0,
+            "CONN_HEALTH_CHECKS": True,
+            "ATOMIC_REQUESTS": False,
+        },
+        alias,
+    )
+
+
+def _backend_pid(wrapper: DatabaseWrapper) -> int:
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        return cursor.fetchone()[0]
+
+
+class PostgresqlPoolTests(test.SimpleTestCase):
+    def test_pool_per_alias(self) -> None:
+        """
+        - Given: two connections of the same alias
+        - When: their pool is requested
+        - Then: they should share one pool, opened with the `pool` options, which
+            should not be passed on as connection parameters
+        """
+        wrapper = _make_wrapper("pool_per_alias")
+        other_wrapper = _make_wrapper("pool_per_alias")
+        self.addCleanup(wrapper.close_pool)
+
+        assert wrapper.pool is other_wrapper.pool
+        assert wrapper.pool.max_size == 1
+        assert "pool" not in wrapper.get_connection_params()
+
+    def test_pool_per_process(self) -> None:
+        """
+        - Given: a connection whose pool was opened before the process forked
+        - When: its pool is requested from the child process
+        - Then: the child should open a pool of its own
+        """
+        wrapper = _make_wrapper("pool_per_process")
+        self.addCleanup(wrapper.close_pool)
+        parent_pool = wrapper.pool
+
+        with mock.patch("os.getpid", return_value=-1):
+            child_pool = wrapper.pool
+        self.addCleanup(child_pool.close)
+
+        assert child_pool is not parent_pool
+        assert wrapper.pool is parent_pool
+
+    def test_pool_wait_metrics(self) -> None:
+        """
+        - Given: a pool that cannot get a connection
+        - When: a connection is requested while metrics are collected
+        - Then: an `OperationalError` should be raised after the pool timeout, and
+            the time waited added to `pool_wait_ms`
+        """
+        wrapper = _make_wrapper("pool_wait_metrics")
+        self.addCleanup(wrapper.close_pool)
+        request_metrics = RequestMetrics()
+
+        with collect(request_metrics), self.assertRaises(OperationalError):
+            wrapper.ensure_connection()
+
+        assert request_metrics.pool_wait_ms >= 150, request_metrics
+        assert wrapper.pool_stats()["requests_errors"] == 1
+
+    def test_persistent_connections(self) -> None:
+        """
+        - Given: a pooled database with a non-zero `CONN_MAX_AGE`
+        - When: its pool is requested
+        - Then: an `ImproperlyConfigured` error should be raised
+        """
+        wrapper = _make_wrapper("persistent_connections", CONN_MAX_AGE=60)
+
+        with self.assertRaises(ImproperlyConfigured):
+            wrapper.pool  # noqa: B018
+
+
+@unittest.skipUnless(
+    connection.vendor == "postgresql",
+    "Pooling needs a PostgreSQL test database",
+)
+class PostgresqlPoolLiveTests(test.SimpleTestCase):
+    databases = {"default"}
+
+    def test_connection_reused(self) -> None:
+        """
+        - Given: a pool of one connection to the test database
+        - When: a connection is opened and closed twice while metrics are collected
+        - Then: both should be the same backend, returned to the pool in between,
+            and the time waited for them added to `pool_wait_ms`
+        """
+        wrapper = _make_live_wrapper("pool_connection_reused")
+        self.addCleanup(wrapper.close_pool)
+        request_metrics = RequestMetrics()
+
+        with collect(request_metrics):
+            first_pid = _backend_pid(wrapper)
+            wrapper.close()
+            second_pid = _backend_pid(wrapper)
+            wrapper.close()
+
+        assert first_pid == second_pid
+        pool_stats = wrapper.pool_stats()
+        assert pool_stats["connections_num"] == 1
+        assert pool_stats["pool_available"] == 1
+        assert request_metrics.pool_wait_ms > 0, request_metrics
+
+    def test_broken_connection_discarded(self) -> None:
+        """
+        - Given: a pooled connection whose backend was terminated
+        - When: it is closed and a connection requested again
+        - Then: the health check should discard it and a working connection to
+            another backend should be handed out
+        """
+        wrapper = _make_live_wrapper("pool_broken_connection")
+        self.addCleanup(wrapper.close_pool)
+        first_pid = _backend_pid(wrapper)
+        wrapper.close()
+        # Terminated from another connection, so the pool only sees a broken one
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_terminate_backend(%s)", [first_pid])
+
+        second_pid = _backend_pid(wrapper)
+        wrapper.close()
+
+        assert second_pid != first_pid
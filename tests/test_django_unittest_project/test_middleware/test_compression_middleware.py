@@ -0,0 +1,120 @@
+import gzip
+import json
+
+import brotli
+from django import test, urls as dj_urls
+
+from tests.test_django_unittest_project.factories import (
+    MaintenanceLogFactory,
+    UserFactory,
+    VehicleFactory,
+)
+from tests.utils import serialize_response
+
+
+class CompressionMiddlewareTests(test.TestCase):
+    URL = dj_urls.reverse_lazy("vehicle_list")
+
+    def setUp(self) -> None:
+        VehicleFactory.create_batch(20)
+        self.client.force_login(UserFactory.create())
+
+    def test_brotli(self) -> None:
+        """
+        - Given: `GET` request for a JSON response from a client accepting Brotli and
+            gzip
+        - When: the request is received
+        - Then: the response should be sent compressed with Brotli, with
+            `Accept-Encoding` in `Vary`
+        """
+        url = dj_urls.reverse("occupancy_timeline")
+        expected_content = self.client.get(url).content
+
+        response = self.client.get(url, headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert response["Content-Encoding"] == "br"
+        assert "Accept-Encoding" in response["Vary"]
+        assert int(response["Content-Length"]) < len(expected_content)
+        assert brotli.decompress(response.content) == expected_content
+
+    def test_html_gzip(self) -> None:
+        """
+        - Given: `GET` request for an HTML page from a client accepting Brotli and
+            gzip
+        - When: the request is received
+        - Then: the page should be sent compressed with gzip, padded with a random
+            file name against BREACH, with a weak `ETag`
+        """
+        expected_content = self.client.get(self.URL).content
+
+        response = self.client.get(self.URL, headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert response["Content-Encoding"] == "gzip"
+        assert response["ETag"].startswith('W/"')
+        assert response.content[3] & gzip.FNAME
+        assert gzip.decompress(response.content) == expected_content
+
+    def test_streaming(self) -> None:
+        """
+        - Given: `GET` request for a streamed NDJSON export from a client accepting
+            Brotli
+        - When: the request is received
+        - Then: every row should be streamed compressed with Brotli
+        """
+        response = self.client.get(
+            dj_urls.reverse("vehicle_export"),
+            headers={"Accept-Encoding": "br"},
+        )
+
+        assert response.status_code == 200, serialize_response(response)
+        assert response["Content-Encoding"] == "br"
+        content = brotli.decompress(b"".join(response.streaming_content))
+        assert len(content.decode().splitlines()) == 20
+
+    def test_not_modified(self) -> None:
+        """
+        - Given: `GET` request sending the weak `ETag` of a compressed response in
+            `If-None-Match`
+        - When: the request is received
+        - Then: a `304` response should be sent
+        """
+        etag = self.client.get(self.URL, headers={"Accept-Encoding": "gzip"})["ETag"]
+
+        response = self.client.get(
+            self.URL,
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        )
+
+        assert response.status_code == 304, serialize_response(response)
+
+    def test_small_response(self) -> None:
+        """
+        - Given: `GET` request for a JSON response below `COMPRESSION_MIN_SIZE` from a
+            client accepting Brotli
+        - When: the request is received
+        - Then: the response should be sent uncompressed
+        """
+        log = MaintenanceLogFactory.create(description="Brakes")
+
+        response = self.client.get(
+            dj_urls.reverse("maintenance_log_description", args=[log.pk]),
+            headers={"Accept-Encoding": "br"},
+        )
+
+        assert response.status_code == 200, serialize_response(response)
+        assert not response.has_header("Content-Encoding")
+        assert json.loads(response.content) == {"description": "Brakes"}
+
+    def test_not_accepted(self) -> None:
+        """
+        - Given: `GET` request for an HTML page from a client accepting no encoding
+        - When: the request is received
+        - Then: the page should be sent uncompressed
+        """
+        response = self.client.get(self.URL)
+
+        assert response.status_code == 200, serialize_response(response)
+        assert not response.has_header("Content-Encoding")
+        assert b"<html" in response.content
@@ -0,0 +1,66 @@
+from django import test, urls as dj_urls
+
+from django_unittest_project.metrics import RequestBudgetExceededError
+from tests.test_django_unittest_project.factories import (
+    RouteAssignmentFactory,
+    UserFactory,
+)
+
+LOGGER = "django_unittest_project.middleware"
+
+
+class RequestMetricsMiddlewareTests(test.TestCase):
+    URL = dj_urls.reverse_lazy("route_efficiency")
+
+    def setUp(self) -> None:
+        RouteAssignmentFactory.create_batch(3)
+        self.client.force_login(UserFactory.create())
+
+    def test_metrics(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user
+        - When: the request is received
+        - Then: the metrics should be sent in a `Server-Timing` header and logged
+            with structured fields
+        """
+        with self.assertLogs(LOGGER, "INFO") as logs:
+            response = self.client.get(self.URL)
+
+        assert response.status_code == 200
+        server_timing = response["Server-Timing"]
+        assert server_timing.startswith("db;dur=")
+        assert "tpl;dur=" in server_timing
+        assert "total;dur=" in server_timing
+        (record,) = logs.records
+        assert record.view == "route_efficiency"
+        assert record.status == 200
+        assert record.queries > 0
+        assert record.template_ms > 0
+        assert record.total_ms >= record.db_ms + record.template_ms
+        assert f'desc="{record.queries} queries"' in server_timing
+
+    @test.override_settings(REQUEST_BUDGETS={"route_efficiency": {"queries": 1}})
+    def test_budget_exceeded(self) -> None:
+        """
+        - Given: a budget the view goes over, with `REQUEST_BUDGETS_ENFORCE`
+        - When: a request is received
+        - Then: a `RequestBudgetExceededError` should be raised
+        """
+        with self.assertRaises(RequestBudgetExceededError):
+            self.client.get(self.URL)
+
+    @test.override_settings(
+        REQUEST_BUDGETS={"route_efficiency": {"queries": 1}},
+        REQUEST_BUDGETS_ENFORCE=False,
+    )
+    def test_budget_exceeded_not_enforced(self) -> None:
+        """
+        - Given: a budget the view goes over, without `REQUEST_BUDGETS_ENFORCE`
+        - When: a request is received
+        - Then: a warning should be logged and the response returned
+        """
+        with self.assertLogs(LOGGER, "WARNING") as logs:
+            response = self.client.get(self.URL)
+
+        assert response.status_code == 200
+        assert "exceeded its budget" in logs.output[0]
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django import test
+
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import MaintenanceLogFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+from tests.utils import expected_x_but_got_y
+
+
+class MaintenanceLogTests(test.TestCase):
+    def setUp(self) -> None:
+        self.__vehicle: Vehicle = VehicleFactory.create()
+
+    def test_created(self) -> None:
+        """
+        - Given: `MaintenanceLog`s created for a `Vehicle`
+        - When: they are saved
+        - Then: the maintenance totals of the vehicle should include them
+        """
+        MaintenanceLogFactory.create(vehicle=self.__vehicle, cost=Decimal("10.50"))
+        MaintenanceLogFactory.create(vehicle=self.__vehicle, cost=Decimal("4.25"))
+
+        self.__vehicle.refresh_from_db()
+
+        assert self.__vehicle.maintenance_cost_total == Decimal(
+            "14.75",
+        ), expected_x_but_got_y(
+            Decimal("14.75"),
+            self.__vehicle.maintenance_cost_total,
+        )
+        assert self.__vehicle.maintenance_log_count == 2
+
+    def test_updated(self) -> None:
+        """
+        - Given: a `MaintenanceLog` whose `cost` and `vehicle` are changed
+        - When: it is saved
+        - Then: the maintenance totals of both vehicles should be updated
+        """
+        log = MaintenanceLogFactory.create(
+            vehicle=self.__vehicle,
+            cost=Decimal("10.00"),
+        )
+        other_vehicle = VehicleFactory.create()
+
+        log.vehicle = other_vehicle
+        log.cost = Decimal("3.00")
+        log.save()
+
+        self.__vehicle.refresh_from_db()
+        other_vehicle.refresh_from_db()
+        assert self.__vehicle.maintenance_cost_total == Decimal(0)
+        assert self.__vehicle.maintenance_log_count == 0
+        assert other_vehicle.maintenance_cost_total == Decimal("3.00")
+        assert other_vehicle.maintenance_log_count == 1
+
+    def test_deleted(self) -> None:
+        """
+        - Given: a `MaintenanceLog` of a `Vehicle`
+        - When: it is deleted
+        - Then: the maintenance totals of the vehicle should no longer include it
+        """
+        log = MaintenanceLogFactory.create(vehicle=self.__vehicle)
+
+        log.delete()
+
+        self.__vehicle.refresh_from_db()
+        assert self.__vehicle.maintenance_cost_total == Decimal(0)
+        assert self.__vehicle.maintenance_log_count == 0
+
+    def test_stale_vehicle_saved(self) -> None:
+        """
+        - Given: a `Vehicle` instance loaded before a `MaintenanceLog` of it was added
+        - When: the stale instance is saved in full after changing its `capacity`
+        - Then: the capacity should be saved and the maintenance totals of the
+            vehicle should still include the log
+        """
+        MaintenanceLogFactory.create(vehicle=self.__vehicle, cost=Decimal("7.50"))
+
+        self.__vehicle.capacity = 1
+        self.__vehicle.save()
+
+        vehicle = Vehicle.objects.get(pk=self.__vehicle.pk)
+        assert vehicle.capacity == 1
+        assert vehicle.maintenance_cost_total == Decimal("7.50")
+        assert vehicle.maintenance_log_count == 1
@@ -1,13 +1,14 @@
-from django import test
+import datetime as dt
 import random as rd
+
+from django import test
+from django.core import exceptions as core_exc
+
 from django_unittest_project.models import RouteAssignment
 from tests.test_django_unittest_project.factories import RouteAssignmentFactory
-from django.core import exceptions as core_exc
-import datetime as dt
 
 
 class RouteAssignmentTests(test.TestCase):
-
     def test_valid(self) -> None:
         """
         - Given: `RouteAssignment` with `start_time < end_time`
@@ -16,10 +17,11 @@ class RouteAssignmentTests(test.TestCase):
         """
         start_time = dt.time(rd.randint(0, 22), rd.randint(0, 59))
         end_time = dt.time(rd.randint(start_time.hour, 23), rd.randint(0, 59))
-        route_assignment: "RouteAssignment" = RouteAssignmentFactory.create(
-            start_time=start_time, end_time=end_time
+        route_assignment: RouteAssignment = RouteAssignmentFactory.create(
+            start_time=start_time,
+            end_time=end_time,
         )
-        assert route_assignment.clean() == None
+        assert route_assignment.clean() is None
 
     def test_invalid(self) -> None:
         """
@@ -29,10 +31,77 @@ class RouteAssignmentTests(test.TestCase):
         """
         start_time = dt.time(rd.randint(0, 23), rd.randint(0, 59))
         end_time = dt.time(rd.randint(0, start_time.hour), rd.randint(0, 59))
-        route_assignment: "RouteAssignment" = RouteAssignmentFactory.create(
-            start_time=start_time, end_time=end_time
+        route_assignment: RouteAssignment = RouteAssignmentFactory.create(
+            start_time=start_time,
+            end_time=end_time,
         )
 
         with self.assertRaises(core_exc.ValidationError) as context:
             route_assignment.clean()
             assert context.exception.message == "End time must be after start time."
+
+    def test_vehicle_overlap(self) -> None:
+        """
+        - Given: `RouteAssignment` overlapping another one of the same vehicle
+        - When: `clean` is called
+        - Then: a `ValidationError` should be raised with the appropriated message
+        """
+        existing: RouteAssignment = RouteAssignmentFactory.create(
+            start_time=dt.time(8),
+            end_time=dt.time(12),
+        )
+        route_assignment: RouteAssignment = RouteAssignmentFactory.build(
+            vehicle=existing.vehicle,
+            route=existing.route,
+            start_time=dt.time(11, 59),
+            end_time=dt.time(14),
+        )
+
+        with self.assertRaises(core_exc.ValidationError) as context:
+            route_assignment.clean()
+        assert context.exception.message == (
+            "The vehicle is already assigned at that time."
+        )
+
+    def test_driver_overlap(self) -> None:
+        """
+        - Given: `RouteAssignment` overlapping another one of the same driver on
+            another vehicle
+        - When: `clean` is called
+        - Then: a `ValidationError` should be raised with the appropriated message
+        """
+        existing: RouteAssignment = RouteAssignmentFactory.create(
+            start_time=dt.time(8),
+            end_time=dt.time(12),
+        )
+        route_assignment: RouteAssignment = RouteAssignmentFactory.create(
+            driver_name=existing.driver_name,
+            start_time=dt.time(9),
+            end_time=dt.time(10),
+        )
+
+        with self.assertRaises(core_exc.ValidationError) as context:
+            route_assignment.clean()
+        assert context.exception.message == (
+            "The driver is already assigned at that time."
+        )
+
+    def test_back_to_back(self) -> None:
+        """
+        - Given: `RouteAssignment` starting when another one of the same vehicle and
+            driver ends
+        - When: `clean` is called
+        - Then: `None` should be returned
+        """
+        existing: RouteAssignment = RouteAssignmentFactory.create(
+            start_time=dt.time(8),
+            end_time=dt.time(12),
+        )
+        route_assignment: RouteAssignment = RouteAssignmentFactory.create(
+            vehicle=existing.vehicle,
+            driver_name=existing.driver_name,
+            start_time=dt.time(12),
+            end_time=dt.time(14),
+        )
+
+        assert route_assignment.clean() is None
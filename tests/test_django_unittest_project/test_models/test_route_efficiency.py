@@ -0,0 +1,167 @@
+from django import test
+from django.db.models import F
+
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteEfficiency
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import RouteFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+from tests.utils import expected_x_but_got_y
+
+
+class RouteEfficiencyTests(test.TestCase):
+    def setUp(self) -> None:
+        self.__route: Route = RouteFactory.create()
+
+    def test_created_with_route(self) -> None:
+        """
+        - Given: a new `Route`
+        - When: it is saved
+        - Then: an empty `RouteEfficiency` should be created for it
+        """
+        rollup = RouteEfficiency.objects.get(route=self.__route)
+
+        assert rollup.total_capacity == 0
+        assert rollup.assignment_count == 0
+        assert rollup.average_capacity is None
+
+    def test_assignment_saved(self) -> None:
+        """
+        - Given: `RouteAssignment`s created for a `Route`
+        - When: they are saved
+        - Then: the `RouteEfficiency` of the route should include their capacities
+        """
+        assignments = RouteAssignmentFactory.create_batch(3, route=self.__route)
+        expected_total = sum(assignment.vehicle.capacity for assignment in assignments)
+
+        rollup = RouteEfficiency.objects.get(route=self.__route)
+
+        assert rollup.total_capacity == expected_total, expected_x_but_got_y(
+            expected_total,
+            rollup.total_capacity,
+        )
+        assert rollup.assignment_count == 3
+        assert rollup.average_capacity == expected_total / 3
+
+    def test_assignment_moved(self) -> None:
+        """
+        - Given: a `RouteAssignment` moved to another `Route`
+        - When: it is saved
+        - Then: both `RouteEfficiency` rows should be updated
+        """
+        assignment = RouteAssignmentFactory.create(route=self.__route)
+        other_route = RouteFactory.create()
+
+        assignment.route = other_route
+        assignment.save()
+
+        assert RouteEfficiency.objects.get(route=self.__route).assignment_count == 0
+        assert RouteEfficiency.objects.get(route=other_route).assignment_count == 1
+
+    def test_assignment_deleted(self) -> None:
+        """
+        - Given: a `RouteAssignment` of a `Route`
+        - When: it is deleted
+        - Then: the `RouteEfficiency` of the route should no longer include it
+        """
+        assignment = RouteAssignmentFactory.create(route=self.__route)
+
+        assignment.delete()
+
+        rollup = RouteEfficiency.objects.get(route=self.__route)
+        assert rollup.total_capacity == 0
+        assert rollup.assignment_count == 0
+
+    def test_route_deleted(self) -> None:
+        """
+        - Given: a `Route` with `RouteAssignment`s
+        - When: it is deleted, cascading to its assignments
+        - Then: its `RouteEfficiency` should be deleted along and not recreated
+        """
+        RouteAssignmentFactory.create_batch(2, route=self.__route)
+        route_pk = self.__route.pk
+
+        self.__route.delete()
+
+        assert not RouteEfficiency.objects.filter(route_id=route_pk).exists()
+
+    def test_vehicle_capacity_changed(self) -> None:
+        """
+        - Given: a `Vehicle` assigned to a `Route`
+        - When: its `capacity` is changed
+        - Then: the `RouteEfficiency` of the route should reflect the new capacity
+        """
+        vehicle = VehicleFactory.create(type="SUBWAY", capacity=10)
+        RouteAssignmentFactory.create(route=self.__route, vehicle=vehicle)
+
+        vehicle.capacity = 40
+        vehicle.save()
+
+        assert RouteEfficiency.objects.get(route=self.__route).total_capacity == 40
+
+    def test_assignment_saved_increments(self) -> None:
+        """
+        - Given: a `RouteEfficiency` whose totals were changed by a concurrent writer
+            since the route's assignments were last read
+        - When: a `RouteAssignment` of the route is saved
+        - Then: its capacity should be added to the stored totals instead of
+            overwriting them with a recount
+        """
+        vehicle = VehicleFactory.create(type="SUBWAY", capacity=30)
+        RouteEfficiency.objects.filter(route=self.__route).update(
+            total_capacity=100,
+            assignment_count=2,
+        )
+
+        RouteAssignmentFactory.create(route=self.__route, vehicle=vehicle)
+
+        rollup = RouteEfficiency.objects.get(route=self.__route)
+        assert rollup.total_capacity == 130
+        assert rollup.assignment_count == 3
+
+    def test_vehicle_capacity_changed_increments(self) -> None:
+        """
+        - Given: a `Vehicle` assigned twice to a `Route` and once to another
+        - When: its `capacity` is changed
+        - Then: each `RouteEfficiency` should grow by the change times the
+            assignments of the vehicle to its route, keeping the rest of its totals
+        """
+        vehicle = VehicleFactory.create(type="SUBWAY", capacity=10)
+        other_route = RouteFactory.create()
+        RouteAssignmentFactory.create_batch(2, route=self.__route, vehicle=vehicle)
+        RouteAssignmentFactory.create(route=other_route, vehicle=vehicle)
+        RouteEfficiency.objects.filter(route=self.__route).update(
+            total_capacity=F("total_capacity") + 100,
+        )
+
+        vehicle.capacity = 40
+        vehicle.save()
+
+        assert RouteEfficiency.objects.get(route=self.__route).total_capacity == 180
+        assert RouteEfficiency.objects.get(route=other_route).total_capacity == 40
+
+    def test_vehicle_deleted(self) -> None:
+        """
+        - Given: a `Vehicle` assigned to a `Route`
+        - When: it is deleted, cascading to its assignments
+        - Then: the `RouteEfficiency` of the route should no longer include it
+        """
+        vehicle = VehicleFactory.create(type="SUBWAY", capacity=10)
+        RouteAssignmentFactory.create(route=self.__route, vehicle=vehicle)
+
+        vehicle.delete()
+
+        rollup = RouteEfficiency.objects.get(route=self.__route)
+        assert rollup.total_capacity == 0
+        assert rollup.assignment_count == 0
+
+    def test_drifted(self) -> None:
+        """
+        - Given: a `RouteEfficiency` updated behind the signals' back
+        - When: `drifted` is called
+        - Then: the pk of its route should be returned
+        """
+        RouteAssignmentFactory.create(route=self.__route)
+        RouteEfficiency.objects.filter(route=self.__route).update(assignment_count=9)
+
+        assert RouteEfficiency.objects.drifted() == [self.__route.pk]
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+
+from django import test
+from django.conf import settings
+
+# Seconds `django.setup()` may take, about ten times what it takes on a laptop
+STARTUP_BUDGET = 1.0
+# Imported by the web stack only
+DEFERRED_PACKAGES = (
+    "allauth",
+    "crispy_forms",
+    "crispy_bootstrap5",
+    "django.contrib.admin",
+    "django_redis",
+    "numpy",
+    "storages",
+)
+# Required by the production settings the batch settings build upon
+PRODUCTION_ENV = {
+    "DJANGO_SECRET_KEY": "batch",
+    "REDIS_URL": "redis://localhost:6379/0",
+    "DJANGO_AWS_ACCESS_KEY_ID": "batch",
+    "DJANGO_AWS_SECRET_ACCESS_KEY": "batch",
+    "DJANGO_AWS_STORAGE_BUCKET_NAME": "batch",
+    "DJANGO_ADMIN_URL": "admin/",
+    "DATABASE_URL": "sqlite://:memory:",
+}
+SETUP = f"""
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+seconds = time.perf_counter() - start
+from django.apps import apps
+print(json.dumps({{
+    "seconds": seconds,
+    "models": [model._meta.label for model in apps.get_models()],
+    "deferred": [name for name in {DEFERRED_PACKAGES!r} if name in sys.modules],
+}}))
+"""
+
+
+class BatchSettingsTests(test.SimpleTestCase):
+    def test_startup(self) -> None:
+        """
+        - Given: the batch settings
+        - When: Django is set up in a new interpreter
+        - Then: it should take less than the startup budget, load the transport
+            models and import none of the packages of the web stack
+        """
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", SETUP],
+            cwd=settings.BASE_DIR,
+            env=PRODUCTION_ENV
+            | os.environ
+            | {"DJANGO_SETTINGS_MODULE": "config.settings.batch"},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert process.returncode == 0, process.stderr
+        startup = json.loads(process.stdout)
+        assert startup["seconds"] < STARTUP_BUDGET, startup["seconds"]
+        assert "django_unittest_project.Vehicle" in startup["models"]
+        assert "users.User" in startup["models"]
+        assert startup["deferred"] == [], startup["deferred"]
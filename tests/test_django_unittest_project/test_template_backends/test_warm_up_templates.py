@@ -0,0 +1,75 @@
+import copy
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django import test
+from django.conf import settings
+from django.template import engines
+from django.template.loaders.filesystem import Loader as FilesystemLoader
+
+from django_unittest_project.template_backends import warm_up_templates
+
+
+def _cached_templates(*dirs: str) -> list[dict]:
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["DIRS"] = [*dirs, *templates[0]["DIRS"]]
+    templates[0]["APP_DIRS"] = False
+    templates[0]["OPTIONS"]["loaders"] = [
+        (
+            "django.template.loaders.cached.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+        ),
+    ]
+    return templates
+
+
+class WarmUpTemplatesTests(test.SimpleTestCase):
+    def test_success(self) -> None:
+        """
+        - Given: the cached template loader of the production settings
+        - When: the templates are warmed up
+        - Then: the project and allauth templates should then load without reading
+            any template file
+        """
+        with test.override_settings(TEMPLATES=_cached_templates()):
+            compiled = warm_up_templates()
+            (engine,) = engines.all()
+
+            with mock.patch.object(
+                FilesystemLoader,
+                "get_contents",
+                side_effect=AssertionError("template file read"),
+            ):
+                for template_name in (
+                    "vehicle_list.html",
+                    "vehicle_row_fragment.html",
+                    "route_detail_fragment.html",
+                    "account/login.html",
+                ):
+                    engine.get_template(template_name)
+
+        assert compiled > 0
+
+    def test_invalid_template(self) -> None:
+        """
+        - Given: a template that does not compile
+        - When: the templates are warmed up
+        - Then: it should be skipped and the other templates compiled
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, "valid.html").write_text("{{ value }}")
+            Path(directory, "invalid.html").write_text("{% load missing %}")
+            with test.override_settings(TEMPLATES=_cached_templates(directory)):
+                compiled = warm_up_templates()
+                (engine,) = engines.all()
+                (loader,) = engine.engine.template_loaders
+
+                cached = set(loader.get_template_cache)
+
+        assert "valid.html" in cached
+        assert "invalid.html" not in cached
+        assert compiled > 1
@@ -0,0 +1,165 @@
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+
+from django_unittest_project.models import MaintenanceLog
+from django_unittest_project.models import Route
+from django_unittest_project.models import RouteAssignment
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import MaintenanceLogFactory
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
+
+
+class AsyncViewsTests(test.TestCase):
+    LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+
+    def setUp(self) -> None:
+        self.__assignments: list[RouteAssignment] = RouteAssignmentFactory.create_batch(
+            3,
+        )
+        self.__route: Route = self.__assignments[0].route
+        self.__vehicle: Vehicle = self.__assignments[0].vehicle
+        self.__logs: list[MaintenanceLog] = MaintenanceLogFactory.create_batch(
+            2,
+            vehicle=self.__vehicle,
+        )
+        self.async_client.force_login(UserFactory.create())
+
+    async def test_vehicle_list(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the async vehicle list
+        - When: request is received
+        - Then: a `200` response with every `Vehicle` in the `context` should be sent
+        """
+        expected_ids = sorted(
+            assignment.vehicle.pk for assignment in self.__assignments
+        )
+
+        response = await self.async_client.get(dj_urls.reverse("async_vehicle_list"))
+
+        assert response.status_code == 200, serialize_response(response)
+        actual_ids = [vehicle.pk for vehicle in response.context["vehicles"]]
+        assert actual_ids == expected_ids, expected_x_but_got_y(
+            expected_ids,
+            actual_ids,
+        )
+        assert response.context["vehicle_count"] == 3
+
+    async def test_vehicle_list_not_modified(self) -> None:
+        """
+        - Given: a second `GET` request to the async vehicle list sending the `ETag` of
+            the first response in `If-None-Match`
+        - When: request is received
+        - Then: a `304` response should be sent without rendering any template
+        """
+        url = dj_urls.reverse("async_vehicle_list")
+        etag = (await self.async_client.get(url)).headers["ETag"]
+
+        response = await self.async_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304, serialize_response(response)
+        assert response.templates == [], response.templates
+
+    async def test_vehicle_list_pending_message(self) -> None:
+        """
+        - Given: `GET` request to the async vehicle list sending the `ETag` of the
+            previous response in `If-None-Match`, after a redirect adding a message
+        - When: request is received
+        - Then: a `200` response rendering the message should be sent
+        """
+        url = dj_urls.reverse("async_vehicle_list")
+        etag = (await self.async_client.get(url)).headers["ETag"]
+        await self.async_client.post(dj_urls.reverse("users:update"), {"name": "Ana"})
+
+        response = await self.async_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert "Information successfully updated" in response.content.decode()
+
+    async def test_route_detail(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the async route detail
+        - When: request is received
+        - Then: a `200` response rendering the `Route`'s assignments should be sent
+        """
+        url = dj_urls.reverse("async_route_detail", args=[self.__route.route_number])
+
+        response = await self.async_client.get(url)
+
+        assert response.status_code == 200, serialize_response(response)
+        assert self.__assignments[0].driver_name in response.content.decode()
+
+    async def test_vehicle_maintenance(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the async vehicle
+            maintenance page
+        - When: request is received
+        - Then: a `200` response with the `Vehicle`'s logs in the `context` should be
+            sent
+        """
+        expected_ids = sorted((log.pk for log in self.__logs), reverse=True)
+        url = dj_urls.reverse(
+            "async_vehicle_maintenance",
+            args=[self.__vehicle.vehicle_id],
+        )
+
+        response = await self.async_client.get(url)
+
+        assert response.status_code == 200, serialize_response(response)
+        actual_ids = [log.pk for log in response.context["logs"]]
+        assert actual_ids == expected_ids, expected_x_but_got_y(
+            expected_ids,
+            actual_ids,
+        )
+        assert response.context["total_cost"] == sum(log.cost for log in self.__logs)
+
+    async def test_route_efficiency(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the async route
+            efficiency report
+        - When: request is received
+        - Then: a `200` response with one row per `Route` should be sent
+        """
+        expected_routes = sorted(
+            assignment.route.pk for assignment in self.__assignments
+        )
+
+        response = await self.async_client.get(
+            dj_urls.reverse("async_route_efficiency"),
+        )
+
+        assert response.status_code == 200, serialize_response(response)
+        actual_routes = [row["route"].pk for row in response.context["route_data"]]
+        assert actual_routes == expected_routes
+
+    async def test_non_existent_vehicle(self) -> None:
+        """
+        - Given: `GET` request to the async vehicle maintenance page specifying a
+            non-existent `Vehicle`
+        - When: request is received
+        - Then: a `404` response should be sent
+        """
+        url = dj_urls.reverse("async_vehicle_maintenance", args=[1])
+
+        response = await self.async_client.get(url)
+
+        assert response.status_code == 404, serialize_response(response)
+
+    async def test_unauthenticated(self) -> None:
+        """
+        - Given: `GET` request from an unauthenticated user
+        - When: request is received
+        - Then: a `302` response should be sent redirecting the user to the login page
+        """
+        url = dj_urls.reverse("async_route_efficiency")
+        expected_location_header = f"{self.LOGIN_URL}?next={url}"
+
+        response = await test.AsyncClient().get(url)
+
+        assert response.status_code == 302, serialize_response(response)
+        assert (
+            response.headers["Location"] == expected_location_header
+        ), expected_x_but_got_y(expected_location_header, response.headers["Location"])
@@ -0,0 +1,104 @@
+import json
+
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+
+from django_unittest_project.models import RouteAssignment
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
+
+
+class ExportViewsTests(test.TestCase):
+    LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+
+    def setUp(self) -> None:
+        self.__assignments: list[RouteAssignment] = RouteAssignmentFactory.create_batch(
+            3
+        )
+
+    def test_vehicles(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the vehicles export
+        - When: request is received
+        - Then: a streamed NDJSON response with one line per `Vehicle` should be sent
+        """
+        expected_ids = sorted(
+            assignment.vehicle.pk for assignment in self.__assignments
+        )
+
+        rows = self.__get_rows("vehicle_export")
+
+        assert [row["id"] for row in rows] == expected_ids
+        assert set(rows[0]) == {
+            "id",
+            "vehicle_id",
+            "type",
+            "capacity",
+            "last_maintenance",
+        }
+
+    def test_routes(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the routes export
+        - When: request is received
+        - Then: a streamed NDJSON response with one line per `Route` should be sent
+        """
+        expected_ids = sorted(assignment.route.pk for assignment in self.__assignments)
+
+        rows = self.__get_rows("route_export")
+
+        assert [row["id"] for row in rows] == expected_ids
+
+    def test_route_assignments(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user to the route assignments
+            export
+        - When: request is received
+        - Then: a streamed NDJSON response with one line per `RouteAssignment` should
+            be sent
+        """
+        expected_rows = [
+            {
+                "id": assignment.pk,
+                "vehicle_id": assignment.vehicle_id,
+                "route_id": assignment.route_id,
+                "driver_name": assignment.driver_name,
+                "start_time": assignment.start_time.isoformat(),
+                "end_time": assignment.end_time.isoformat(),
+            }
+            for assignment in sorted(self.__assignments, key=lambda a: a.pk)
+        ]
+
+        rows = self.__get_rows("route_assignment_export")
+
+        assert rows == expected_rows, expected_x_but_got_y(expected_rows, rows)
+
+    def test_unauthenticated(self) -> None:
+        """
+        - Given: `GET` request from an unauthenticated user
+        - When: request is received
+        - Then: a `302` response should be sent redirecting the user to the login page
+        """
+        url = dj_urls.reverse("vehicle_export")
+        expected_location_header = f"{self.LOGIN_URL}?next={url}"
+
+        response = self.client.get(url)
+
+        assert response.status_code == 302, serialize_response(response)
+        assert (
+            response.headers["Location"] == expected_location_header
+        ), expected_x_but_got_y(expected_location_header, response.headers["Location"])
+
+    def __get_rows(self, url_name: str) -> list[dict]:
+        self.client.force_login(UserFactory.create())
+
+        response = self.client.get(dj_urls.reverse(url_name))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
@@ -0,0 +1,65 @@
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+
+from django_unittest_project.models import MaintenanceLog
+from tests.test_django_unittest_project.factories import MaintenanceLogFactory
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
+
+
+class MaintenanceLogDescriptionViewTests(test.TestCase):
+    LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+
+    def setUp(self) -> None:
+        self.__log: MaintenanceLog = MaintenanceLogFactory.create()
+
+    def test_success(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user specifying an existent
+            `MaintenanceLog`
+        - When: request is received
+        - Then: a `200` response with the full description should be sent
+        """
+        self.client.force_login(UserFactory.create())
+
+        response = self.client.get(self.__get_url_from_log(self.__log))
+
+        assert response.status_code == 200, serialize_response(response)
+        assert response.json() == {"description": self.__log.description}
+
+    def test_unauthenticated(self) -> None:
+        """
+        - Given: `GET` request from an unauthenticated user
+        - When: request is received
+        - Then: a `302` response should be sent redirecting the user to the login page
+        """
+        expected_location_header = (
+            f"{self.LOGIN_URL}?next={self.__get_url_from_log(self.__log)}"
+        )
+
+        response = self.client.get(self.__get_url_from_log(self.__log))
+
+        assert response.status_code == 302, serialize_response(response)
+        assert (
+            response.headers["Location"] == expected_location_header
+        ), expected_x_but_got_y(expected_location_header, response.headers["Location"])
+
+    def test_non_existent_log(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user specifying a non existent
+            `MaintenanceLog`
+        - When: request is received
+        - Then: a `404` error response should be sent
+        """
+        self.client.force_login(UserFactory.create())
+        url = self.__get_url_from_log(self.__log)
+        self.__log.delete()
+
+        response = self.client.get(url)
+
+        assert response.status_code == 404, serialize_response(response)
+
+    def __get_url_from_log(self, log: "MaintenanceLog") -> str:
+        return dj_urls.reverse("maintenance_log_description", kwargs={"pk": log.pk})
@@ -0,0 +1,139 @@
+import datetime as dt
+
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
+
+
+class OccupancyTimelineViewTests(test.TestCase):
+    URL = dj_urls.reverse_lazy("occupancy_timeline")
+    LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+
+    def setUp(self) -> None:
+        self.__vehicle: Vehicle = VehicleFactory.create(type="BUS", capacity=50)
+        RouteAssignmentFactory.create(
+            vehicle=self.__vehicle,
+            start_time=dt.time(8),
+            end_time=dt.time(8, 30),
+        )
+        RouteAssignmentFactory.create(
+            vehicle=VehicleFactory.create(type="BUS", capacity=20),
+            start_time=dt.time(8, 15),
+            end_time=dt.time(9),
+        )
+        self.client.force_login(UserFactory.create())
+
+    def test_per_minute(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user without a bucket
+        - When: request is received
+        - Then: a `200` response with the capacity on the road at each minute of the
+            day should be sent, shifts ending at the minute they end
+        """
+        response = self.client.get(self.URL)
+
+        assert response.status_code == 200, serialize_response(response)
+        data = response.json()
+        capacity = data["capacity"]
+        assert data["bucket_minutes"] == 1
+        assert len(capacity) == 24 * 60
+        assert capacity[8 * 60 - 1] == 0
+        assert capacity[8 * 60] == 50
+        assert capacity[8 * 60 + 15] == 70
+        assert capacity[8 * 60 + 30] == 20
+        assert capacity[9 * 60 - 1] == 20
+        assert capacity[9 * 60] == 0
+        assert sum(capacity) == 50 * 30 + 20 * 45
+
+    def test_bucket(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user with a bucket of an hour
+        - When: request is received
+        - Then: a `200` response with the peak capacity of each hour should be sent
+        """
+        expected_capacity = [0] * 24
+        expected_capacity[8] = 70
+
+        response = self.client.get(self.URL, {"bucket": 60})
+
+        assert response.status_code == 200, serialize_response(response)
+        capacity = response.json()["capacity"]
+        assert capacity == expected_capacity, expected_x_but_got_y(
+            expected_capacity,
+            capacity,
+        )
+
+    def test_cached(self) -> None:
+        """
+        - Given: a second `GET` request from an authenticated user
+        - When: request is received
+        - Then: the cached timeline should be served without querying the transport
+            tables, for any bucket
+        """
+        first_response = self.client.get(self.URL, {"bucket": 60})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, {"bucket": 30})
+
+        transport_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "django_unittest_project_" in query["sql"]
+        ]
+        assert response.status_code == 200, serialize_response(response)
+        assert max(response.json()["capacity"]) == max(
+            first_response.json()["capacity"],
+        )
+        assert transport_queries == [], transport_queries
+
+    def test_invalidated_on_capacity_change(self) -> None:
+        """
+        - Given: a `Vehicle` whose capacity change was committed after the timeline
+            was cached
+        - When: `GET` request is received
+        - Then: the timeline should reflect the new capacity
+        """
+        self.client.get(self.URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.__vehicle.capacity = 10
+            self.__vehicle.save()
+
+        response = self.client.get(self.URL)
+
+        assert response.json()["capacity"][8 * 60] == 10
+
+    def test_invalid_bucket(self) -> None:
+        """
+        - Given: `GET` requests with a bucket not dividing the day or not an integer
+        - When: requests are received
+        - Then: `400` responses should be sent
+        """
+        for bucket in ["7", "0", "x"]:
+            response = self.client.get(self.URL, {"bucket": bucket})
+
+            assert response.status_code == 400, serialize_response(response)
+
+    def test_unauthenticated(self) -> None:
+        """
+        - Given: `GET` request from an unauthenticated user
+        - When: request is received
+        - Then: a `302` response should be sent redirecting the user to the login page
+        """
+        self.client.logout()
+        expected_location_header = f"{self.LOGIN_URL}?next={self.URL}"
+
+        response = self.client.get(self.URL)
+
+        assert response.status_code == 302, serialize_response(response)
+        assert (
+            response.headers["Location"] == expected_location_header
+        ), expected_x_but_got_y(expected_location_header, response.headers["Location"])
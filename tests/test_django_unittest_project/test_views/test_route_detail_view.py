@@ -2,20 +2,26 @@ from typing import cast
 
 from django import test, urls as dj_urls
 from django.conf import settings
+from django.db import connection
 from django.db import models
+from django.test.utils import CaptureQueriesContext
 
 from django_unittest_project.models import Route
 from django_unittest_project.models import RouteAssignment
+from django_unittest_project.models import Vehicle
 from tests.test_django_unittest_project.factories import (
     RouteAssignmentFactory,
     RouteFactory,
     UserFactory,
+    VehicleFactory,
 )
 from tests.utils import expected_x_but_got_y, serialize_response
 
 
 class RouteDetailTests(test.TestCase):
     LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+    # session, user, route and its assignments, plus the request's savepoint pair
+    QUERY_BUDGET = 6
 
     def setUp(self) -> None:
         self.__route: Route = RouteFactory.create()
@@ -49,6 +55,128 @@ class RouteDetailTests(test.TestCase):
             == RouteAssignment
         )
 
+    def test_query_budget(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user specifying a `Route` with
+            more than 1000 assignments
+        - When: request is received
+        - Then: the response should be rendered within the query budget
+        """
+        self.client.force_login(UserFactory.create())
+        vehicles = Vehicle.objects.bulk_create(VehicleFactory.build_batch(1001))
+        RouteAssignment.objects.bulk_create(
+            RouteAssignmentFactory.build(route=self.__route, vehicle=vehicle)
+            for vehicle in vehicles
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.__get_url_from_route(self.__route))
+
+        assert response.status_code == 200, serialize_response(response)
+        assert len(queries) <= self.QUERY_BUDGET, expected_x_but_got_y(
+            self.QUERY_BUDGET, len(queries),
+        )
+
+    def test_cached(self) -> None:
+        """
+        - Given: a second `GET` request from an authenticated user specifying the same
+            `Route`
+        - When: request is received
+        - Then: the cached route detail should be served without querying the
+            transport tables
+        """
+        self.client.force_login(UserFactory.create())
+        RouteAssignmentFactory.create_batch(3, route=self.__route)
+        first_response = self.client.get(self.__get_url_from_route(self.__route))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.__get_url_from_route(self.__route))
+
+        transport_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "django_unittest_project_" in query["sql"]
+        ]
+        assert response.status_code == 200, serialize_response(response)
+        assert response.content == first_response.content
+        assert transport_queries == [], transport_queries
+
+    def test_invalidated_on_change(self) -> None:
+        """
+        - Given: a `RouteAssignment` committed to a `Route` whose detail is cached
+        - When: `GET` request specifying the `Route` is received
+        - Then: the new assignment should be rendered
+        """
+        self.client.force_login(UserFactory.create())
+        self.client.get(self.__get_url_from_route(self.__route))
+        with self.captureOnCommitCallbacks(execute=True):
+            assignment = RouteAssignmentFactory.create(
+                route=self.__route,
+                driver_name="New Driver",
+            )
+
+        response = self.client.get(self.__get_url_from_route(self.__route))
+
+        assert response.status_code == 200, serialize_response(response)
+        assert assignment.driver_name in response.content.decode()
+
+    def test_invalidated_on_commit(self) -> None:
+        """
+        - Given: a `RouteAssignment` added to a `Route` whose detail is cached, in a
+            transaction not committed yet
+        - When: `GET` request specifying the `Route` is received
+        - Then: the cached detail should still be served, so no page rendered from
+            uncommitted rows can be cached under a version outliving them
+        """
+        self.client.force_login(UserFactory.create())
+        url = self.__get_url_from_route(self.__route)
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            RouteAssignmentFactory.create(route=self.__route, driver_name="New Driver")
+            response = self.client.get(url)
+
+        assert "New Driver" not in response.content.decode()
+        assert callbacks
+
+    def test_not_modified(self) -> None:
+        """
+        - Given: a second `GET` request from an authenticated user specifying the same
+            `Route` and sending the `ETag` of the first response in `If-None-Match`
+        - When: request is received
+        - Then: a `304` response should be sent without rendering any template
+        """
+        self.client.force_login(UserFactory.create())
+        RouteAssignmentFactory.create_batch(3, route=self.__route)
+        url = self.__get_url_from_route(self.__route)
+        etag = self.client.get(url).headers["ETag"]
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304, serialize_response(response)
+        assert response.templates == [], response.templates
+
+    def test_modified_after_change(self) -> None:
+        """
+        - Given: a `RouteAssignment` committed to a `Route` after its detail was
+            served with an `ETag`
+        - When: `GET` request sending that `ETag` in `If-None-Match` is received
+        - Then: a `200` response rendering the new assignment should be sent
+        """
+        self.client.force_login(UserFactory.create())
+        url = self.__get_url_from_route(self.__route)
+        etag = self.client.get(url).headers["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            assignment = RouteAssignmentFactory.create(
+                route=self.__route,
+                driver_name="New Driver",
+            )
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert assignment.driver_name in response.content.decode()
+
     def test_unauthenticated(self) -> None:
         """
         - Given: `GET` request from an unauthenticated user
@@ -3,7 +3,9 @@ from typing import Any
 
 from django import test, urls as dj_urls
 from django.conf import settings
+from django.db import connection
 from django.db import models
+from django.test.utils import CaptureQueriesContext
 
 from django_unittest_project.models import Route
 from tests.test_django_unittest_project.factories import (
@@ -29,14 +31,41 @@ class RouteEfficiencyViewTests(test.TestCase):
 
         response = self.client.get(self.URL)
 
+        actual_route_data = list(response.context["route_data"])
+
         assert response.status_code == 200
-        assert (
-            response.context["route_data"] == expected_route_data
-        ), expected_x_but_got_y(expected_route_data, response.context["route_data"])
+        assert actual_route_data == expected_route_data, expected_x_but_got_y(
+            expected_route_data, actual_route_data,
+        )
         assert "route_efficiency.html" in [
             template.name for template in response.templates
         ]
 
+    def test_query_count_independent_of_route_count(self) -> None:
+        """
+        - Given: `GET` requests from an authenticated user before and after more
+            `Route`s are assigned
+        - When: requests are received
+        - Then: both requests should issue the same number of queries
+        """
+        self.client.force_login(UserFactory.create())
+        RouteAssignmentFactory.create_batch(2)
+        # Caches the session and the user, both requests then find them there
+        self.client.get(self.URL)
+
+        with CaptureQueriesContext(connection) as few_routes_queries:
+            self.client.get(self.URL)
+
+        RouteAssignmentFactory.create_batch(20)
+
+        with CaptureQueriesContext(connection) as many_routes_queries:
+            response = self.client.get(self.URL)
+
+        assert response.status_code == 200
+        assert len(many_routes_queries) == len(few_routes_queries), (
+            expected_x_but_got_y(len(few_routes_queries), len(many_routes_queries))
+        )
+
     def test_unauthenticated(self) -> None:
         """
         - Given: `GET` request from an unauthenticated user
@@ -55,7 +84,9 @@ class RouteEfficiencyViewTests(test.TestCase):
     def __get_expected_route_data(self) -> "Mapping[str, Any]":
         return [
             self.__serialize_route(route)
-            for route in Route.objects.prefetch_related("routeassignment_set").all()
+            for route in Route.objects.prefetch_related("routeassignment_set").order_by(
+                "pk",
+            )
         ]
 
     def __serialize_route(self, route: "Route") -> "Mapping[str, Any]":
@@ -0,0 +1,89 @@
+import datetime as dt
+import json
+
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+
+from django_unittest_project.models import RouteAssignment
+from tests.test_django_unittest_project.factories import RouteAssignmentFactory
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
+
+
+class ScheduleConflictsViewTests(test.TestCase):
+    URL = dj_urls.reverse_lazy("schedule_conflicts")
+    LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+
+    def test_success(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user, with overlapping
+            `RouteAssignment`s of a vehicle and of a driver
+        - When: request is received
+        - Then: a streamed NDJSON response with one line per overlapping pair should
+            be sent
+        """
+        vehicle = VehicleFactory.create()
+        morning = self.__assign(vehicle, "Ana", dt.time(8), dt.time(12))
+        # Back to back with `morning`, not a conflict
+        afternoon = self.__assign(vehicle, "Ana", dt.time(12), dt.time(16))
+        overlap = self.__assign(vehicle, "Lee", dt.time(11), dt.time(13))
+        other_vehicle = self.__assign(
+            VehicleFactory.create(),
+            "Ana",
+            dt.time(15),
+            dt.time(17),
+        )
+        self.__assign(VehicleFactory.create(), "Sam", dt.time(8), dt.time(20))
+        expected_rows = [
+            self.__conflict("vehicle", vehicle.pk, morning, overlap, "11:00-12:00"),
+            self.__conflict("vehicle", vehicle.pk, overlap, afternoon, "12:00-13:00"),
+            self.__conflict("driver", "Ana", afternoon, other_vehicle, "15:00-16:00"),
+        ]
+        self.client.force_login(UserFactory.create())
+
+        response = self.client.get(self.URL)
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        content = b"".join(response.streaming_content).decode()
+        rows = [json.loads(line) for line in content.splitlines()]
+        assert rows == expected_rows, expected_x_but_got_y(expected_rows, rows)
+
+    def test_unauthenticated(self) -> None:
+        """
+        - Given: `GET` request from an unauthenticated user
+        - When: request is received
+        - Then: a `302` response should be sent redirecting the user to the login page
+        """
+        expected_location_header = f"{self.LOGIN_URL}?next={self.URL}"
+
+        response = self.client.get(self.URL)
+
+        assert response.status_code == 302, serialize_response(response)
+        assert (
+            response.headers["Location"] == expected_location_header
+        ), expected_x_but_got_y(expected_location_header, response.headers["Location"])
+
+    @staticmethod
+    def __assign(vehicle, driver_name, start_time, end_time) -> RouteAssignment:
+        return RouteAssignmentFactory.create(
+            vehicle=vehicle,
+            driver_name=driver_name,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    @staticmethod
+    def __conflict(kind, key, first, second, overlap) -> dict:
+        overlap_start, overlap_end = overlap.split("-")
+        return {
+            "kind": kind,
+            "key": key,
+            "first_id": first.pk,
+            "second_id": second.pk,
+            "overlap_start": f"{overlap_start}:00",
+            "overlap_end": f"{overlap_end}:00",
+        }
@@ -1,12 +1,16 @@
 from typing import cast
 
-from django import test, urls as dj_urls
-from django.db import models
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from django_unittest_project.models import Vehicle
-from tests.test_django_unittest_project.factories import UserFactory, VehicleFactory
-from tests.utils import expected_x_but_got_y, serialize_response
-from django.conf import settings
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
 
 
 class VehicleListViewTests(test.TestCase):
@@ -27,14 +31,194 @@ class VehicleListViewTests(test.TestCase):
 
         response = self.client.get(self.URL)
 
-        actual_vehicles_ids = cast(
-            "models.QuerySet", response.context["vehicles"]
-        ).values_list("pk", flat=True)
+        actual_vehicles_ids = [vehicle.pk for vehicle in response.context["vehicles"]]
 
         assert response.status_code == 200
         assert "vehicle_list.html" in [template.name for template in response.templates]
-        assert cast("models.QuerySet", response.context["vehicles"]).model == Vehicle
+        assert all(
+            isinstance(vehicle, Vehicle) for vehicle in response.context["vehicles"]
+        )
         assert set(actual_vehicles_ids) == expected_vehicles_ids
+        assert response.context["vehicle_count"] == 3
+        assert not response.context["page"].has_next
+
+    def test_pagination(self) -> None:
+        """
+        - Given: `GET` requests from an authenticated user following the `next_cursor`
+            of each page
+        - When: requests are received
+        - Then: every `Vehicle` should be listed exactly once, in `id` order
+        """
+        expected_vehicles_ids = sorted(
+            cast("Vehicle", vehicle).pk for vehicle in VehicleFactory.create_batch(5)
+        )
+        self.client.force_login(UserFactory.create())
+        actual_vehicles_ids: list[int] = []
+        data = {"page_size": 2}
+
+        while True:
+            response = self.client.get(self.URL, data)
+            assert response.status_code == 200, serialize_response(response)
+            actual_vehicles_ids += [
+                vehicle.pk for vehicle in response.context["vehicles"]
+            ]
+            if not response.context["page"].has_next:
+                break
+            data["cursor"] = response.context["page"].next_cursor
+
+        assert actual_vehicles_ids == expected_vehicles_ids, expected_x_but_got_y(
+            expected_vehicles_ids, actual_vehicles_ids,
+        )
+
+    def test_rows_cached(self) -> None:
+        """
+        - Given: a second `GET` request from an authenticated user for the same page
+        - When: request is received
+        - Then: every row should be served from the cache without rendering the row
+            template
+        """
+        VehicleFactory.create_batch(3)
+        self.client.force_login(UserFactory.create())
+        first_response = self.client.get(self.URL)
+
+        response = self.client.get(self.URL)
+
+        rendered_rows = [
+            template.name
+            for template in response.templates
+            if template.name == "vehicle_row_fragment.html"
+        ]
+        assert response.status_code == 200, serialize_response(response)
+        assert response.content == first_response.content
+        assert rendered_rows == [], rendered_rows
+
+    def test_changed_row_rendered(self) -> None:
+        """
+        - Given: a `Vehicle` edited after its row was cached
+        - When: `GET` request from an authenticated user is received
+        - Then: only the edited row should be rendered again, with the new values
+        """
+        vehicle, *_ = VehicleFactory.create_batch(3)
+        self.client.force_login(UserFactory.create())
+        self.client.get(self.URL)
+        vehicle.capacity = 12345
+        vehicle.save()
+
+        response = self.client.get(self.URL)
+
+        rendered_rows = [
+            template.name
+            for template in response.templates
+            if template.name == "vehicle_row_fragment.html"
+        ]
+        assert response.status_code == 200, serialize_response(response)
+        assert rendered_rows == ["vehicle_row_fragment.html"], rendered_rows
+        assert "<td>12345</td>" in response.content.decode()
+
+    def test_not_modified(self) -> None:
+        """
+        - Given: a second `GET` request from an authenticated user sending the `ETag`
+            of the first response in `If-None-Match`
+        - When: request is received
+        - Then: a `304` response should be sent without querying the transport tables
+            nor rendering any template
+        """
+        VehicleFactory.create_batch(3)
+        self.client.force_login(UserFactory.create())
+        etag = self.client.get(self.URL).headers["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, headers={"If-None-Match": etag})
+
+        transport_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "django_unittest_project_" in query["sql"]
+        ]
+        assert response.status_code == 304, serialize_response(response)
+        assert response.templates == [], response.templates
+        assert transport_queries == [], transport_queries
+
+    def test_modified_after_change(self) -> None:
+        """
+        - Given: a `Vehicle` edit committed after the page was served with an `ETag`
+        - When: `GET` request from an authenticated user sending that `ETag` in
+            `If-None-Match` is received
+        - Then: a `200` response with a new `ETag` and the new values should be sent
+        """
+        vehicle, *_ = VehicleFactory.create_batch(3)
+        self.client.force_login(UserFactory.create())
+        etag = self.client.get(self.URL).headers["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            vehicle.capacity = 12345
+            vehicle.save()
+
+        response = self.client.get(self.URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert response.headers["ETag"] != etag
+        assert "<td>12345</td>" in response.content.decode()
+
+    def test_modified_with_pending_message(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user sending the `ETag` of the
+            previous response in `If-None-Match`, after a redirect adding a message
+        - When: request is received
+        - Then: a `200` response rendering the message should be sent, and the
+            message not be kept for a later page
+        """
+        self.client.force_login(UserFactory.create())
+        etag = self.client.get(self.URL).headers["ETag"]
+        self.client.post(dj_urls.reverse("users:update"), {"name": "Ana"})
+
+        response = self.client.get(self.URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert "Information successfully updated" in response.content.decode()
+        response = self.client.get(self.URL, headers={"If-None-Match": etag})
+        assert response.status_code == 304, serialize_response(response)
+
+    def test_etag_per_user(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user sending the `ETag` served to
+            another user in `If-None-Match`
+        - When: request is received
+        - Then: a `200` response should be sent, the page shows who is logged in
+        """
+        VehicleFactory.create_batch(3)
+        self.client.force_login(UserFactory.create())
+        etag = self.client.get(self.URL).headers["ETag"]
+        self.client.force_login(UserFactory.create(email="other_user@example.com"))
+
+        response = self.client.get(self.URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200, serialize_response(response)
+
+    def test_page_size_limit(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user with a `page_size` above the
+            maximum
+        - When: request is received
+        - Then: the page size should be capped to the maximum
+        """
+        self.client.force_login(UserFactory.create())
+
+        response = self.client.get(self.URL, {"page_size": 10_000})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert response.context["page"].page_size == 500
+
+    def test_invalid_cursor(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user with a malformed `cursor`
+        - When: request is received
+        - Then: a `400` error response should be sent
+        """
+        self.client.force_login(UserFactory.create())
+
+        response = self.client.get(self.URL, {"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400, serialize_response(response)
 
     def test_unauthenticated(self) -> None:
         """
@@ -0,0 +1,249 @@
+import datetime as dt
+import json
+from decimal import Decimal
+
+from django import test
+from django import urls as dj_urls
+from django.conf import settings
+
+from django_unittest_project.models import MaintenanceLog
+from django_unittest_project.models import Vehicle
+from tests.test_django_unittest_project.factories import UserFactory
+from tests.test_django_unittest_project.factories import VehicleFactory
+from tests.utils import expected_x_but_got_y
+from tests.utils import serialize_response
+
+
+def _make_fake_row(
+    vehicle: "Vehicle",
+    maintenance_date: dt.date | None = None,
+) -> dict[str, str]:
+    maintenance_date = dt.date.today() if maintenance_date is None else maintenance_date
+    return {
+        "vehicle_id": vehicle.vehicle_id,
+        "maintenance_date": maintenance_date.isoformat(),
+        "description": "test maintenance",
+        "cost": "100.00",
+    }
+
+
+class VehicleMaintenanceBulkViewTests(test.TestCase):
+    URL = dj_urls.reverse_lazy("vehicle_maintenance_bulk")
+    LOGIN_URL = dj_urls.reverse_lazy(settings.LOGIN_URL)
+
+    def setUp(self) -> None:
+        self.__vehicles: list[Vehicle] = VehicleFactory.create_batch(
+            2,
+            last_maintenance=dt.date(2000, 1, 1),
+        )
+
+    def test_success(self) -> None:
+        """
+        - Given: `POST` request from a staff user with a JSON array of valid logs for
+            many `Vehicle`s
+        - When: request is received
+        - Then: a `201` response should be sent, every `MaintenanceLog` should be
+            created and each `Vehicle.last_maintenance` set to its latest log
+        """
+        first, second = self.__vehicles
+        latest = dt.date(2024, 5, 1)
+        rows = [
+            _make_fake_row(first, dt.date(2024, 1, 1)),
+            _make_fake_row(first, latest),
+            _make_fake_row(second, dt.date(2024, 3, 1)),
+        ]
+        previous_updated_at = first.updated_at
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(self.URL, rows, content_type="application/json")
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert response.status_code == 201, serialize_response(response)
+        assert response.json() == {"created": 3, "errors": []}
+        assert first.updated_at > previous_updated_at
+        assert MaintenanceLog.objects.count() == 3
+        assert first.last_maintenance == latest
+        assert second.last_maintenance == dt.date(2024, 3, 1)
+        assert first.maintenance_cost_total == Decimal("200.00")
+        assert first.maintenance_log_count == 2
+        assert second.maintenance_log_count == 1
+
+    def test_ndjson(self) -> None:
+        """
+        - Given: `POST` request from a staff user with an NDJSON body
+        - When: request is received
+        - Then: a `201` response should be sent and a `MaintenanceLog` created per line
+        """
+        body = "\n".join(json.dumps(_make_fake_row(v)) for v in self.__vehicles)
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(
+            self.URL,
+            body,
+            content_type="application/x-ndjson",
+        )
+
+        assert response.status_code == 201, serialize_response(response)
+        assert MaintenanceLog.objects.count() == 2
+        assert MaintenanceLog.objects.first().cost == Decimal("100.00")
+
+    def test_ndjson_blank_lines(self) -> None:
+        """
+        - Given: `POST` request from a staff user with an NDJSON body where blank
+            lines precede an invalid line
+        - When: request is received
+        - Then: a `201` response should be sent and the error of the invalid line
+            reported at its line number, counting the blank lines
+        """
+        row = json.dumps(_make_fake_row(self.__vehicles[0]))
+        body = f"{row}\n\n  \nnot json\n{row}"
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(
+            self.URL,
+            body,
+            content_type="application/x-ndjson",
+        )
+
+        assert response.status_code == 201, serialize_response(response)
+        assert response.json() == {
+            "created": 2,
+            "errors": [{"index": 3, "error": "Invalid row"}],
+        }
+        assert MaintenanceLog.objects.count() == 2
+
+    @test.override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=1024)
+    def test_over_upload_limit(self) -> None:
+        """
+        - Given: `POST` request from a staff user with a JSON array of valid logs
+            larger than `DATA_UPLOAD_MAX_MEMORY_SIZE`
+        - When: request is received
+        - Then: a `201` response should be sent and every `MaintenanceLog` created
+        """
+        rows = [_make_fake_row(self.__vehicles[i % 2]) for i in range(50)]
+        body = json.dumps(rows)
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(self.URL, body, content_type="application/json")
+
+        assert len(body) > settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        assert response.status_code == 201, serialize_response(response)
+        assert response.json() == {"created": 50, "errors": []}
+        assert MaintenanceLog.objects.count() == 50
+
+    def test_partial_errors(self) -> None:
+        """
+        - Given: `POST` request from a staff user where some logs are invalid
+        - When: request is received
+        - Then: a `201` response should be sent with the errors of the invalid rows
+            and the valid rows should still be created
+        """
+        valid_row = _make_fake_row(self.__vehicles[0])
+        missing_cost_row = _make_fake_row(self.__vehicles[0])
+        missing_cost_row.pop("cost")
+        unknown_vehicle_row = {**valid_row, "vehicle_id": "unknown"}
+        invalid_cost_row = {**valid_row, "cost": "not a number"}
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(
+            self.URL,
+            [missing_cost_row, valid_row, unknown_vehicle_row, invalid_cost_row],
+            content_type="application/json",
+        )
+
+        errors = response.json()["errors"]
+        assert response.status_code == 201, serialize_response(response)
+        assert response.json()["created"] == 1
+        assert [error["index"] for error in errors] == [0, 2, 3], errors
+        assert errors[0]["error"] == "Missing required field: 'cost'"
+        assert errors[1]["error"] == "Unknown vehicle: 'unknown'"
+        assert MaintenanceLog.objects.count() == 1
+
+    def test_non_staff(self) -> None:
+        """
+        - Given: `POST` request from a non staff user
+        - When: request is received
+        - Then: a `403` error response should be sent and no `MaintenanceLog` created
+        """
+        self.client.force_login(UserFactory.create(is_staff=False))
+
+        response = self.client.post(
+            self.URL,
+            [_make_fake_row(self.__vehicles[0])],
+            content_type="application/json",
+        )
+
+        assert response.status_code == 403, serialize_response(response)
+        assert MaintenanceLog.objects.count() == 0
+
+    def test_invalid_json(self) -> None:
+        """
+        - Given: `POST` request from a staff user with an invalid JSON body
+        - When: request is received
+        - Then: a `400` error response should be sent with the appropriate message
+        """
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(
+            self.URL,
+            "[not json",
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400, serialize_response(response)
+        assert response.json() == {"error": "Invalid JSON"}
+
+    def test_invalid_json_after_rows(self) -> None:
+        """
+        - Given: `POST` request from a staff user with a JSON array whose valid logs
+            are followed by invalid JSON
+        - When: request is received
+        - Then: a `400` error response should be sent and none of the logs decoded
+            before the error should be created
+        """
+        row = json.dumps(_make_fake_row(self.__vehicles[0]))
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(
+            self.URL,
+            f"[{row}, {row}, not json]",
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400, serialize_response(response)
+        assert response.json() == {"error": "Invalid JSON"}
+        assert MaintenanceLog.objects.count() == 0
+
+    def test_not_array(self) -> None:
+        """
+        - Given: `POST` request from a staff user with a JSON object body
+        - When: request is received
+        - Then: a `400` error response should be sent with the appropriate message
+        """
+        self.client.force_login(UserFactory.create(is_staff=True))
+
+        response = self.client.post(
+            self.URL,
+            _make_fake_row(self.__vehicles[0]),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400, serialize_response(response)
+        assert response.json() == {"error": "Expected a JSON array"}
+        assert MaintenanceLog.objects.count() == 0
+
+    def test_unauthenticated(self) -> None:
+        """
+        - Given: `POST` request from an unauthenticated user
+        - When: request is received
+        - Then: a `302` response should be sent redirecting the user to the login page
+        """
+        expected_location_header = f"{self.LOGIN_URL}?next={self.URL}"
+
+        response = self.client.post(self.URL, [], content_type="application/json")
+
+        assert response.status_code == 302, serialize_response(response)
+        assert (
+            response.headers["Location"] == expected_location_header
+        ), expected_x_but_got_y(expected_location_header, response.headers["Location"])
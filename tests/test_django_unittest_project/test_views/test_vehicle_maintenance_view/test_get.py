@@ -1,4 +1,4 @@
-from typing import cast
+import datetime as dt
 
 from django import test, urls as dj_urls
 from django.conf import settings
@@ -41,10 +41,7 @@ class GetTests(test.TestCase):
 
         response = self.client.get(self.__get_url_from_vehicle(self.__vehicle))
 
-        actual_logs_ids = cast("models.QuerySet", response.context["logs"]).values_list(
-            "pk",
-            flat=True,
-        )
+        actual_logs_ids = [log.pk for log in response.context["logs"]]
 
         assert response.status_code == 200
         assert str(response.headers["Content-Type"]).startswith("text/html")
@@ -53,9 +50,105 @@ class GetTests(test.TestCase):
             template.name for template in response.templates
         ]
         assert set(actual_logs_ids) == expected_maintenance_logs_ids
-        assert cast("models.QuerySet", response.context["logs"]).model == MaintenanceLog
+        assert all(
+            isinstance(log, MaintenanceLog) for log in response.context["logs"]
+        )
         assert response.context["total_cost"] == expected_total_cost
 
+    def test_pagination(self) -> None:
+        """
+        - Given: `GET` requests from an authenticated user following the `next_cursor`
+            of each page of the maintenance history
+        - When: requests are received
+        - Then: every `MaintenanceLog` should be listed exactly once, latest first,
+            and `total_cost` should cover every log regardless of the page
+        """
+        self.client.force_login(UserFactory.create())
+        for days in (3, 1, 1, 2):
+            MaintenanceLogFactory.create(
+                vehicle=self.__vehicle,
+                maintenance_date=dt.date(2024, 1, 1) + dt.timedelta(days),
+            )
+        expected_maintenance_logs = MaintenanceLog.objects.filter(
+            vehicle=self.__vehicle,
+        ).order_by("-maintenance_date", "-id")
+        expected_logs_ids = list(expected_maintenance_logs.values_list("pk", flat=True))
+        expected_total_cost = expected_maintenance_logs.aggregate(models.Sum("cost"))[
+            "cost__sum"
+        ]
+        actual_logs_ids: list[int] = []
+        data = {"page_size": 3}
+
+        while True:
+            response = self.client.get(
+                self.__get_url_from_vehicle(self.__vehicle),
+                data,
+            )
+            assert response.status_code == 200, serialize_response(response)
+            assert response.context["total_cost"] == expected_total_cost
+            actual_logs_ids += [log.pk for log in response.context["logs"]]
+            if not response.context["page"].has_next:
+                break
+            data["cursor"] = response.context["page"].next_cursor
+
+        assert actual_logs_ids == expected_logs_ids, expected_x_but_got_y(
+            expected_logs_ids, actual_logs_ids,
+        )
+
+    def test_description_deferred(self) -> None:
+        """
+        - Given: `GET` request from an authenticated user specifying a `Vehicle` with
+            `MaintenanceLog`s
+        - When: request is received
+        - Then: the descriptions should neither be loaded nor rendered
+        """
+        self.client.force_login(UserFactory.create())
+        logs = MaintenanceLogFactory.create_batch(3, vehicle=self.__vehicle)
+
+        response = self.client.get(self.__get_url_from_vehicle(self.__vehicle))
+
+        assert response.status_code == 200, serialize_response(response)
+        assert all(
+            "description" in log.get_deferred_fields()
+            for log in response.context["logs"]
+        )
+        for log in logs:
+            assert log.description not in response.content.decode()
+
+    def test_not_modified(self) -> None:
+        """
+        - Given: a second `GET` request from an authenticated user specifying the same
+            `Vehicle` and sending the `ETag` of the first response in `If-None-Match`
+        - When: request is received
+        - Then: a `304` response should be sent without rendering any template
+        """
+        self.client.force_login(UserFactory.create())
+        MaintenanceLogFactory.create_batch(3, vehicle=self.__vehicle)
+        url = self.__get_url_from_vehicle(self.__vehicle)
+        etag = self.client.get(url).headers["ETag"]
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304, serialize_response(response)
+        assert response.templates == [], response.templates
+
+    def test_modified_after_new_log(self) -> None:
+        """
+        - Given: a `MaintenanceLog` added to a `Vehicle` after its maintenance page was
+            served with an `ETag`
+        - When: `GET` request sending that `ETag` in `If-None-Match` is received
+        - Then: a `200` response listing the new log should be sent
+        """
+        self.client.force_login(UserFactory.create())
+        url = self.__get_url_from_vehicle(self.__vehicle)
+        etag = self.client.get(url).headers["ETag"]
+        log = MaintenanceLogFactory.create(vehicle=self.__vehicle)
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200, serialize_response(response)
+        assert [log.pk for log in response.context["logs"]] == [log.pk]
+
     def test_unauthenticated(self) -> None:
         """
         - Given: `GET` request from an unauthenticated user
@@ -145,6 +145,8 @@ class PostTests(test.TestCase):
         assert maintenance_log.description == arrangement.expected_description
         assert maintenance_log.cost == arrangement.expected_cost
         assert self.__vehicle.last_maintenance == maintenance_log.maintenance_date
+        assert self.__vehicle.maintenance_cost_total == arrangement.expected_cost
+        assert self.__vehicle.maintenance_log_count == 1
 
     def test_unauthenticated(self) -> None:
         """